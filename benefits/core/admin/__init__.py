@@ -3,7 +3,7 @@ The core application: Admin interface configuration.
 """
 
 from .common import PemDataAdmin
-from .enrollment import EnrollmentEventAdmin, SortableEnrollmentFlowAdmin
+from .enrollment import EnrollmentEventAdmin, EnrollmentRollupAdmin, SortableEnrollmentFlowAdmin
 from .mixins import (
     ProdReadOnlyPermissionMixin,
     StaffPermissionMixin,
@@ -30,6 +30,7 @@ __all__ = [
     "is_staff_member_or_superuser",
     "TransitAgencyAdmin",
     "EnrollmentEventAdmin",
+    "EnrollmentRollupAdmin",
     "SortableEnrollmentFlowAdmin",
     "GOOGLE_USER_INFO_URL",
     "GroupAdmin",
@@ -0,0 +1,112 @@
+from django.contrib.admin.options import IncorrectLookupParameters
+from django.contrib.admin.views.main import ChangeList
+from django.core.exceptions import ValidationError
+from django.db import connection
+from django.db.models import Q
+
+# query parameters with the position of the last row of the previous page, or the first row of the next page
+AFTER_VAR = "after"
+BEFORE_VAR = "before"
+
+# above this many rows (by PostgreSQL's statistics), an unfiltered list shows an estimated count instead of counting
+COUNT_ESTIMATE_THRESHOLD = 10000
+
+
+def estimated_count(model):
+    """PostgreSQL's estimate of the number of rows in the model's table (and its partitions, if any), or None if there is
+    no estimate; e.g. the table hasn't been analyzed yet, or the database isn't PostgreSQL."""
+    if connection.vendor != "postgresql":
+        return None
+
+    with connection.cursor() as cursor:
+        cursor.execute(
+            """
+            SELECT sum(reltuples) FILTER (WHERE reltuples >= 0) FROM pg_class
+            WHERE oid = to_regclass(%s) OR oid IN (SELECT inhrelid FROM pg_inherits WHERE inhparent = to_regclass(%s))
+            """,
+            [model._meta.db_table, model._meta.db_table],
+        )
+        (estimate,) = cursor.fetchone()
+
+    return int(estimate) if estimate else None
+
+
+class KeysetChangeList(ChangeList):
+    """A changelist that pages through rows by the position of the last row shown (a keyset), instead of by page number.
+
+    Rows are always ordered newest first, by the first field in the ModelAdmin's `ordering` and then by primary key, so
+    each page is a range of an index no matter how deep it is; and large unfiltered lists aren't counted.
+    """
+
+    def __init__(self, request, *args, **kwargs):
+        self.after = request.GET.get(AFTER_VAR)
+        self.before = None if self.after else request.GET.get(BEFORE_VAR)
+        super().__init__(request, *args, **kwargs)
+
+    @property
+    def keyset_field(self):
+        return self.model_admin.ordering[0].removeprefix("-")
+
+    def get_filters_params(self, params=None):
+        lookup_params = super().get_filters_params(params)
+        lookup_params.pop(AFTER_VAR, None)
+        lookup_params.pop(BEFORE_VAR, None)
+        return lookup_params
+
+    def get_query_string(self, new_params=None, remove=None):
+        # changing the filters starts from the first page
+        return super().get_query_string(new_params, [AFTER_VAR, BEFORE_VAR, *(remove or [])])
+
+    def get_ordering(self, request, queryset):
+        return [f"-{self.keyset_field}", "-pk"]
+
+    def _keyset(self, row):
+        return f"{getattr(row, self.keyset_field).isoformat()},{row.pk}"
+
+    def _parse_keyset(self, keyset):
+        value, _, pk = keyset.rpartition(",")
+        try:
+            return self.lookup_opts.get_field(self.keyset_field).to_python(value), self.lookup_opts.pk.to_python(pk)
+        except ValidationError:
+            raise IncorrectLookupParameters
+
+    def _count(self):
+        # nothing (e.g. a filter or a search) limits the rows of the list
+        if not self.queryset.query.where:
+            estimate = estimated_count(self.model)
+            if estimate is not None and estimate > COUNT_ESTIMATE_THRESHOLD:
+                return estimate, True
+        return self.queryset.count(), False
+
+    def get_results(self, request):
+        field = self.keyset_field
+        queryset = self.queryset
+
+        if self.after:
+            value, pk = self._parse_keyset(self.after)
+            # the first condition is the range of the index to read, the second skips rows up to and including the keyset
+            queryset = queryset.filter(Q(**{f"{field}__lte": value}), Q(**{f"{field}__lt": value}) | Q(pk__lt=pk))
+        elif self.before:
+            value, pk = self._parse_keyset(self.before)
+            queryset = queryset.filter(Q(**{f"{field}__gte": value}), Q(**{f"{field}__gt": value}) | Q(pk__gt=pk)).reverse()
+
+        # one more row than fits on the page tells whether there is another page
+        rows = list(queryset[: self.list_per_page + 1])
+        more = len(rows) > self.list_per_page
+        rows = rows[: self.list_per_page]
+        if self.before:
+            rows.reverse()
+
+        has_next = bool(self.before) or more
+        has_previous = bool(self.after) or (bool(self.before) and more)
+
+        self.result_count, self.result_count_estimated = self._count()
+        self.show_full_result_count = False
+        self.full_result_count = None
+        self.show_admin_actions = True
+        self.result_list = rows
+        self.can_show_all = False
+        self.multi_page = has_next or has_previous
+        self.paginator = None
+        self.next_url = self.get_query_string({AFTER_VAR: self._keyset(rows[-1])}) if has_next and rows else None
+        self.previous_url = self.get_query_string({BEFORE_VAR: self._keyset(rows[0])}) if has_previous and rows else None
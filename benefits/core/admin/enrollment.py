@@ -1,18 +1,103 @@
+import datetime
+
 from adminsortable2.admin import SortableAdminMixin
 from django import forms
 from django.contrib import admin
-from django.core.exceptions import ValidationError
+from django.core.exceptions import PermissionDenied, ValidationError
+from django.db.models import Sum
+from django.http import StreamingHttpResponse
+from django.template.response import TemplateResponse
+from django.utils import timezone
 
-from benefits.core import models
+from benefits.core import export, models
 from benefits.core.models.common import template_path
 
+from .changelist import KeysetChangeList
+from .forms import EnrollmentDashboardForm
 from .mixins import ProdReadOnlyPermissionMixin, StaffPermissionMixin, SuperuserPermissionMixin
 
 
 @admin.register(models.EnrollmentEvent)
 class EnrollmentEventAdmin(ProdReadOnlyPermissionMixin, admin.ModelAdmin):
     list_display = ("enrollment_datetime", "transit_agency", "enrollment_flow", "enrollment_method", "verified_by")
+    list_select_related = ("transit_agency", "enrollment_flow")
+    # each filter is a range of an index on enrollment_datetime, or lists its choices without reading the events
+    list_filter = ("enrollment_datetime", "transit_agency", "enrollment_flow", "enrollment_method")
     ordering = ("-enrollment_datetime",)
+    # the list is paged through in this order, see KeysetChangeList
+    sortable_by = ()
+    show_facets = admin.ShowFacets.NEVER
+    show_full_result_count = False
+    actions = ["export_csv"]
+
+    def get_changelist(self, request, **kwargs):
+        return KeysetChangeList
+
+    @admin.action(description="Export selected %(verbose_name_plural)s as CSV", permissions=["view"])
+    def export_csv(self, request, queryset):
+        # streamed a chunk of events at a time, so "Select all" exports every matching event without loading them at once
+        response = StreamingHttpResponse(
+            export.csv_lines(queryset.order_by("enrollment_datetime", "pk")), content_type="text/csv; charset=utf-8"
+        )
+        filename = f"enrollment-events-{timezone.localdate():%Y%m%d}.csv"
+        response["Content-Disposition"] = f'attachment; filename="{filename}"'
+        return response
+
+
+def _totals():
+    return {f"total_{name}": Sum(name) for name in ("enrollments", "with_expiration", "with_extra_claims")}
+
+
+@admin.register(models.EnrollmentRollup)
+class EnrollmentRollupAdmin(ProdReadOnlyPermissionMixin, admin.ModelAdmin):
+    """A dashboard of enrollments per day, agency and flow, read only from the daily rollups (never from the events), so it
+    reads a row per day, agency, flow and method however many enrollments there are."""
+
+    change_list_template = "admin/core/enrollmentrollup/dashboard.html"
+    # the days shown when the dashboard is first opened
+    default_days = 30
+
+    # rollups are only written from the enrollment events
+    def has_add_permission(self, request):
+        return False
+
+    def has_change_permission(self, request, obj=None):
+        return False
+
+    def has_delete_permission(self, request, obj=None):
+        return False
+
+    def changelist_view(self, request, extra_context=None):
+        if not self.has_view_permission(request):
+            raise PermissionDenied
+
+        end = timezone.localdate()
+        initial = {"start": end - datetime.timedelta(days=self.default_days - 1), "end": end}
+        form = EnrollmentDashboardForm(request.GET if "start" in request.GET else initial)
+
+        rollups = models.EnrollmentRollup.objects.none()
+        if form.is_valid():
+            rollups = models.EnrollmentRollup.objects.filter(
+                day__gte=form.cleaned_data["start"], day__lte=form.cleaned_data["end"]
+            )
+            for field in ("transit_agency", "enrollment_flow"):
+                if form.cleaned_data[field]:
+                    rollups = rollups.filter(**{field: form.cleaned_data[field]})
+
+        by_agency_flow = ("transit_agency__long_name", "enrollment_flow__label", "enrollment_method")
+        context = {
+            **self.admin_site.each_context(request),
+            "title": "Enrollments",
+            "opts": self.opts,
+            "form": form,
+            "total": rollups.aggregate(**_totals()),
+            "by_day": rollups.values("day").annotate(**_totals()).order_by("-day"),
+            "by_agency_flow": rollups.values(*by_agency_flow).annotate(**_totals()).order_by(*by_agency_flow),
+            **(extra_context or {}),
+        }
+        request.current_app = self.admin_site.name
+
+        return TemplateResponse(request, self.change_list_template, context)
 
 
 @admin.register(models.EligibilityApiVerificationRequest)
@@ -2,7 +2,7 @@ from django import forms
 from django.contrib.auth.forms import PasswordResetForm, SetPasswordForm
 
 from benefits.core.mixins import ValidateRecaptchaMixin
-from benefits.core.models import TransitAgencyGroup
+from benefits.core.models import EnrollmentFlow, TransitAgency, TransitAgencyGroup
 
 
 class BenefitsPasswordResetForm(ValidateRecaptchaMixin, PasswordResetForm):
@@ -13,6 +13,22 @@ class BenefitsSetPasswordForm(ValidateRecaptchaMixin, SetPasswordForm):
     pass
 
 
+class EnrollmentDashboardForm(forms.Form):
+    """The days, and optionally the agency and flow, to show enrollments for on the dashboard."""
+
+    start = forms.DateField(widget=forms.DateInput(attrs={"type": "date"}))
+    end = forms.DateField(widget=forms.DateInput(attrs={"type": "date"}))
+    transit_agency = forms.ModelChoiceField(TransitAgency.objects.order_by("long_name"), required=False)
+    enrollment_flow = forms.ModelChoiceField(EnrollmentFlow.objects.order_by("label"), required=False)
+
+    def clean(self):
+        cleaned_data = super().clean()
+        start, end = cleaned_data.get("start"), cleaned_data.get("end")
+        if start and end and start > end:
+            raise forms.ValidationError("The start date must be on or before the end date.")
+        return cleaned_data
+
+
 class TransitAgencyGroupForm(forms.ModelForm):
     class Meta:
         model = TransitAgencyGroup
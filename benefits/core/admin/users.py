@@ -1,11 +1,11 @@
 import logging
 
-import requests
 from django.conf import settings
 from django.contrib import admin
 from django.contrib.auth.admin import GroupAdmin as BaseGroupAdmin, UserAdmin as BaseUserAdmin
 from django.contrib.auth.models import Group, User
 
+from benefits.core import http
 from benefits.core.admin.mixins import StaffPermissionMixin
 
 logger = logging.getLogger(__name__)
@@ -68,7 +68,7 @@ def add_google_sso_userinfo(user, request):
         }
 
         # Request Google user info to get name and email
-        response = requests.get(GOOGLE_USER_INFO_URL, headers=headers, timeout=settings.REQUESTS_TIMEOUT)
+        response = http.get(http.GOOGLE_SSO, GOOGLE_USER_INFO_URL, headers=headers)
         user_data = response.json()
         logger.debug(f"Updating user data from Google for user with email: {user_data['email']}")
 
@@ -2,70 +2,113 @@
 The core application: analytics implementation.
 """
 
+import atexit
 import itertools
 import json
 import logging
+import os
+import queue
 import re
+import threading
 import time
 import uuid
+from functools import cached_property
 
-import requests
 from django.conf import settings
 
 from benefits import VERSION
 
-from . import models, session
+from . import http, models, session
 
 logger = logging.getLogger(__name__)
 
 
+class EventContext:
+    """Session and request derived values shared by every analytics event sent while handling a request.
+
+    Use `EventContext.for_request()` to get the context, which is computed once and reused until the request's
+    session is changed by `session.update()` or `session.reset()`.
+    """
+
+    _domain_re = re.compile(r"^(?:https?:\/\/)?(?:[^@\n]+@)?(?:www\.)?([^:\/\n?]+)", re.IGNORECASE)
+
+    def __init__(self, request):
+        self.request = request
+        # device_id is generated based on the user_id, and both are set explicitly (per session)
+        self.device_id = session.did(request)
+        self.language = session.language(request)
+        # Amplitude tracks sessions using the start time as the session_id
+        self.session_id = session.start(request)
+        self.user_id = session.uid(request)
+        self.path = request.path
+        self.user_agent = request.headers.get("user-agent")
+        self.referrer = request.headers.get("referer")
+        match = EventContext._domain_re.match(self.referrer) if self.referrer else None
+        self.referring_domain = match.group(1) if match else None
+        self.version = session.version(request)
+
+    @staticmethod
+    def for_request(request):
+        """Get the EventContext for the request, computing it only if the request's session has changed."""
+        context = getattr(request, "_event_context", None)
+        if context is None or context.version != session.version(request):
+            context = EventContext(request)
+            request._event_context = context
+        return context
+
+    @cached_property
+    def agency(self):
+        return session.agency(self.request)
+
+    @cached_property
+    def flow(self):
+        return session.flow(self.request)
+
+    @cached_property
+    def eligibility_verifier(self):
+        return self.flow.eligibility_verifier if self.flow else None
+
+
 class Event:
     """Base analytics event of a given type, including attributes from request's session."""
 
     _counter = itertools.count()
-    _domain_re = re.compile(r"^(?:https?:\/\/)?(?:[^@\n]+@)?(?:www\.)?([^:\/\n?]+)", re.IGNORECASE)
 
     def __init__(self, request, event_type, enrollment_method=models.EnrollmentMethods.SELF_SERVICE, agency=None, **kwargs):
+        context = EventContext.for_request(request)
+
         self.app_version = VERSION
-        # device_id is generated based on the user_id, and both are set explicitly (per session)
-        self.device_id = session.did(request)
+        self.device_id = context.device_id
         self.event_properties = {}
         self.event_type = str(event_type).lower()
         self.insert_id = str(uuid.uuid4())
-        self.language = session.language(request)
-        # Amplitude tracks sessions using the start time as the session_id
-        self.session_id = session.start(request)
+        self.language = context.language
+        self.session_id = context.session_id
         self.time = int(time.time() * 1000)
         # Although Amplitude advises *against* setting user_id for anonymous users, here a value is set on anonymous
         # users anyway, as the users never sign-in and become de-anonymized to this app / Amplitude.
-        self.user_id = session.uid(request)
+        self.user_id = context.user_id
         self.user_properties = {}
         self.__dict__.update(kwargs)
 
         # Use agency argument if present, otherwise look for one in the session
-        agency = agency or session.agency(request)
+        agency = agency or context.agency
         agency_name = str(agency) if agency else None
 
-        flow = session.flow(request)
-        verifier_name = flow.eligibility_verifier if flow else None
+        flow = context.flow
+        verifier_name = context.eligibility_verifier
 
         self.update_event_properties(
-            path=request.path,
+            path=context.path,
             transit_agency=agency_name,
             eligibility_verifier=verifier_name,
             enrollment_method=enrollment_method,
         )
 
-        uagent = request.headers.get("user-agent")
-
-        ref = request.headers.get("referer")
-        match = Event._domain_re.match(ref) if ref else None
-        refdom = match.group(1) if match else None
-
         self.update_user_properties(
-            referrer=ref,
-            referring_domain=refdom,
-            user_agent=uagent,
+            referrer=context.referrer,
+            referring_domain=context.referring_domain,
+            user_agent=context.user_agent,
             transit_agency=agency_name,
             eligibility_verifier=verifier_name,
             enrollment_method=enrollment_method,
@@ -125,22 +168,389 @@ class ChangedLanguageEvent(Event):
         self.update_event_properties(language=new_lang)
 
 
+class Spool:
+    """Append-only, on-disk store of analytics events that could not be delivered yet.
+
+    Events are appended as JSON lines to an open segment file owned by the writing process. A segment is sealed
+    (renamed with the `.jsonl` suffix) once it reaches `segment_bytes` in size or `segment_seconds` in age, and sealed
+    segments are streamed back to the analytics API by `replay()`.
+
+    A replay claims each segment (renamed with the `.replaying` suffix) while sending it, and renews the claim as it goes. A
+    claim that hasn't been renewed for `claim_lease` seconds (longer than a replay's `max_backoff`) was left by a replay that
+    was killed, and its segment is replayed again: events carry an `insert_id`, so the analytics API ignores those that were
+    already sent.
+    """
+
+    OPEN_SUFFIX = ".open"
+    SEALED_SUFFIX = ".jsonl"
+    CLAIMED_SUFFIX = ".replaying"
+
+    def __init__(self, path, segment_bytes=1024 * 1024, segment_seconds=60, claim_lease=300):
+        self.path = path
+        self.segment_bytes = segment_bytes
+        self.segment_seconds = segment_seconds
+        self.claim_lease = claim_lease
+        self._lock = threading.Lock()
+        self._file = None
+        self._file_path = None
+        self._file_opened = None
+        self._file_pid = None
+        self._counter = itertools.count()
+
+    def _new_segment_name(self):
+        return f"{time.time_ns()}-{os.getpid()}-{next(self._counter)}"
+
+    def _open(self):
+        os.makedirs(self.path, exist_ok=True)
+        self._file_path = os.path.join(self.path, self._new_segment_name() + Spool.OPEN_SUFFIX)
+        self._file = open(self._file_path, "a", encoding="utf-8")
+        self._file_opened = time.monotonic()
+        self._file_pid = os.getpid()
+
+    def _seal(self):
+        if self._file is None:
+            return
+
+        self._file.close()
+        if self._file_pid != os.getpid():
+            # leave another process's segment for that process to seal
+            self._file = None
+            return
+
+        sealed_path = self._file_path[: -len(Spool.OPEN_SUFFIX)] + Spool.SEALED_SUFFIX
+        try:
+            os.replace(self._file_path, sealed_path)
+        except FileNotFoundError:
+            # an abandoned segment was already sealed by a replay
+            pass
+        self._file = None
+        self._file_path = None
+        self._file_opened = None
+        self._file_pid = None
+
+    def append(self, events):
+        """Append events (`Event` instances or their dicts) to the open segment."""
+        if not events:
+            return
+
+        lines = "".join(json.dumps(e if isinstance(e, dict) else e.__dict__) + "\n" for e in events)
+
+        with self._lock:
+            # segments are owned by the process that opened them, e.g. a forked worker leaves its parent's segment alone
+            if self._file is not None and self._file_pid != os.getpid():
+                self._seal()
+            if self._file is not None and (
+                self._file.tell() >= self.segment_bytes or time.monotonic() - self._file_opened >= self.segment_seconds
+            ):
+                self._seal()
+            if self._file is None:
+                self._open()
+
+            self._file.write(lines)
+            self._file.flush()
+
+    def seal(self):
+        """Seal the open segment, making it available for replay."""
+        with self._lock:
+            self._seal()
+
+    def segments(self):
+        """Sealed segment paths, oldest first.
+
+        Open segments that haven't been written to for twice `segment_seconds` were abandoned by their process,
+        and are sealed here. Claimed segments that haven't been renewed for `claim_lease` seconds were abandoned by their
+        replay, and are sealed again here.
+        """
+        if not os.path.isdir(self.path):
+            return []
+
+        now = time.time()
+        for entry in os.scandir(self.path):
+            if entry.name.endswith(Spool.OPEN_SUFFIX) and entry.path != self._file_path:
+                suffix, age = Spool.OPEN_SUFFIX, 2 * self.segment_seconds
+            elif entry.name.endswith(Spool.CLAIMED_SUFFIX):
+                suffix, age = Spool.CLAIMED_SUFFIX, self.claim_lease
+            else:
+                continue
+            try:
+                if now - entry.stat().st_mtime >= age:
+                    os.replace(entry.path, entry.path[: -len(suffix)] + Spool.SEALED_SUFFIX)
+            except FileNotFoundError:
+                pass
+
+        return sorted(entry.path for entry in os.scandir(self.path) if entry.name.endswith(Spool.SEALED_SUFFIX))
+
+    def _claim(self, segment):
+        claimed = segment[: -len(Spool.SEALED_SUFFIX)] + Spool.CLAIMED_SUFFIX
+        try:
+            os.replace(segment, claimed)
+            return claimed
+        except FileNotFoundError:
+            # another replay process claimed this segment
+            return None
+
+    def _renew(self, claimed):
+        """Renew the claim on a segment being replayed, so it isn't taken for abandoned."""
+        try:
+            os.utime(claimed)
+        except FileNotFoundError:
+            # the claim expired and the segment was sealed again
+            pass
+
+    def _read(self, segment):
+        with open(segment, encoding="utf-8") as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    yield json.loads(line)
+                except json.JSONDecodeError:
+                    logger.error(f"Skipping malformed spooled event in {segment}")
+
+    def replay(self, client, max_attempts=5, backoff=1, max_backoff=60, sleep=time.sleep):
+        """Stream sealed segments to the analytics API.
+
+        Server errors and timeouts are retried with exponential backoff; after `max_attempts` the remaining events are
+        kept for a later replay. Users throttled by a 429 response are deferred until a later replay (the whole batch, if
+        the response doesn't name any of its users), while events for other users in the same batch are retried with the
+        same backoff, the 429 counting as an attempt.
+
+        Deferred and unsent events are written to a new sealed segment before each claimed segment is removed, so a replay
+        that is killed part way through loses no events.
+
+        Returns a dict with the number of events `sent`, `dropped` (rejected as invalid) and `deferred`.
+        """
+        result = {"sent": 0, "dropped": 0, "deferred": 0}
+        size = client.batch_size
+        throttled_users = set()
+        stop = False
+
+        for segment in self.segments():
+            claimed = self._claim(segment)
+            if claimed is None:
+                continue
+
+            deferred = []
+            pending = []
+            events = self._read(claimed)
+
+            while True:
+                if not stop:
+                    for event in events:
+                        if event.get("user_id") in throttled_users:
+                            deferred.append(event)
+                        else:
+                            pending.append(event)
+                        if len(pending) >= size:
+                            break
+
+                if stop or not pending:
+                    deferred.extend(pending)
+                    deferred.extend(events)
+                    break
+
+                batch, pending = pending[:size], pending[size:]
+                attempt = 0
+
+                while True:
+                    response = client._request(batch)
+                    status = response.status_code if response is not None else None
+                    self._renew(claimed)
+
+                    if status == 200:
+                        result["sent"] += len(batch)
+                        break
+                    elif status in (400, 413):
+                        logger.error(f"Dropping {len(batch)} spooled event(s) rejected by the analytics API")
+                        result["dropped"] += len(batch)
+                        break
+                    elif status == 429:
+                        body = Client._json(response)
+                        users = set(body.get("throttled_users", {})) | set(body.get("exceeded_daily_quota_users", {}))
+                        batch_users = {e.get("user_id") for e in batch}
+                        if not users & batch_users:
+                            # no detail about who in the batch was throttled, defer the whole batch
+                            users = batch_users
+                        throttled_users |= users
+                        deferred.extend(e for e in batch if e.get("user_id") in throttled_users)
+                        batch = [e for e in batch if e.get("user_id") not in throttled_users]
+                        if not batch:
+                            break
+
+                    # retry the batch (after a 429, the events of users who weren't throttled) with backoff
+                    attempt += 1
+                    if attempt >= max_attempts:
+                        logger.error("Analytics API unavailable, stopping replay")
+                        pending = batch + pending
+                        stop = True
+                        break
+                    sleep(min(max_backoff, backoff * 2 ** (attempt - 1)))
+                    self._renew(claimed)
+
+            if deferred:
+                result["deferred"] += len(deferred)
+                self.append(deferred)
+                self.seal()
+            try:
+                os.remove(claimed)
+            except FileNotFoundError:
+                # the claim expired and the segment was sealed again, it will be replayed again
+                pass
+            if stop:
+                break
+
+        return result
+
+
 class Client:
-    """Analytics API client"""
+    """Analytics API client
+
+    Events are queued in-process and delivered to Amplitude in batches by a background worker thread,
+    so that sending an event never blocks the request/response cycle on the network call.
+
+    When configured with a `Spool`, events that can't be delivered (the queue is full, or Amplitude is throttling,
+    erroring or timing out) are written to the spool for a later replay instead of being dropped. After a failed
+    delivery, batches go straight to the spool for an exponentially growing backoff period.
+    """
 
-    def __init__(self, api_key):
+    # sentinels placed on the queue to control the worker thread
+    _FLUSH = object()
+    _STOP = object()
+
+    def __init__(self, api_key, batch_size=100, flush_interval=5, queue_size=10000, spool=None, max_backoff=300):
         self.api_key = api_key
         self.headers = {"Accept": "*/*", "Content-type": "application/json"}
         self.url = "https://api2.amplitude.com/2/httpapi"
+        self.batch_size = max(1, batch_size)
+        self.flush_interval = flush_interval
+        self.queue_size = queue_size
+        self.spool = spool
+        self.max_backoff = max_backoff
+        self._lock = threading.Lock()
+        self._pid = None
+        self._queue = None
+        self._worker = None
+        self._atexit_registered = False
+        self._failures = 0
+        self._retry_at = 0
         logger.debug(f"Initialize Client for {self.url}")
 
     def _payload(self, events):
         if not isinstance(events, list):
             events = [events]
-        return {"api_key": self.api_key, "events": [e.__dict__ for e in events]}
+        return {"api_key": self.api_key, "events": [e if isinstance(e, dict) else e.__dict__ for e in events]}
+
+    @staticmethod
+    def _json(response):
+        try:
+            return response.json()
+        except Exception:
+            return {}
+
+    def _ensure_worker(self):
+        """Start the background worker thread if it isn't running in this process."""
+        # the pid check covers forked (e.g. gunicorn) worker processes, which don't inherit running threads
+        if self._worker is not None and self._pid == os.getpid() and self._worker.is_alive():
+            return
+
+        with self._lock:
+            if self._worker is not None and self._pid == os.getpid() and self._worker.is_alive():
+                return
+
+            logger.debug("Starting analytics worker thread")
+            self._pid = os.getpid()
+            self._queue = queue.Queue(maxsize=self.queue_size)
+            self._worker = threading.Thread(target=self._run, name="analytics-client", daemon=True)
+            self._worker.start()
+
+            if not self._atexit_registered:
+                atexit.register(self.shutdown)
+                self._atexit_registered = True
+
+    def _run(self):
+        """Worker loop: drain the queue, posting events in batches by size or by interval."""
+        q = self._queue
+        while True:
+            batch = []
+            control = None
+            deadline = time.monotonic() + self.flush_interval
+
+            while len(batch) < self.batch_size:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    item = q.get(timeout=remaining)
+                except queue.Empty:
+                    break
+                if item is Client._FLUSH or item is Client._STOP:
+                    control = item
+                    break
+                batch.append(item)
+
+            if batch:
+                self._post(batch)
+                for _ in batch:
+                    q.task_done()
+
+            if control is not None:
+                q.task_done()
+                if control is Client._STOP:
+                    return
+
+    def _request(self, events):
+        """Post events to the analytics API, returning the response or None if the request failed."""
+        try:
+            payload = self._payload(events)
+            logger.debug(f"Sending event payload: {payload}")
+
+            return http.post(http.ANALYTICS, self.url, headers=self.headers, json=payload)
+        except Exception:
+            logger.error(f"Failed to send {len(events)} event(s)")
+            return None
+
+    def _spool(self, events):
+        if self.spool is None:
+            return False
+
+        try:
+            self.spool.append(events)
+            return True
+        except Exception:
+            logger.exception(f"Failed to spool {len(events)} event(s)")
+            return False
+
+    def _post(self, events):
+        """Post a batch of events to the analytics API, spooling them if they can't be delivered."""
+        if self.spool is not None and time.monotonic() < self._retry_at:
+            self._spool(events)
+            return
+
+        r = self._request(events)
+
+        if r is not None and r.status_code == 200:
+            logger.debug(f"Events sent successfully: {Client._json(r)}")
+            self._failures = 0
+            return
+        elif r is not None and r.status_code == 400:
+            logger.error(f"Event request was invalid: {Client._json(r)}")
+            return
+        elif r is not None and r.status_code == 413:
+            logger.error(f"Event payload was too large: {Client._json(r)}")
+            return
+        elif r is not None and r.status_code == 429:
+            logger.error(f"Event contained too many requests for some users: {Client._json(r)}")
+        elif r is not None:
+            logger.error(f"Failed to send events: {Client._json(r)}")
+
+        # throttled, server error, or timeout: keep the events for replay and back off
+        self._failures += 1
+        self._retry_at = time.monotonic() + min(self.max_backoff, 2 ** (self._failures - 1))
+        self._spool(events)
 
     def send(self, event):
-        """Send an analytics event."""
+        """Queue an analytics event for delivery."""
         if not isinstance(event, Event):
             raise ValueError("event must be an Event instance")
 
@@ -148,32 +558,62 @@ class Client:
             logger.warning(f"api_key is not configured, cannot send event: {event}")
             return
 
-        try:
-            payload = self._payload(event)
-            logger.debug(f"Sending event payload: {payload}")
+        self._ensure_worker()
 
-            r = requests.post(
-                self.url,
-                headers=self.headers,
-                json=payload,
-                timeout=settings.REQUESTS_TIMEOUT,
-            )
-            if r.status_code == 200:
-                logger.debug(f"Event sent successfully: {r.json()}")
-            elif r.status_code == 400:
-                logger.error(f"Event request was invalid: {r.json()}")
-            elif r.status_code == 413:
-                logger.error(f"Event payload was too large: {r.json()}")
-            elif r.status_code == 429:
-                logger.error(f"Event contained too many requests for some users: {r.json()}")
-            else:
-                logger.error(f"Failed to send event: {r.json()}")
+        try:
+            self._queue.put_nowait(event)
+        except queue.Full:
+            if not self._spool([event]):
+                logger.error(f"Analytics queue is full, dropping event: {event}")
+
+    def flush(self, timeout=None):
+        """Deliver any queued events now, waiting up to `timeout` seconds for the queue to drain."""
+        if self._worker is None or self._pid != os.getpid() or not self._worker.is_alive():
+            return
 
-        except Exception:
-            logger.error(f"Failed to send event: {event}")
+        try:
+            self._queue.put(Client._FLUSH, timeout=timeout)
+        except queue.Full:
+            logger.warning("Analytics queue is full, could not request a flush")
+            return
 
+        self._wait(timeout)
+
+    def shutdown(self, timeout=10):
+        """Deliver any queued events and stop the worker thread."""
+        if self._worker is not None and self._pid == os.getpid() and self._worker.is_alive():
+            try:
+                self._queue.put(Client._STOP, timeout=timeout)
+                self._worker.join(timeout)
+                self._worker = None
+            except queue.Full:
+                logger.warning("Analytics queue is full, could not stop worker cleanly")
+
+        if self.spool is not None:
+            self.spool.seal()
+
+    def _wait(self, timeout):
+        """Block until all queued items are processed, or `timeout` seconds have passed."""
+        if timeout is None:
+            self._queue.join()
+            return
 
-client = Client(settings.ANALYTICS_KEY)
+        deadline = time.monotonic() + timeout
+        with self._queue.all_tasks_done:
+            while self._queue.unfinished_tasks:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                self._queue.all_tasks_done.wait(remaining)
+
+
+client = Client(
+    settings.ANALYTICS_KEY,
+    batch_size=settings.ANALYTICS_BATCH_SIZE,
+    flush_interval=settings.ANALYTICS_FLUSH_INTERVAL,
+    queue_size=settings.ANALYTICS_QUEUE_SIZE,
+    spool=Spool(settings.ANALYTICS_SPOOL_DIR),
+)
 
 
 def send_event(event):
@@ -3,7 +3,8 @@ The core application: Houses base templates and reusable models and components.
 """
 
 from django.apps import AppConfig
-from django.db.models.signals import post_migrate
+from django.core import checks
+from django.db.models.signals import m2m_changed, post_delete, post_migrate, post_save
 
 
 class CoreAppConfig(AppConfig):
@@ -15,9 +16,20 @@ class CoreAppConfig(AppConfig):
     # Hat tip: https://lincolnloop.com/blog/ensuring-essential-data-exists-in-your-django-app-on-startup/
 
     def ready(self):
+        from benefits.core import cache
+        from benefits.routes import check_routes
+
         # Connect a handler that runs after migrations
         post_migrate.connect(self.setup_group, sender=self)
 
+        # Connect handlers that clear the configuration cache when configuration changes
+        post_save.connect(cache.model_changed, dispatch_uid="benefits.core.cache.post_save")
+        post_delete.connect(cache.model_changed, dispatch_uid="benefits.core.cache.post_delete")
+        m2m_changed.connect(cache.relation_changed, dispatch_uid="benefits.core.cache.m2m_changed")
+
+        # Check that the Routes collection matches the URLConf, e.g. when running migrations at startup
+        checks.register(check_routes, checks.Tags.urls)
+
     @staticmethod
     def setup_group(**kwargs):
         # Ensure the staff group exists.
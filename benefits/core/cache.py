@@ -0,0 +1,239 @@
+"""
+The core application: process-wide cache of configuration data.
+
+Transit agencies, enrollment flows and enrollment groups (and the related configuration needed to use them) change rarely,
+via the Admin, but are needed on nearly every request. This module keeps them in memory, loading each model's rows in a
+single query the first time any of them is needed.
+
+The cache is cleared:
+
+* in the process making a change, by signal receivers for `post_save`, `post_delete` and `m2m_changed`
+* in every other process, when `ConfigurationVersion` (increased by the same receivers) no longer matches the cached
+  version, checked at most once every `settings.CONFIG_CACHE_VERSION_CHECK_INTERVAL` seconds
+"""
+
+import logging
+import threading
+import time
+from collections import defaultdict
+from dataclasses import dataclass
+
+from cdt_identity.models import ClaimsVerificationRequest, IdentityGatewayConfig
+from django.conf import settings
+from django.db import transaction
+from django.urls import NoReverseMatch, reverse
+
+from benefits.enrollment_littlepay.models import LittlepayGroup
+from benefits.enrollment_switchio.models import SwitchioGroup
+from benefits.routes import routes
+
+from . import models
+
+logger = logging.getLogger(__name__)
+
+# changes to instances of these models clear the cache
+TRACKED_MODELS = (
+    models.EligibilityApiVerificationRequest,
+    models.EnrollmentFlow,
+    models.EnrollmentGroup,
+    models.PemData,
+    models.TransitAgency,
+    models.TransitAgencyGroup,
+    models.TransitProcessorConfig,
+    ClaimsVerificationRequest,
+    IdentityGatewayConfig,
+)
+
+# how to load each cached model, with related configuration
+_QUERYSETS = {
+    models.TransitAgency: lambda: models.TransitAgency.objects.select_related(
+        "transit_processor_config",
+        "transit_processor_config__littlepayconfig",
+        "transit_processor_config__switchioconfig",
+    ),
+    models.EnrollmentFlow: lambda: models.EnrollmentFlow.objects.select_related(
+        "oauth_config",
+        "claims_request",
+        "api_request",
+        "api_request__client_private_key",
+        "api_request__client_public_key",
+        "api_request__api_public_key",
+    ),
+    LittlepayGroup: lambda: LittlepayGroup.objects.select_related("enrollment_flow", "transit_agency"),
+    SwitchioGroup: lambda: SwitchioGroup.objects.select_related("enrollment_flow", "transit_agency"),
+}
+
+_lock = threading.RLock()
+_entries = {}
+_MISSING = object()
+_version = None
+_checked_at = 0
+
+
+def _check_version():
+    """Clear the cache if another process changed configuration since it was loaded."""
+    global _checked_at, _version
+
+    now = time.monotonic()
+    if now - _checked_at < settings.CONFIG_CACHE_VERSION_CHECK_INTERVAL:
+        return
+
+    current = models.ConfigurationVersion.current()
+    with _lock:
+        _checked_at = now
+        if current != _version:
+            if _version is not None:
+                logger.debug(f"Configuration version changed from {_version} to {current}")
+            _entries.clear()
+            _version = current
+
+
+def _get(model, id):
+    """Get the cached instance of the model by its ID, raising `model.DoesNotExist` if there isn't one."""
+    _check_version()
+
+    instances = _load(model)
+
+    try:
+        return instances[int(id)]
+    except (KeyError, TypeError, ValueError):
+        raise model.DoesNotExist(f"{model.__name__} matching id {id} does not exist.")
+
+
+def _load(model):
+    """Get the cached instances of the model, by ID."""
+    instances = _entries.get(model)
+    if instances is None:
+        with _lock:
+            instances = _entries.get(model)
+            if instances is None:
+                logger.debug(f"Loading {model.__name__} into configuration cache")
+                instances = {instance.id: instance for instance in _QUERYSETS[model]()}
+                _entries[model] = instances
+    return instances
+
+
+def derived(key, compute, valid=None):
+    """Get a value computed from configuration data, calling `compute()` only if it isn't cached, or if `valid(value)` is
+    False for the cached value, e.g. because it was computed from a secret that has since been rotated.
+
+    Derived values are cleared along with the rest of the cache, and must be treated as read-only.
+    """
+    _check_version()
+
+    value = _entries.get(key, _MISSING)
+    if value is not _MISSING and (valid is None or valid(value)):
+        return value
+
+    with _lock:
+        value = _entries.get(key, _MISSING)
+        if value is _MISSING or (valid is not None and not valid(value)):
+            value = _entries[key] = compute()
+        return value
+
+
+def active_agencies() -> list[models.TransitAgency]:
+    """Get all active TransitAgency instances, ordered like `TransitAgency.all_active()`."""
+    return derived(
+        "active_agencies",
+        lambda: sorted(
+            (agency for agency in _load(models.TransitAgency).values() if agency.active), key=lambda a: a.long_name
+        ),
+    )
+
+
+@dataclass(frozen=True)
+class AgencyUrls:
+    """The URLs of a TransitAgency, see `TransitAgency.index_url` and `TransitAgency.entrypoint_url`."""
+
+    index_url: str | None
+    entrypoint_url: str
+    # the saved slug the URLs were computed from
+    slug: str
+
+
+def _agency_urls() -> dict[int, AgencyUrls]:
+    """Compute the URLs of every TransitAgency, with a single query for the agencies in each TransitAgencyGroup."""
+    agencies = _load(models.TransitAgency)
+
+    members = defaultdict(set)
+    memberships = models.TransitAgencyGroup.transit_agencies.through.objects.values_list(
+        "transitagencygroup_id", "transitagency_id"
+    )
+    for group_id, agency_id in memberships:
+        members[group_id].add(agency_id)
+
+    # agencies sharing a group with at least one other active agency, like TransitAgency.group_agencies()
+    grouped = set()
+    for agency_ids in members.values():
+        active_ids = {id for id in agency_ids if id in agencies and agencies[id].active}
+        grouped.update(id for id in agency_ids if active_ids - {id})
+
+    urls = routes.urls()
+    agency_urls = {}
+    for id, agency in agencies.items():
+        try:
+            index_url = reverse(routes.AGENCY_INDEX, args=[agency.slug])
+        except NoReverseMatch:
+            # the slug can't be used in a URL
+            index_url = None
+        entrypoint_url = urls["ADDITIONAL_AGENCIES"] if id in grouped else urls["ELIGIBILITY_INDEX"]
+        agency_urls[id] = AgencyUrls(index_url=index_url, entrypoint_url=entrypoint_url, slug=agency.slug)
+    return agency_urls
+
+
+def agency_urls(id) -> AgencyUrls | None:
+    """Get the URLs of a TransitAgency by its ID, or None if there isn't a saved TransitAgency with the ID."""
+    return derived("agency_urls", _agency_urls).get(id)
+
+
+def agency(id) -> models.TransitAgency:
+    """Get a TransitAgency by its ID."""
+    return _get(models.TransitAgency, id)
+
+
+def flow(id) -> models.EnrollmentFlow:
+    """Get an EnrollmentFlow by its ID."""
+    return _get(models.EnrollmentFlow, id)
+
+
+def group(model, id) -> models.EnrollmentGroup:
+    """Get an EnrollmentGroup of the given model (e.g. `LittlepayGroup`) by its ID."""
+    return _get(model, id)
+
+
+def check_version() -> int:
+    """Check the cache against the current configuration version now, clearing it if stale. Returns the version."""
+    global _checked_at
+
+    with _lock:
+        _checked_at = 0
+    _check_version()
+    return _version
+
+
+def clear():
+    """Clear the cache in this process, without changing the configuration version."""
+    global _checked_at
+
+    with _lock:
+        _entries.clear()
+        _checked_at = 0
+
+
+def invalidate():
+    """Clear the cache in this process, and in other processes once the current transaction commits."""
+    clear()
+    transaction.on_commit(models.ConfigurationVersion.increment)
+
+
+def model_changed(sender, instance, **kwargs):
+    """Receiver for the `post_save` and `post_delete` signals."""
+    if isinstance(instance, TRACKED_MODELS):
+        invalidate()
+
+
+def relation_changed(sender, instance, action, **kwargs):
+    """Receiver for the `m2m_changed` signal."""
+    if action.startswith("post_") and isinstance(instance, TRACKED_MODELS):
+        invalidate()
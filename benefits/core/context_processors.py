@@ -3,12 +3,13 @@ The core application: context processors for enriching request context data.
 """
 
 from django.conf import settings
+from django.utils.functional import SimpleLazyObject
 from django.utils.text import format_lazy
 from django.utils.translation import gettext_lazy
 
 from benefits.routes import routes as app_routes
 
-from . import models, session
+from . import cache, models, session
 
 
 def _agency_context(agency: models.TransitAgency):
@@ -43,12 +44,17 @@ def agency(request):
 
 
 def active_agencies(request):
-    """Context processor adds some information about all active agencies to the request context."""
-    agencies = models.TransitAgency.all_active().select_related(
-        "transit_processor_config", "transit_processor_config__littlepayconfig", "transit_processor_config__switchioconfig"
-    )
+    """Context processor adds some information about all active agencies to the request context.
 
-    return {"active_agencies": [_agency_context(agency) for agency in agencies]}
+    The information is only computed if a template uses it, and is then shared until agency configuration changes.
+    """
+
+    def _active_agencies():
+        return cache.derived(
+            "active_agencies_context", lambda: [_agency_context(agency) for agency in cache.active_agencies()]
+        )
+
+    return {"active_agencies": SimpleLazyObject(_active_agencies)}
 
 
 def analytics(request):
@@ -0,0 +1,122 @@
+"""
+Export of enrollment events for agency reporting, in constant memory however many events there are.
+"""
+
+import csv
+import datetime
+
+from benefits.core import rollups
+from benefits.core.models import EnrollmentEvent
+
+# rows read per round trip; on PostgreSQL, through a server-side cursor
+CHUNK_SIZE = 2000
+
+# column name, and the EnrollmentEvent field (or related field) it is read from
+COLUMNS = {
+    "id": "id",
+    "enrollment_datetime": "enrollment_datetime",
+    "expiration_datetime": "expiration_datetime",
+    "transit_agency": "transit_agency__slug",
+    "transit_agency_name": "transit_agency__long_name",
+    "enrollment_flow": "enrollment_flow__system_name",
+    "enrollment_flow_label": "enrollment_flow__label",
+    "enrollment_method": "enrollment_method",
+    "verified_by": "verified_by",
+    "extra_claims": "extra_claims",
+}
+
+FORMATS = ["csv", "parquet"]
+
+
+def enrollment_events(agency=None, flow=None, method=None, start=None, end=None):
+    """Enrollment events, oldest first, optionally limited to an agency (by slug), a flow (by system name), an enrollment
+    method, and the days from `start` up to and including `end`."""
+    queryset = EnrollmentEvent.objects.all()
+
+    if agency:
+        queryset = queryset.filter(transit_agency__slug=agency)
+    if flow:
+        queryset = queryset.filter(enrollment_flow__system_name=flow)
+    if method:
+        queryset = queryset.filter(enrollment_method=method)
+    if start:
+        queryset = queryset.filter(enrollment_datetime__gte=rollups.day_start(start))
+    if end:
+        queryset = queryset.filter(enrollment_datetime__lt=rollups.day_start(end + datetime.timedelta(days=1)))
+
+    return queryset.order_by("enrollment_datetime", "pk")
+
+
+def rows(queryset):
+    """The values of the export's columns for each event in the queryset, fetched a chunk at a time."""
+    # values_list joins the agency and flow in the same query, without building model instances
+    return queryset.values_list(*COLUMNS.values()).iterator(chunk_size=CHUNK_SIZE)
+
+
+def _csv_value(value):
+    if isinstance(value, datetime.datetime):
+        return value.isoformat()
+    return value
+
+
+class _Echo:
+    """A file-like object that returns what is written to it, for csv.writer to format one row at a time."""
+
+    def write(self, value):
+        return value
+
+
+def csv_lines(queryset):
+    """The export as CSV, a line at a time, starting with the header."""
+    writer = csv.writer(_Echo())
+    yield writer.writerow(COLUMNS.keys())
+    for row in rows(queryset):
+        yield writer.writerow(map(_csv_value, row))
+
+
+def write_csv(queryset, file) -> int:
+    """Write the export as CSV to a text file, returning the number of events written."""
+    count = 0
+    lines = csv_lines(queryset)
+    file.write(next(lines))
+    for line in lines:
+        file.write(line)
+        count += 1
+    return count
+
+
+def _record_batch(pa, schema, chunk):
+    # the columns of the chunk's rows; the id (a UUID) is written as a string
+    arrays = [
+        list(column) if pa.types.is_timestamp(field.type) else [None if value is None else str(value) for value in column]
+        for field, column in zip(schema, zip(*chunk))
+    ]
+    return pa.record_batch(arrays, schema=schema)
+
+
+def write_parquet(queryset, path) -> int:
+    """Write the export as a Parquet file, a row group per chunk of events, returning the number of events written.
+
+    Requires the pyarrow package.
+    """
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    schema = pa.schema(
+        [(name, pa.timestamp("us", tz="UTC") if name.endswith("_datetime") else pa.string()) for name in COLUMNS.keys()]
+    )
+
+    count = 0
+    chunk = []
+    with pq.ParquetWriter(path, schema) as writer:
+        for row in rows(queryset):
+            chunk.append(row)
+            if len(chunk) == CHUNK_SIZE:
+                writer.write_batch(_record_batch(pa, schema, chunk))
+                count += len(chunk)
+                chunk.clear()
+        if chunk:
+            writer.write_batch(_record_batch(pa, schema, chunk))
+            count += len(chunk)
+
+    return count
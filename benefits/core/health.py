@@ -0,0 +1,92 @@
+"""
+The core application: readiness checks for the deep health probe.
+
+Liveness (`/healthcheck`) only shows the process can answer requests. Readiness (`/healthcheck/ready`) also checks what
+the app needs to serve riders: the database connection, the secrets cache and the configuration cache. The result is
+cached for `settings.HEALTHCHECK_READY_CACHE_TTL` seconds, so frequent probes don't add load on the database.
+"""
+
+import logging
+import threading
+import time
+from dataclasses import dataclass, field
+
+from django.conf import settings
+from django.db import connection
+
+from benefits import secrets
+
+from . import cache
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class Readiness:
+    checks: dict = field(default_factory=dict)
+    checked_at: float = 0.0
+
+    @property
+    def ready(self):
+        return all(result == "ok" for result in self.checks.values())
+
+    def to_dict(self):
+        return {"ready": self.ready, "checks": self.checks}
+
+
+def check_database():
+    with connection.cursor() as cursor:
+        cursor.execute("SELECT 1")
+    return "ok"
+
+
+def check_secrets():
+    return "ok" if secrets.warm() else "prefetching"
+
+
+def check_config():
+    cache.check_version()
+    return "ok"
+
+
+CHECKS = {
+    "database": check_database,
+    "secrets": check_secrets,
+    "config": check_config,
+}
+
+_lock = threading.Lock()
+_result = None
+
+
+def _run_checks() -> Readiness:
+    result = Readiness(checked_at=time.monotonic())
+    for name, check in CHECKS.items():
+        try:
+            result.checks[name] = check()
+        except Exception:
+            logger.warning(f"Readiness check failed: {name}", exc_info=True)
+            result.checks[name] = "error"
+    return result
+
+
+def readiness() -> Readiness:
+    """Get the readiness of this process, running the checks if the cached result is too old."""
+    global _result
+
+    result = _result
+    if result is None or time.monotonic() - result.checked_at >= settings.HEALTHCHECK_READY_CACHE_TTL:
+        with _lock:
+            # another thread may have run the checks while this one waited
+            result = _result
+            if result is None or time.monotonic() - result.checked_at >= settings.HEALTHCHECK_READY_CACHE_TTL:
+                result = _result = _run_checks()
+    return result
+
+
+def clear():
+    """Forget the cached readiness result."""
+    global _result
+
+    with _lock:
+        _result = None
@@ -0,0 +1,258 @@
+"""
+The core application: shared, pooled HTTP sessions for outbound integrations.
+
+Each integration (e.g. analytics, reCAPTCHA) gets a long-lived `requests.Session` per process, whose connection pools keep
+connections to each host alive between requests. Sessions retry idempotent requests on connection errors and on 502, 503
+and 504 responses, with exponential backoff; and keep counters of pool use and connection time, see `stats()`. The latency
+of each request is recorded in `metrics`, by integration and outcome.
+"""
+
+import logging
+import os
+import threading
+import time
+from dataclasses import dataclass, field, fields
+
+import requests
+from django.conf import settings
+from requests.adapters import HTTPAdapter
+from urllib3 import HTTPConnectionPool, HTTPSConnectionPool, PoolManager, Retry
+from urllib3.connection import HTTPConnection, HTTPSConnection
+
+from benefits.core import metrics
+
+logger = logging.getLogger(__name__)
+
+ANALYTICS = "analytics"
+ELIGIBILITY_API = "eligibility_api"
+GOOGLE_SSO = "google_sso"
+KEY_VAULT = "key_vault"
+LITTLEPAY = "littlepay"
+PEM_DATA = "pem_data"
+RECAPTCHA = "recaptcha"
+SWITCHIO = "switchio"
+
+# integrations that handle failures themselves, or whose requests carry single-use tokens (an Eligibility API request token
+# has a unique jti), and shouldn't be retried by the session
+NO_RETRIES = {ANALYTICS, ELIGIBILITY_API}
+
+RETRY_STATUSES = (502, 503, 504)
+
+
+@dataclass
+class Stats:
+    """Counters for an integration's connection pools.
+
+    A request that reuses a kept-alive connection is a pool hit; one that has to open a new connection is a pool miss.
+    """
+
+    requests: int = 0
+    pool_hits: int = 0
+    pool_misses: int = 0
+    connections: int = 0
+    connect_seconds: float = 0.0
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False, compare=False)
+
+    def checkout(self, new):
+        with self._lock:
+            self.requests += 1
+            if new:
+                self.pool_misses += 1
+            else:
+                self.pool_hits += 1
+
+    def connected(self, seconds):
+        with self._lock:
+            self.connections += 1
+            self.connect_seconds += seconds
+
+    def to_dict(self):
+        with self._lock:
+            return {f.name: getattr(self, f.name) for f in fields(self) if f.name != "_lock"}
+
+
+_stats = {}
+_stats_lock = threading.Lock()
+_sessions = {}
+_sessions_lock = threading.Lock()
+
+
+def _stats_for(integration) -> Stats:
+    stats = _stats.get(integration)
+    if stats is None:
+        with _stats_lock:
+            stats = _stats.setdefault(integration, Stats())
+    return stats
+
+
+class _TimedConnectionMixin:
+    stats = None
+
+    def connect(self):
+        start = time.perf_counter()
+        super().connect()
+        if self.stats is not None:
+            self.stats.connected(time.perf_counter() - start)
+
+
+class _HTTPConnection(_TimedConnectionMixin, HTTPConnection):
+    pass
+
+
+class _HTTPSConnection(_TimedConnectionMixin, HTTPSConnection):
+    pass
+
+
+class _CountingPoolMixin:
+    stats = None
+
+    def _get_conn(self, timeout=None):
+        conn = super()._get_conn(timeout=timeout)
+        if self.stats is not None:
+            # a connection without a socket is new, or was dropped by the server, and has to connect
+            self.stats.checkout(new=conn.sock is None)
+        return conn
+
+    def _new_conn(self):
+        conn = super()._new_conn()
+        conn.stats = self.stats
+        return conn
+
+
+class _HTTPConnectionPool(_CountingPoolMixin, HTTPConnectionPool):
+    ConnectionCls = _HTTPConnection
+
+
+class _HTTPSConnectionPool(_CountingPoolMixin, HTTPSConnectionPool):
+    ConnectionCls = _HTTPSConnection
+
+
+class _PoolManager(PoolManager):
+    def __init__(self, *args, stats=None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.stats = stats
+        self.pool_classes_by_scheme = {"http": _HTTPConnectionPool, "https": _HTTPSConnectionPool}
+
+    def _new_pool(self, scheme, host, port, request_context=None):
+        pool = super()._new_pool(scheme, host, port, request_context=request_context)
+        pool.stats = self.stats
+        return pool
+
+
+class PooledAdapter(HTTPAdapter):
+    """HTTPAdapter that counts pool use into `stats`, and optionally makes every connection using an SSLContext.
+
+    With an `integration`, the latency and outcome (status code, or error) of each request is recorded in `metrics`.
+    """
+
+    def __init__(self, stats: Stats, ssl_context=None, integration=None, **kwargs):
+        self.stats = stats
+        self.ssl_context = ssl_context
+        self.integration = integration
+        super().__init__(**kwargs)
+
+    def send(self, request, *args, **kwargs):
+        if self.integration is None:
+            return super().send(request, *args, **kwargs)
+
+        outcome = "error"
+        start = time.perf_counter()
+        try:
+            response = super().send(request, *args, **kwargs)
+            outcome = str(response.status_code)
+            return response
+        finally:
+            metrics.observe_outbound(self.integration, time.perf_counter() - start, outcome)
+
+    def init_poolmanager(self, connections, maxsize, block=False, **pool_kwargs):
+        if self.ssl_context is not None:
+            pool_kwargs["ssl_context"] = self.ssl_context
+        self._pool_connections = connections
+        self._pool_maxsize = maxsize
+        self._pool_block = block
+        self.poolmanager = _PoolManager(num_pools=connections, maxsize=maxsize, block=block, stats=self.stats, **pool_kwargs)
+
+    def proxy_manager_for(self, *args, **kwargs):
+        if self.ssl_context is not None:
+            kwargs["ssl_context"] = self.ssl_context
+        return super().proxy_manager_for(*args, **kwargs)
+
+
+def retries(integration) -> Retry:
+    """The retry policy for requests to the integration."""
+    if integration in NO_RETRIES:
+        return Retry(total=0, read=False, redirect=False, raise_on_status=False)
+
+    return Retry(
+        total=settings.REQUESTS_MAX_RETRIES,
+        backoff_factor=settings.REQUESTS_BACKOFF_FACTOR,
+        status_forcelist=RETRY_STATUSES,
+        raise_on_status=False,
+    )
+
+
+def timeout(integration):
+    """The (connect, read) timeout for requests to the integration."""
+    return settings.REQUESTS_INTEGRATION_TIMEOUTS.get(integration, settings.REQUESTS_TIMEOUT)
+
+
+def adapter(integration, ssl_context=None) -> PooledAdapter:
+    """Create a new pooled adapter for the integration, e.g. to mount on a session created by a third-party client."""
+    return PooledAdapter(
+        _stats_for(integration),
+        ssl_context=ssl_context,
+        integration=integration,
+        pool_connections=settings.REQUESTS_POOL_CONNECTIONS,
+        pool_maxsize=settings.REQUESTS_POOL_MAXSIZE,
+        max_retries=retries(integration),
+    )
+
+
+def new_session(integration, ssl_context=None) -> requests.Session:
+    """Create a new pooled session for the integration, e.g. one that uses a client certificate via `ssl_context`."""
+    pooled = adapter(integration, ssl_context=ssl_context)
+    session = requests.Session()
+    session.mount("https://", pooled)
+    session.mount("http://", pooled)
+    return session
+
+
+def session(integration) -> requests.Session:
+    """Get the pooled session for the integration, shared by all threads in this process."""
+    key = (integration, os.getpid())
+    session = _sessions.get(key)
+    if session is None:
+        with _sessions_lock:
+            session = _sessions.get(key)
+            if session is None:
+                logger.debug(f"Creating pooled HTTP session for: {integration}")
+                session = new_session(integration)
+                _sessions[key] = session
+    return session
+
+
+def get(integration, url, **kwargs) -> requests.Response:
+    """Send a GET request using the integration's pooled session and timeout."""
+    kwargs.setdefault("timeout", timeout(integration))
+    return session(integration).get(url, **kwargs)
+
+
+def post(integration, url, data=None, json=None, **kwargs) -> requests.Response:
+    """Send a POST request using the integration's pooled session and timeout."""
+    kwargs.setdefault("timeout", timeout(integration))
+    return session(integration).post(url, data=data, json=json, **kwargs)
+
+
+def stats() -> dict:
+    """Get the counters for each integration's connection pools, by integration name."""
+    return {integration: s.to_dict() for integration, s in sorted(_stats.items())}
+
+
+def clear():
+    """Close all pooled sessions and reset the counters."""
+    with _sessions_lock:
+        for session in _sessions.values():
+            session.close()
+        _sessions.clear()
+    with _stats_lock:
+        _stats.clear()
@@ -0,0 +1,63 @@
+import datetime
+
+from django.core.management.base import BaseCommand, CommandError
+
+from benefits.core import export
+from benefits.core.models import EnrollmentMethods
+
+
+def _date(value):
+    try:
+        return datetime.date.fromisoformat(value)
+    except ValueError:
+        raise CommandError(f"Invalid date: {value}, expected YYYY-MM-DD")
+
+
+class Command(BaseCommand):
+    help = (
+        "Exports enrollment events, with their agency and flow, as CSV or Parquet, oldest first. "
+        "Events are read a chunk at a time, so memory use doesn't grow with the number of events."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--agency", help="Only events for the transit agency with this slug.")
+        parser.add_argument("--flow", help="Only events for the enrollment flow with this system name.")
+        parser.add_argument(
+            "--method",
+            choices=[EnrollmentMethods.SELF_SERVICE, EnrollmentMethods.IN_PERSON],
+            help="Only events with this enrollment method.",
+        )
+        parser.add_argument("--start", help="Only events on or after this date (YYYY-MM-DD), in the app's time zone.")
+        parser.add_argument("--end", help="Only events on or before this date (YYYY-MM-DD), in the app's time zone.")
+        parser.add_argument("--format", choices=export.FORMATS, default="csv", help="Output format.")
+        parser.add_argument(
+            "--output",
+            help="Path of the file to write. CSV is written to standard output if not given, Parquet requires a path.",
+        )
+
+    def handle(self, *args, **options):
+        queryset = export.enrollment_events(
+            agency=options["agency"],
+            flow=options["flow"],
+            method=options["method"],
+            start=_date(options["start"]) if options["start"] else None,
+            end=_date(options["end"]) if options["end"] else None,
+        )
+        output = options["output"]
+
+        if options["format"] == "parquet":
+            if not output:
+                raise CommandError("--output is required for Parquet")
+            try:
+                count = export.write_parquet(queryset, output)
+            except ImportError:
+                raise CommandError("Parquet export requires the pyarrow package")
+        elif output:
+            with open(output, "w", newline="", encoding="utf-8") as file:
+                count = export.write_csv(queryset, file)
+        else:
+            count = export.write_csv(queryset, self.stdout)
+
+        # with CSV on standard output, the summary would be mixed in with the rows
+        if output:
+            self.stdout.write(self.style.SUCCESS(f"Exported {count} enrollment events to {output}"))
@@ -0,0 +1,184 @@
+import datetime
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+from django.utils import timezone
+from psycopg import sql
+
+from benefits.core.models import EnrollmentEvent
+
+TABLE = EnrollmentEvent._meta.db_table
+PARTITION_COLUMN = EnrollmentEvent._meta.get_field("enrollment_datetime").column
+# rows outside every monthly partition, e.g. for a month that hasn't been created yet
+DEFAULT_PARTITION = f"{TABLE}_default"
+
+
+def month_start(value: datetime.date) -> datetime.date:
+    return value.replace(day=1)
+
+
+def next_month(value: datetime.date) -> datetime.date:
+    return (value.replace(day=1) + datetime.timedelta(days=32)).replace(day=1)
+
+
+def months(first: datetime.date, last: datetime.date) -> list[datetime.date]:
+    """The first day of each month from the month of `first` to the month of `last`, inclusive."""
+    result = []
+    month = month_start(first)
+    while month <= last:
+        result.append(month)
+        month = next_month(month)
+    return result
+
+
+def partition_name(month: datetime.date) -> str:
+    return f"{TABLE}_p{month:%Y_%m}"
+
+
+class Command(BaseCommand):
+    help = (
+        "Creates monthly (UTC) partitions of the EnrollmentEvent table on enrollment_datetime, up to some months ahead. "
+        "With --convert, first converts the table to a partitioned table. Requires PostgreSQL."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--months-ahead",
+            type=int,
+            default=3,
+            help="Number of months after the current month to create partitions for.",
+        )
+        parser.add_argument(
+            "--convert",
+            action="store_true",
+            default=False,
+            help="Convert the table to a partitioned table, copying all rows. Locks the table while it runs.",
+        )
+        parser.add_argument(
+            "--skip-unpartitioned",
+            action="store_true",
+            default=False,
+            help="Do nothing if the table isn't partitioned, e.g. when scheduled before the table is converted.",
+        )
+
+    def handle(self, *args, **options):
+        if connection.vendor != "postgresql":
+            raise CommandError(f"Partitioning requires PostgreSQL, the database is {connection.vendor}")
+
+        # partitions are calendar months in UTC, like the stored datetimes
+        today = timezone.now().date()
+        last = month_start(today)
+        for _ in range(options["months_ahead"]):
+            last = next_month(last)
+
+        with transaction.atomic(), connection.cursor() as cursor:
+            partitioned = self._is_partitioned(cursor)
+
+            if options["convert"]:
+                if partitioned:
+                    raise CommandError(f"{TABLE} is already partitioned")
+                self._convert(cursor, today, last)
+            elif not partitioned:
+                if options["skip_unpartitioned"]:
+                    self.stdout.write(f"{TABLE} is not partitioned, skipping")
+                    return
+                raise CommandError(f"{TABLE} is not partitioned, run with --convert to partition it")
+            else:
+                for month in months(today, last):
+                    self._create_partition(cursor, month)
+
+    def _is_partitioned(self, cursor) -> bool:
+        cursor.execute("SELECT relkind FROM pg_class WHERE oid = to_regclass(%s)", [TABLE])
+        row = cursor.fetchone()
+        if row is None:
+            raise CommandError(f"{TABLE} does not exist, run the migrations first")
+        return row[0] == "p"
+
+    def _create_partition(self, cursor, month: datetime.date):
+        """Create the partition for the month, moving its rows out of the default partition, if it doesn't exist."""
+        name = partition_name(month)
+        cursor.execute("SELECT to_regclass(%s)", [name])
+        if cursor.fetchone()[0] is not None:
+            return
+
+        start, end = sql.Literal(month.isoformat()), sql.Literal(next_month(month).isoformat())
+        in_month = sql.SQL("{column} >= {start} AND {column} < {end}").format(
+            column=sql.Identifier(PARTITION_COLUMN), start=start, end=end
+        )
+        for statement in [
+            sql.SQL("CREATE TABLE {partition} (LIKE {table} INCLUDING DEFAULTS INCLUDING CONSTRAINTS)"),
+            # the default partition can't hold rows for a month once that month has its own partition
+            sql.SQL("INSERT INTO {partition} SELECT * FROM {default} WHERE {in_month}"),
+            sql.SQL("DELETE FROM {default} WHERE {in_month}"),
+            sql.SQL("ALTER TABLE {table} ATTACH PARTITION {partition} FOR VALUES FROM ({start}) TO ({end})"),
+        ]:
+            cursor.execute(
+                statement.format(
+                    table=sql.Identifier(TABLE),
+                    partition=sql.Identifier(name),
+                    default=sql.Identifier(DEFAULT_PARTITION),
+                    in_month=in_month,
+                    start=start,
+                    end=end,
+                )
+            )
+
+        self.stdout.write(f"Created partition {name}")
+
+    def _convert(self, cursor, today: datetime.date, last: datetime.date):
+        """Replace the table with a partitioned table having the same columns, indexes and foreign keys, and rows."""
+        table = sql.Identifier(TABLE)
+        old = sql.Identifier(f"{TABLE}_unpartitioned")
+
+        # the definitions to recreate once the rows are copied; the primary key is recreated including the partition column,
+        # as PostgreSQL requires for a partitioned table
+        cursor.execute(
+            """
+            SELECT pg_get_indexdef(indexrelid) FROM pg_index
+            WHERE indrelid = to_regclass(%s) AND NOT indisprimary
+            """,
+            [TABLE],
+        )
+        indexes = [row[0] for row in cursor.fetchall()]
+        cursor.execute(
+            "SELECT conname, pg_get_constraintdef(oid) FROM pg_constraint WHERE conrelid = to_regclass(%s) AND contype = 'f'",
+            [TABLE],
+        )
+        foreign_keys = cursor.fetchall()
+        cursor.execute(
+            sql.SQL("SELECT min({column}) FROM {table}").format(column=sql.Identifier(PARTITION_COLUMN), table=table)
+        )
+        first = cursor.fetchone()[0]
+
+        cursor.execute(sql.SQL("ALTER TABLE {table} RENAME TO {old}").format(table=table, old=old))
+        cursor.execute(
+            sql.SQL(
+                "CREATE TABLE {table} (LIKE {old} INCLUDING DEFAULTS INCLUDING CONSTRAINTS) PARTITION BY RANGE ({column})"
+            ).format(table=table, old=old, column=sql.Identifier(PARTITION_COLUMN))
+        )
+        cursor.execute(
+            sql.SQL("CREATE TABLE {default} PARTITION OF {table} DEFAULT").format(
+                default=sql.Identifier(DEFAULT_PARTITION), table=table
+            )
+        )
+
+        for month in months(first.date() if first else today, last):
+            self._create_partition(cursor, month)
+
+        cursor.execute(sql.SQL("INSERT INTO {table} SELECT * FROM {old}").format(table=table, old=old))
+        # dropping the old table frees the names of its primary key, indexes and foreign keys
+        cursor.execute(sql.SQL("DROP TABLE {old}").format(old=old))
+        cursor.execute(
+            sql.SQL("ALTER TABLE {table} ADD PRIMARY KEY ({id}, {column})").format(
+                table=table, id=sql.Identifier(EnrollmentEvent._meta.pk.column), column=sql.Identifier(PARTITION_COLUMN)
+            )
+        )
+        for index in indexes:
+            cursor.execute(index)
+        for name, definition in foreign_keys:
+            cursor.execute(
+                sql.SQL("ALTER TABLE {table} ADD CONSTRAINT {name} ").format(table=table, name=sql.Identifier(name))
+                + sql.SQL(definition)
+            )
+
+        self.stdout.write(self.style.SUCCESS(f"Converted {TABLE} to a partitioned table"))
@@ -0,0 +1,48 @@
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from benefits.core import query_budgets
+
+
+class Command(BaseCommand):
+    help = "Lists the routes making the most database queries per request, from a file of recorded query counts."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "path",
+            nargs="?",
+            default=None,
+            help="Path to the query counts file. Defaults to DJANGO_QUERY_COUNTS_FILE.",
+        )
+        parser.add_argument(
+            "--limit",
+            type=int,
+            default=20,
+            help="Number of routes to list, heaviest first.",
+        )
+        parser.add_argument(
+            "--check",
+            action="store_true",
+            default=False,
+            help="Exit with an error if any route made more queries than its budget.",
+        )
+
+    def handle(self, *args, **options):
+        path = options["path"] or settings.QUERY_COUNTS_FILE
+        if not path:
+            raise CommandError("No query counts file, pass a path or set DJANGO_QUERY_COUNTS_FILE")
+
+        try:
+            rows = query_budgets.report(query_budgets.load(path))
+        except FileNotFoundError:
+            raise CommandError(f"Query counts file not found: {path}")
+
+        self.stdout.write(f"{'route':<40} {'requests':>8} {'mean':>6} {'max':>5} {'budget':>6}")
+        for row in rows[: options["limit"]]:
+            budget = "" if row["budget"] is None else row["budget"]
+            line = f"{row['route']:<40} {row['requests']:>8} {row['mean_queries']:>6} {row['max_queries']:>5} {budget:>6}"
+            self.stdout.write(self.style.ERROR(line) if row["over_budget"] else line)
+
+        over_budget = [row["route"] for row in rows if row["over_budget"]]
+        if over_budget and options["check"]:
+            raise CommandError(f"Routes over their query budget: {', '.join(over_budget)}")
@@ -0,0 +1,49 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from benefits.core import analytics
+
+
+class Command(BaseCommand):
+    help = "Replays analytics events spooled to disk while the analytics API was unavailable."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--loop",
+            action="store_true",
+            default=False,
+            help="Keep replaying spooled events every --interval seconds, instead of replaying once.",
+        )
+        parser.add_argument(
+            "--interval",
+            type=float,
+            default=60,
+            help="Seconds to wait between replays when using --loop.",
+        )
+        parser.add_argument(
+            "--max-attempts",
+            type=int,
+            default=5,
+            help="Number of attempts per batch when the analytics API returns a server error or times out.",
+        )
+
+    def _replay(self, spool, max_attempts):
+        result = spool.replay(analytics.client, max_attempts=max_attempts)
+        self.stdout.write(
+            f"Replayed spooled analytics events: {result['sent']} sent, "
+            f"{result['dropped']} dropped, {result['deferred']} deferred"
+        )
+
+    def handle(self, *args, **options):
+        spool = analytics.client.spool
+
+        if not analytics.client.api_key or spool is None:
+            self.stdout.write(self.style.WARNING("Analytics is not configured, nothing to replay"))
+            return
+
+        self._replay(spool, options["max_attempts"])
+
+        while options["loop"]:
+            time.sleep(options["interval"])
+            self._replay(spool, options["max_attempts"])
@@ -0,0 +1,66 @@
+import datetime
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db.models import Min
+from django.utils import timezone
+
+from benefits.core import rollups
+from benefits.core.models import EnrollmentEvent
+
+
+def _date(value):
+    try:
+        return datetime.date.fromisoformat(value)
+    except ValueError:
+        raise CommandError(f"Invalid date: {value}, expected YYYY-MM-DD")
+
+
+class Command(BaseCommand):
+    help = (
+        "Rebuilds the daily rollups of enrollment events from the events, for days before today: by default, the last "
+        "--days days. Safe to run again for the same days."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--days",
+            type=int,
+            default=7,
+            help="Number of days before today to rebuild, when --start isn't given.",
+        )
+        parser.add_argument("--start", help="First day to rebuild (YYYY-MM-DD), in the app's time zone.")
+        parser.add_argument("--end", help="Last day to rebuild (YYYY-MM-DD), in the app's time zone. By default, yesterday.")
+        parser.add_argument(
+            "--all",
+            action="store_true",
+            default=False,
+            help="Rebuild every day from the first enrollment event, e.g. to fill in the rollups for the first time.",
+        )
+
+    def handle(self, *args, **options):
+        today = rollups.today()
+        end = _date(options["end"]) if options["end"] else today - datetime.timedelta(days=1)
+
+        if end >= today:
+            raise CommandError(f"Only days before today can be rebuilt, --end {end} is not")
+
+        if options["all"]:
+            first = EnrollmentEvent.objects.aggregate(first=Min("enrollment_datetime"))["first"]
+            if first is None:
+                self.stdout.write("No enrollment events to roll up")
+                return
+            start = timezone.localtime(first, timezone.get_default_timezone()).date()
+        elif options["start"]:
+            start = _date(options["start"])
+        else:
+            start = today - datetime.timedelta(days=options["days"])
+
+        if start > end:
+            if options["start"]:
+                raise CommandError(f"--start {start} is after --end {end}")
+            # e.g. the first event is from today
+            self.stdout.write("No days before today to rebuild")
+            return
+
+        count = rollups.rebuild(start, end)
+        self.stdout.write(self.style.SUCCESS(f"Rebuilt {count} enrollment rollups from {start} to {end}"))
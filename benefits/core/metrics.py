@@ -0,0 +1,323 @@
+"""
+The core application: always-on, in-process metrics in the Prometheus text format.
+
+Each process keeps its own counters and histograms in memory. With `settings.METRICS_DIR` configured, each process also
+writes a snapshot of its metrics to a file in that directory (at most every `settings.METRICS_FLUSH_INTERVAL` seconds, and
+when it exits), and `collect()` adds up the snapshots of all processes; e.g. all gunicorn workers. The snapshots of exited
+processes are added up into a single snapshot, so that counters only go up without files piling up as workers are replaced.
+"""
+
+import atexit
+import fcntl
+import json
+import logging
+import os
+import re
+import threading
+import time
+import uuid
+
+from django.conf import settings
+
+logger = logging.getLogger(__name__)
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+_lock = threading.Lock()
+_registry = {}
+
+
+class Metric:
+    """A named metric with a value for each combination of label values."""
+
+    type = None
+
+    def __init__(self, name, help, labels=()):
+        self.name = name
+        self.help = help
+        self.labels = tuple(labels)
+        self.values = {}
+        _registry[name] = self
+
+    def _new(self):
+        raise NotImplementedError()
+
+    def _get(self, label_values):
+        if len(label_values) != len(self.labels):
+            raise ValueError(f"{self.name} expects labels {self.labels}, got {label_values}")
+        key = tuple(str(v) for v in label_values)
+        values = self.values.get(key)
+        if values is None:
+            values = self.values[key] = self._new()
+        return values
+
+    def samples(self, key, values):
+        """The (name suffix, extra labels, value) of each sample to expose for the label values."""
+        raise NotImplementedError()
+
+
+class Counter(Metric):
+    type = "counter"
+
+    def _new(self):
+        return [0.0]
+
+    def inc(self, *label_values, amount=1):
+        with _lock:
+            self._get(label_values)[0] += amount
+
+    def samples(self, key, values):
+        yield "", {}, values[0]
+
+
+class Histogram(Metric):
+    """A histogram of observed values: a cumulative count for each bucket, their sum and count."""
+
+    type = "histogram"
+
+    def __init__(self, name, help, labels=(), buckets=DEFAULT_BUCKETS):
+        super().__init__(name, help, labels)
+        self.buckets = tuple(sorted(buckets))
+
+    def _new(self):
+        # a count per bucket, then the sum and the count of all values
+        return [0.0] * (len(self.buckets) + 2)
+
+    def observe(self, value, *label_values):
+        with _lock:
+            values = self._get(label_values)
+            for i, bound in enumerate(self.buckets):
+                if value <= bound:
+                    values[i] += 1
+            values[-2] += value
+            values[-1] += 1
+
+    def samples(self, key, values):
+        for bound, count in zip(self.buckets, values):
+            yield "_bucket", {"le": _format(bound)}, count
+        yield "_bucket", {"le": "+Inf"}, values[-1]
+        yield "_sum", {}, values[-2]
+        yield "_count", {}, values[-1]
+
+
+REQUEST_DURATION = Histogram(
+    "benefits_request_duration_seconds", "Time to handle a request, by route.", ("route", "method", "status")
+)
+DB_QUERIES = Counter("benefits_db_queries_total", "Database queries made while handling requests, by route.", ("route",))
+DB_QUERY_DURATION = Counter(
+    "benefits_db_query_seconds_total", "Time spent on database queries while handling requests, by route.", ("route",)
+)
+SESSION_COOKIE_WRITES = Counter(
+    "benefits_session_cookie_writes_total", "Responses that set the session cookie, by route.", ("route",)
+)
+OUTBOUND_DURATION = Histogram(
+    "benefits_outbound_request_duration_seconds",
+    "Time for a request to an integration, by its outcome (the HTTP status code, or error).",
+    ("integration", "outcome"),
+)
+ENROLLMENTS = Counter(
+    "benefits_enrollments_total",
+    "Enrollment attempts by their result.",
+    ("status", "transit_processor", "enrollment_method"),
+)
+
+
+def observe_request(route, method, status, seconds, queries, query_seconds):
+    REQUEST_DURATION.observe(seconds, route, method, status)
+    DB_QUERIES.inc(route, amount=queries)
+    DB_QUERY_DURATION.inc(route, amount=query_seconds)
+
+
+def count_session_cookie_write(route):
+    SESSION_COOKIE_WRITES.inc(route)
+
+
+def observe_outbound(integration, seconds, outcome):
+    OUTBOUND_DURATION.observe(seconds, integration, outcome)
+
+
+def count_enrollment(status, transit_processor, enrollment_method):
+    ENROLLMENTS.inc(status, transit_processor, enrollment_method)
+
+
+def snapshot() -> dict:
+    """The values of each metric in this process, by metric name."""
+    with _lock:
+        return {name: [[list(key), list(values)] for key, values in m.values.items()] for name, m in _registry.items()}
+
+
+def merge(snapshots) -> dict:
+    """Add up the values of each metric in the snapshots."""
+    merged = {}
+    for snap in snapshots:
+        for name, entries in snap.items():
+            metric = merged.setdefault(name, {})
+            for key, values in entries:
+                key = tuple(key)
+                total = metric.get(key)
+                if total is None or len(total) != len(values):
+                    metric[key] = list(values)
+                else:
+                    metric[key] = [a + b for a, b in zip(total, values)]
+    return merged
+
+
+def _format(value):
+    return str(int(value)) if float(value).is_integer() else repr(float(value))
+
+
+def _escape(value):
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def render(merged: dict) -> str:
+    """The Prometheus text format for the merged metric values."""
+    lines = []
+    for name, metric in sorted(_registry.items()):
+        lines.append(f"# HELP {name} {metric.help}")
+        lines.append(f"# TYPE {name} {metric.type}")
+        for key, values in sorted(merged.get(name, {}).items()):
+            for suffix, extra, value in metric.samples(key, values):
+                labels = {**dict(zip(metric.labels, key)), **extra}
+                label_str = ",".join(f'{k}="{_escape(v)}"' for k, v in labels.items())
+                label_str = f"{{{label_str}}}" if label_str else ""
+                lines.append(f"{name}{suffix}{label_str} {_format(value)}")
+    return "\n".join(lines) + "\n"
+
+
+_flushed_at = 0.0
+_atexit_registered = False
+_process = None
+
+# a process's snapshot, named by its pid and a random id
+_SNAPSHOT_NAME = re.compile(r"^metrics-(\d+)-[0-9a-f]+\.json$")
+# the snapshots of exited processes, added up
+EXITED_SNAPSHOT = "metrics-exited.json"
+
+
+def _snapshot_name():
+    """The name of this process's snapshot file, with a random id so a later process with the same pid doesn't overwrite it."""
+    global _process
+
+    pid = os.getpid()
+    # a forked process gets its own name
+    if _process is None or _process[0] != pid:
+        _process = (pid, f"metrics-{pid}-{uuid.uuid4().hex}.json")
+    return _process[1]
+
+
+def _write_snapshot(path, snap):
+    # write then rename, so readers never see a partial snapshot
+    with open(f"{path}.tmp", "w") as f:
+        json.dump(snap, f)
+    os.replace(f"{path}.tmp", path)
+
+
+def flush(force=False):
+    """Write this process's snapshot to `settings.METRICS_DIR`, at most every `settings.METRICS_FLUSH_INTERVAL` seconds."""
+    global _flushed_at, _atexit_registered
+
+    directory = settings.METRICS_DIR
+    if not directory:
+        return
+
+    now = time.monotonic()
+    if not force and now - _flushed_at < settings.METRICS_FLUSH_INTERVAL:
+        return
+    _flushed_at = now
+
+    if not _atexit_registered:
+        atexit.register(flush, force=True)
+        _atexit_registered = True
+
+    path = os.path.join(directory, _snapshot_name())
+    try:
+        os.makedirs(directory, exist_ok=True)
+        _write_snapshot(path, snapshot())
+    except OSError:
+        logger.exception(f"Failed to write metrics snapshot: {path}")
+
+
+def _read_snapshot(path):
+    try:
+        with open(path) as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError):
+        logger.warning(f"Skipping unreadable metrics snapshot: {path}")
+        return None
+
+
+def _read_snapshots(directory):
+    for entry in os.scandir(directory):
+        if entry.name.startswith("metrics-") and entry.name.endswith(".json"):
+            snap = _read_snapshot(entry.path)
+            if snap is not None:
+                yield snap
+
+
+def _alive(pid):
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        # the process exists, but belongs to another user
+        return True
+    return True
+
+
+def _prune(directory):
+    """Add the snapshots of exited processes into the snapshot of exited processes, and remove them."""
+    exited = [
+        entry.path
+        for entry in os.scandir(directory)
+        if (match := _SNAPSHOT_NAME.match(entry.name)) and not _alive(int(match.group(1)))
+    ]
+    if not exited:
+        return
+
+    # one process at a time, so a snapshot isn't added twice
+    with open(os.path.join(directory, ".lock"), "w") as lock:
+        fcntl.flock(lock, fcntl.LOCK_EX)
+
+        # another process may have pruned them while this one waited for the lock
+        exited = [path for path in exited if os.path.exists(path)]
+        if not exited:
+            return
+
+        exited_path = os.path.join(directory, EXITED_SNAPSHOT)
+        merged = merge(snap for snap in map(_read_snapshot, [exited_path, *exited]) if snap is not None)
+        _write_snapshot(exited_path, {name: [[list(key), values] for key, values in m.items()] for name, m in merged.items()})
+        for path in exited:
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+
+
+def collect() -> str:
+    """The metrics of this process, or of all processes writing to `settings.METRICS_DIR`, in the Prometheus text format."""
+    directory = settings.METRICS_DIR
+    if not directory:
+        return render(merge([snapshot()]))
+
+    flush(force=True)
+    try:
+        _prune(directory)
+    except OSError:
+        logger.exception(f"Failed to prune metrics snapshots: {directory}")
+    return render(merge(_read_snapshots(directory)))
+
+
+def clear():
+    """Reset the values of all metrics in this process."""
+    global _flushed_at
+
+    with _lock:
+        for metric in _registry.values():
+            metric.values.clear()
+    _flushed_at = 0.0
@@ -2,22 +2,27 @@
 The core application: middleware definitions for request/response cycle.
 """
 
+import atexit
+import hmac
 import logging
+import time
 
 from django.conf import settings
-from django.http import HttpResponse
+from django.http import HttpResponse, HttpResponseForbidden, JsonResponse
 from django.template.response import TemplateResponse
 from django.urls import reverse
 from django.utils.decorators import decorator_from_middleware
 from django.utils.deprecation import MiddlewareMixin
 from django.views import i18n
 
-from benefits.core import analytics, recaptcha, session
+from benefits.core import analytics, health, metrics, query_budgets, recaptcha, session
 from benefits.routes import routes
 
 logger = logging.getLogger(__name__)
 
 HEALTHCHECK_PATH = "/healthcheck"
+READINESS_PATH = "/healthcheck/ready"
+METRICS_PATH = "/metrics"
 TEMPLATE_USER_ERROR = "200-user-error.html"
 
 
@@ -57,27 +62,91 @@ class DebugSession(MiddlewareMixin):
         return None
 
 
+def healthy():
+    return HttpResponse("Healthy", content_type="text/plain")
+
+
 class Healthcheck:
-    """Middleware intercepts and accepts /healthcheck requests."""
+    """Middleware intercepts and accepts /healthcheck requests, and answers /healthcheck/ready with the readiness checks.
+
+    Sits at the top of `settings.MIDDLEWARE`, so that probes skip the session, locale and message middleware.
+    """
 
     def __init__(self, get_response):
         self.get_response = get_response
 
     def __call__(self, request):
         if request.path == HEALTHCHECK_PATH:
-            return HttpResponse("Healthy", content_type="text/plain")
+            return healthy()
+        if request.path == READINESS_PATH:
+            readiness = health.readiness()
+            return JsonResponse(readiness.to_dict(), status=200 if readiness.ready else 503)
         return self.get_response(request)
 
 
-class HealthcheckUserAgents(MiddlewareMixin):
+class Metrics:
+    """Middleware records metrics for each request by route, and serves /metrics requests bearing the METRICS_TOKEN."""
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        if request.path == METRICS_PATH and settings.METRICS_TOKEN:
+            return self.serve(request)
+
+        start = time.perf_counter()
+        with query_budgets.counting() as counter:
+            response = self.get_response(request)
+        seconds = time.perf_counter() - start
+
+        match = getattr(request, "resolver_match", None)
+        if match is not None:
+            metrics.observe_request(
+                match.view_name, request.method, response.status_code, seconds, counter.count, counter.seconds
+            )
+            if settings.SESSION_COOKIE_NAME in response.cookies:
+                metrics.count_session_cookie_write(match.view_name)
+            metrics.flush()
+
+        return response
+
+    def serve(self, request):
+        expected = f"Bearer {settings.METRICS_TOKEN}"
+        if not hmac.compare_digest(request.headers.get("Authorization", "").encode(), expected.encode()):
+            return HttpResponseForbidden()
+        return HttpResponse(metrics.collect(), content_type=metrics.CONTENT_TYPE)
+
+
+class QueryCount:
+    """Middleware records the number of database queries made for each request, by route."""
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if settings.QUERY_COUNTS_FILE:
+            atexit.register(query_budgets.save, settings.QUERY_COUNTS_FILE)
+
+    def __call__(self, request):
+        with query_budgets.counting() as counter:
+            response = self.get_response(request)
+
+        match = getattr(request, "resolver_match", None)
+        if match is not None:
+            violation = query_budgets.record(match.view_name, request.path, counter.count)
+            if violation:
+                logger.warning(f"Query budget exceeded: {violation}")
+
+        return response
+
+
+class HealthcheckUserAgents:
     """Middleware to return healthcheck for user agents specified in HEALTHCHECK_USER_AGENTS."""
 
-    def process_request(self, request):
-        if hasattr(request, "META"):
-            user_agent = request.META.get("HTTP_USER_AGENT", "")
-            if user_agent in settings.HEALTHCHECK_USER_AGENTS:
-                return HttpResponse("Healthy", content_type="text/plain")
+    def __init__(self, get_response):
+        self.get_response = get_response
 
+    def __call__(self, request):
+        if request.META.get("HTTP_USER_AGENT", "") in settings.HEALTHCHECK_USER_AGENTS:
+            return healthy()
         return self.get_response(request)
 
 
@@ -0,0 +1,20 @@
+# Generated by Django 5.2.17 on 2026-10-18 18:15
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("core", "0007_alter_enrollmentflow_system_name"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ConfigurationVersion",
+            fields=[
+                ("id", models.AutoField(primary_key=True, serialize=False)),
+                ("version", models.PositiveBigIntegerField(default=0)),
+            ],
+        ),
+    ]
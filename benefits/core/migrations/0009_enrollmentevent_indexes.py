@@ -0,0 +1,44 @@
+# Generated by Django 5.2.17 on 2026-10-18 19:09
+
+from django.contrib.postgres.operations import AddIndexConcurrently as PostgresAddIndexConcurrently
+from django.db import migrations, models
+
+
+class AddIndexConcurrently(PostgresAddIndexConcurrently):
+    """Build the index without blocking writes to the table on PostgreSQL; like `AddIndex` on other databases."""
+
+    def database_forwards(self, app_label, schema_editor, from_state, to_state):
+        if schema_editor.connection.vendor == "postgresql":
+            super().database_forwards(app_label, schema_editor, from_state, to_state)
+        else:
+            migrations.AddIndex.database_forwards(self, app_label, schema_editor, from_state, to_state)
+
+    def database_backwards(self, app_label, schema_editor, from_state, to_state):
+        if schema_editor.connection.vendor == "postgresql":
+            super().database_backwards(app_label, schema_editor, from_state, to_state)
+        else:
+            migrations.AddIndex.database_backwards(self, app_label, schema_editor, from_state, to_state)
+
+
+class Migration(migrations.Migration):
+    # CREATE INDEX CONCURRENTLY can't run inside a transaction
+    atomic = False
+
+    dependencies = [
+        ("core", "0008_configurationversion"),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name="enrollmentevent",
+            index=models.Index(fields=["enrollment_datetime"], name="enrollmentevent_dt_idx"),
+        ),
+        AddIndexConcurrently(
+            model_name="enrollmentevent",
+            index=models.Index(fields=["transit_agency", "enrollment_datetime"], name="enrollmentevent_agency_dt_idx"),
+        ),
+        AddIndexConcurrently(
+            model_name="enrollmentevent",
+            index=models.Index(fields=["enrollment_flow", "enrollment_datetime"], name="enrollmentevent_flow_dt_idx"),
+        ),
+    ]
@@ -0,0 +1,40 @@
+# Generated by Django 5.2.17 on 2026-10-18 19:20
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("core", "0009_enrollmentevent_indexes"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="EnrollmentRollup",
+            fields=[
+                ("id", models.AutoField(primary_key=True, serialize=False)),
+                ("day", models.DateField()),
+                (
+                    "enrollment_method",
+                    models.TextField(choices=[("self_service", "self_service"), ("in_person", "in_person")]),
+                ),
+                ("enrollments", models.PositiveIntegerField(default=0)),
+                (
+                    "with_expiration",
+                    models.PositiveIntegerField(default=0, help_text="Enrollments with an expiration datetime"),
+                ),
+                ("with_extra_claims", models.PositiveIntegerField(default=0, help_text="Enrollments with extra claims")),
+                ("enrollment_flow", models.ForeignKey(on_delete=django.db.models.deletion.PROTECT, to="core.enrollmentflow")),
+                ("transit_agency", models.ForeignKey(on_delete=django.db.models.deletion.PROTECT, to="core.transitagency")),
+            ],
+            options={
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("day", "transit_agency", "enrollment_flow", "enrollment_method"), name="enrollmentrollup_key"
+                    )
+                ],
+            },
+        ),
+    ]
@@ -1,24 +1,28 @@
-from .common import Environment, PemData, SecretNameField, template_path
+from .common import ConfigurationVersion, Environment, PemData, SecretNameField, secret_names, template_path
 from .enrollment import (
     EligibilityApiVerificationRequest,
     EnrollmentEvent,
     EnrollmentFlow,
     EnrollmentGroup,
     EnrollmentMethods,
+    EnrollmentRollup,
     SystemName,
 )
 from .transit import CardSchemes, TransitAgency, TransitAgencyGroup, TransitProcessorConfig, agency_logo
 
 __all__ = [
     "agency_logo",
+    "secret_names",
     "template_path",
     "CardSchemes",
+    "ConfigurationVersion",
     "Environment",
     "EnrollmentMethods",
     "EligibilityApiVerificationRequest",
     "EnrollmentFlow",
     "EnrollmentGroup",
     "EnrollmentEvent",
+    "EnrollmentRollup",
     "PemData",
     "SecretNameField",
     "SystemName",
@@ -1,12 +1,13 @@
 import logging
-from functools import cached_property
+import time
 from pathlib import Path
 
-import requests
 from django import template
+from django.apps import apps
 from django.conf import settings
 from django.db import models
 
+from benefits.core import http
 from benefits.secrets import NAME_VALIDATOR, get_secret_by_name
 
 logger = logging.getLogger(__name__)
@@ -63,6 +64,21 @@ class SecretNameField(models.SlugField):
         return get_secret_by_name(secret_name)
 
 
+def secret_names() -> list[str]:
+    """Get the names of all secrets used by the app's configuration.
+
+    Includes the values of every `SecretNameField`, and the names listed in each model's `shared_secret_names`.
+    """
+    names = set()
+    for model in apps.get_models():
+        names.update(getattr(model, "shared_secret_names", ()))
+        fields = [field.attname for field in model._meta.local_concrete_fields if isinstance(field, SecretNameField)]
+        if fields:
+            for values in model.objects.values_list(*fields):
+                names.update(value for value in values if value)
+    return sorted(names)
+
+
 class PemData(models.Model):
     """API Certificate or Key in PEM format."""
 
@@ -76,11 +92,23 @@ class PemData(models.Model):
     def __str__(self):
         return self.label
 
-    @cached_property
+    @property
     def data(self):
         """
         Attempts to get data from `remote_url` or `text_secret_name`, with the latter taking precendence if both are defined.
+
+        The data is kept for `settings.SECRETS_CACHE_TTL` seconds, then read again, so a rotated secret or an updated remote
+        file is picked up by instances kept in the configuration cache.
         """
+        cached = self.__dict__.get("_data")
+        if cached is not None and time.monotonic() - cached[1] < settings.SECRETS_CACHE_TTL:
+            return cached[0]
+
+        data = self._read_data()
+        self.__dict__["_data"] = (data, time.monotonic())
+        return data
+
+    def _read_data(self):
         remote_data = None
         secret_data = None
 
@@ -92,6 +120,31 @@ class PemData(models.Model):
                 secret_data = None
 
         if secret_data is None and self.remote_url:
-            remote_data = requests.get(self.remote_url, timeout=settings.REQUESTS_TIMEOUT).text
+            remote_data = http.get(http.PEM_DATA, self.remote_url).text
 
         return secret_data if secret_data is not None else remote_data
+
+
+class ConfigurationVersion(models.Model):
+    """A single-row counter, increased whenever configuration data changes.
+
+    Each process compares this value with the version of its in-memory configuration cache (see `benefits.core.cache`)
+    to find out about changes made by other processes.
+    """
+
+    id = models.AutoField(primary_key=True)
+    version = models.PositiveBigIntegerField(default=0)
+
+    def __str__(self):
+        return str(self.version)
+
+    @staticmethod
+    def current():
+        """Get the current configuration version."""
+        return ConfigurationVersion.objects.filter(pk=1).values_list("version", flat=True).first() or 0
+
+    @staticmethod
+    def increment():
+        """Increase the configuration version."""
+        if not ConfigurationVersion.objects.filter(pk=1).update(version=models.F("version") + 1):
+            ConfigurationVersion.objects.get_or_create(pk=1, defaults={"version": 1})
@@ -271,7 +271,47 @@ class EnrollmentEvent(models.Model):
     expiration_datetime = models.DateTimeField(blank=True, null=True)
     extra_claims = models.TextField(blank=True, default="")
 
+    class Meta:
+        # for the Admin's list, ordered by time and filtered by agency or flow, and for reporting
+        indexes = [
+            models.Index(fields=["enrollment_datetime"], name="enrollmentevent_dt_idx"),
+            models.Index(fields=["transit_agency", "enrollment_datetime"], name="enrollmentevent_agency_dt_idx"),
+            models.Index(fields=["enrollment_flow", "enrollment_datetime"], name="enrollmentevent_flow_dt_idx"),
+        ]
+
     def __str__(self):
         dt = timezone.localtime(self.enrollment_datetime)
         ts = dt.strftime("%b %d, %Y, %I:%M %p")
         return f"{ts}, {self.transit_agency}, {self.enrollment_flow}"
+
+
+class EnrollmentRollup(models.Model):
+    """The number of enrollment events for an agency, flow and enrollment method on a day (in the app's time zone).
+
+    Kept up to date as events are recorded, and rebuilt from the events by the `rollup_enrollment_events` command.
+    """
+
+    id = models.AutoField(primary_key=True)
+    day = models.DateField()
+    transit_agency = models.ForeignKey("core.TransitAgency", on_delete=models.PROTECT)
+    enrollment_flow = models.ForeignKey(EnrollmentFlow, on_delete=models.PROTECT)
+    enrollment_method = models.TextField(
+        choices={
+            EnrollmentMethods.SELF_SERVICE: EnrollmentMethods.SELF_SERVICE,
+            EnrollmentMethods.IN_PERSON: EnrollmentMethods.IN_PERSON,
+        }
+    )
+    enrollments = models.PositiveIntegerField(default=0)
+    with_expiration = models.PositiveIntegerField(default=0, help_text="Enrollments with an expiration datetime")
+    with_extra_claims = models.PositiveIntegerField(default=0, help_text="Enrollments with extra claims")
+
+    class Meta:
+        constraints = [
+            # also the index for reading a range of days
+            models.UniqueConstraint(
+                fields=["day", "transit_agency", "enrollment_flow", "enrollment_method"], name="enrollmentrollup_key"
+            )
+        ]
+
+    def __str__(self):
+        return f"{self.day}, {self.transit_agency}, {self.enrollment_flow}, {self.enrollment_method}"
@@ -132,16 +132,40 @@ class TransitAgency(models.Model):
     @property
     def index_url(self):
         """Public-facing URL to the TransitAgency's landing page."""
+        urls = self._cached_urls()
+        if urls and urls.index_url:
+            return urls.index_url
+
         return reverse(routes.AGENCY_INDEX, args=[self.slug])
 
     @property
     def entrypoint_url(self):
         """For grouped agencies, we display an interstitial view prior to commencing the eligibility check."""
+        urls = self._cached_urls()
+        if urls:
+            return urls.entrypoint_url
+
         if self.group_agencies():
             return reverse(routes.ADDITIONAL_AGENCIES)
 
         return reverse(routes.ELIGIBILITY_INDEX)
 
+    def _cached_urls(self):
+        """The URLs of this agency as saved, from the configuration cache; computed for all agencies at once.
+
+        None for an unsaved agency, or one whose slug has been changed but not saved, so its URLs are computed from it.
+        """
+        if self.pk is None:
+            return None
+
+        from benefits.core import cache
+
+        urls = cache.agency_urls(self.pk)
+        if urls is None or urls.slug != self.slug:
+            return None
+
+        return urls
+
     @property
     def littlepay_config(self):
         if self.transit_processor_config and hasattr(self.transit_processor_config, "littlepayconfig"):
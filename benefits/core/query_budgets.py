@@ -0,0 +1,200 @@
+"""
+The core application: database query counts and budgets, per route.
+
+`QueryCount` middleware records the number of queries made while handling each request, by the route (URL name) it
+resolved to. A route with a budget in `BUDGETS` that makes more queries than its budget for a request is a violation:
+logged at runtime, and a failure in the test suite. See `docs/guides/automated-tests.md`.
+"""
+
+import glob
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field, fields
+
+from django.db import connections
+
+from benefits.routes import routes
+
+# the most queries each route may make while handling a request, with empty caches (e.g. the first request to a new process)
+BUDGETS = {
+    routes.INDEX: 4,
+    routes.HELP: 2,
+    routes.LOGGED_OUT: 0,
+    routes.AGENCY_INDEX: 6,
+    routes.ELIGIBILITY_INDEX: 5,
+    routes.ELIGIBILITY_START: 5,
+    routes.ELIGIBILITY_CONFIRM: 5,
+    routes.ENROLLMENT_INDEX: 4,
+    routes.ENROLLMENT_LITTLEPAY_INDEX: 7,
+    routes.ENROLLMENT_LITTLEPAY_TOKEN: 2,
+    routes.ENROLLMENT_SWITCHIO_INDEX: 7,
+    routes.ENROLLMENT_SWITCHIO_GATEWAY_URL: 2,
+    routes.ENROLLMENT_SUCCESS: 6,
+}
+
+
+@dataclass
+class RouteStats:
+    """Query counts for the requests handled by a route."""
+
+    requests: int = 0
+    queries: int = 0
+    max_queries: int = 0
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False, compare=False)
+
+    def add(self, queries):
+        with self._lock:
+            self.requests += 1
+            self.queries += queries
+            self.max_queries = max(self.max_queries, queries)
+
+    def to_dict(self):
+        with self._lock:
+            return {f.name: getattr(self, f.name) for f in fields(self) if f.name != "_lock"}
+
+
+@dataclass
+class Violation:
+    """A request that made more queries than its route's budget."""
+
+    route: str
+    path: str
+    queries: int
+    budget: int
+
+    def __str__(self):
+        return f"{self.route} ({self.path}) made {self.queries} queries, budget is {self.budget}"
+
+
+_stats = {}
+_violations = []
+_lock = threading.Lock()
+
+
+class _Counter:
+    def __init__(self):
+        self.count = 0
+        self.seconds = 0.0
+
+    def __call__(self, execute, sql, params, many, context):
+        self.count += 1
+        start = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.seconds += time.perf_counter() - start
+
+
+@contextmanager
+def counting():
+    """Count the queries made on all database connections in this thread, while in the block."""
+    counter = _Counter()
+    wrappers = [connection.execute_wrapper(counter) for connection in connections.all()]
+    for wrapper in wrappers:
+        wrapper.__enter__()
+    try:
+        yield counter
+    finally:
+        for wrapper in reversed(wrappers):
+            wrapper.__exit__(None, None, None)
+
+
+def record(route, path, queries) -> Violation | None:
+    """Record the query count for a request to the route, returning a Violation if the count is over its budget."""
+    stats = _stats.get(route)
+    if stats is None:
+        with _lock:
+            stats = _stats.setdefault(route, RouteStats())
+    stats.add(queries)
+
+    budget = BUDGETS.get(route)
+    if budget is not None and queries > budget:
+        violation = Violation(route=route, path=path, queries=queries, budget=budget)
+        with _lock:
+            _violations.append(violation)
+        return violation
+
+    return None
+
+
+def stats() -> dict:
+    """Get the query counts for each route, by route name."""
+    return {route: s.to_dict() for route, s in sorted(_stats.items())}
+
+
+def violations() -> list[Violation]:
+    """Get the requests that were over budget since the last `clear_violations()`."""
+    with _lock:
+        return list(_violations)
+
+
+def clear_violations():
+    with _lock:
+        _violations.clear()
+
+
+def clear():
+    """Forget all query counts and violations."""
+    with _lock:
+        _stats.clear()
+        _violations.clear()
+
+
+def save(path):
+    """Write this process's query counts for each route to a JSON file, for the `query_counts` command.
+
+    Each process writes its own file, `<path>.<pid>`, so the processes of a server don't overwrite each other's counts.
+    """
+    path = f"{path}.{os.getpid()}"
+    # write then rename, so readers never see a partial file
+    with open(f"{path}.tmp", "w") as f:
+        json.dump(stats(), f, indent=2)
+    os.replace(f"{path}.tmp", path)
+
+
+def _merge(route_stats: dict, other: dict):
+    for route, s in other.items():
+        merged = route_stats.setdefault(route, {"requests": 0, "queries": 0, "max_queries": 0})
+        merged["requests"] += s["requests"]
+        merged["queries"] += s["queries"]
+        merged["max_queries"] = max(merged["max_queries"], s["max_queries"])
+
+
+def load(path) -> dict:
+    """Read the query counts for each route written by `save()` in every process, and from a file at `path` itself.
+
+    The counts of each route are added up, with the most queries for a request in any process. Raises `FileNotFoundError`
+    if there are no files.
+    """
+    paths = [p for p in glob.glob(f"{glob.escape(str(path))}.*") if p.rsplit(".", 1)[-1].isdigit()]
+    if os.path.exists(path):
+        paths.append(path)
+    if not paths:
+        raise FileNotFoundError(path)
+
+    route_stats = {}
+    for p in sorted(paths):
+        with open(p) as f:
+            _merge(route_stats, json.load(f))
+    return dict(sorted(route_stats.items()))
+
+
+def report(route_stats: dict) -> list[dict]:
+    """Rows for each route with its counts and budget, heaviest (by most queries for a request) first."""
+    rows = []
+    for route, s in route_stats.items():
+        budget = BUDGETS.get(route)
+        rows.append(
+            dict(
+                route=route,
+                requests=s["requests"],
+                mean_queries=round(s["queries"] / s["requests"], 1) if s["requests"] else 0,
+                max_queries=s["max_queries"],
+                budget=budget,
+                over_budget=budget is not None and s["max_queries"] > budget,
+            )
+        )
+    return sorted(rows, key=lambda r: (r["max_queries"], r["mean_queries"]), reverse=True)
@@ -2,9 +2,10 @@
 The core application: helpers to work with reCAPTCHA.
 """
 
-import requests
 from django.conf import settings
 
+from . import http
+
 DATA_FIELD = "g-recaptcha-response"
 
 
@@ -25,6 +26,6 @@ def verify(form_data: dict) -> bool:
         return False
 
     payload = dict(secret=settings.RECAPTCHA_SECRET_KEY, response=form_data[DATA_FIELD])
-    response = requests.post(settings.RECAPTCHA_VERIFY_URL, payload, timeout=settings.REQUESTS_TIMEOUT).json()
+    response = http.post(http.RECAPTCHA, settings.RECAPTCHA_VERIFY_URL, payload).json()
 
     return bool(response["success"])
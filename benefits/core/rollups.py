@@ -0,0 +1,100 @@
+"""
+The core application: daily rollups of enrollment events, for reporting without reading every event.
+"""
+
+import datetime
+
+from django.db import connection, transaction
+from django.db.models import Count, Q
+from django.db.models.functions import TruncDate
+from django.utils import timezone
+
+from benefits.core.models import EnrollmentEvent, EnrollmentRollup
+
+COUNTS = ["enrollments", "with_expiration", "with_extra_claims"]
+KEY = ["day", "transit_agency_id", "enrollment_flow_id", "enrollment_method"]
+
+
+def day_start(day: datetime.date) -> datetime.datetime:
+    """The start of the day in the app's time zone."""
+    return timezone.make_aware(datetime.datetime.combine(day, datetime.time.min), timezone.get_default_timezone())
+
+
+def _key(event):
+    day = timezone.localtime(event.enrollment_datetime, timezone.get_default_timezone()).date()
+    return (day, event.transit_agency_id, event.enrollment_flow_id, event.enrollment_method)
+
+
+def record(events):
+    """Add newly created enrollment events to the rollups of their days, in a single query.
+
+    Rows are added to concurrently (INSERT ... ON CONFLICT DO UPDATE, on both PostgreSQL and SQLite) instead of being
+    read and written back, so simultaneous enrollments don't overwrite each other's counts.
+    """
+    counts = {}
+    for event in events:
+        row_counts = counts.setdefault(_key(event), [0, 0, 0])
+        row_counts[0] += 1
+        row_counts[1] += event.expiration_datetime is not None
+        row_counts[2] += bool(event.extra_claims)
+    if not counts:
+        return
+
+    qn = connection.ops.quote_name
+    table = qn(EnrollmentRollup._meta.db_table)
+    key_columns = [qn(EnrollmentRollup._meta.get_field(name).column) for name in KEY]
+    count_columns = [qn(name) for name in COUNTS]
+    columns = key_columns + count_columns
+    day_field = EnrollmentRollup._meta.get_field("day")
+
+    values = ", ".join(["(" + ", ".join(["%s"] * len(columns)) + ")"] * len(counts))
+    updates = ", ".join(f"{column} = {table}.{column} + excluded.{column}" for column in count_columns)
+    params = [
+        value
+        for (day, *key), row_counts in counts.items()
+        for value in (day_field.get_db_prep_value(day, connection), *key, *row_counts)
+    ]
+
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f"INSERT INTO {table} ({', '.join(columns)}) VALUES {values} "
+            f"ON CONFLICT ({', '.join(key_columns)}) DO UPDATE SET {updates}",
+            params,
+        )
+
+
+def rollups(start: datetime.date, end: datetime.date):
+    """The rollups of the days from `start` up to and including `end`, computed from the enrollment events."""
+    return (
+        EnrollmentEvent.objects.filter(enrollment_datetime__gte=day_start(start))
+        .filter(enrollment_datetime__lt=day_start(end + datetime.timedelta(days=1)))
+        .annotate(day=TruncDate("enrollment_datetime", tzinfo=timezone.get_default_timezone()))
+        .values(*KEY)
+        .annotate(
+            enrollments=Count("pk"),
+            with_expiration=Count("pk", filter=Q(expiration_datetime__isnull=False)),
+            with_extra_claims=Count("pk", filter=~Q(extra_claims="")),
+        )
+        .order_by()
+    )
+
+
+def today() -> datetime.date:
+    """The current day in the app's time zone."""
+    return timezone.localdate(timezone=timezone.get_default_timezone())
+
+
+def rebuild(start: datetime.date, end: datetime.date) -> int:
+    """Replace the rollups of the days from `start` up to and including `end` with rollups computed from the enrollment
+    events, returning the number of rollups written.
+
+    Only days that are over can be rebuilt: events are recorded with the current time, so once the enrollments in progress
+    at midnight have finished, nothing else writes to those days' rollups while they are rebuilt. Running it again for the
+    same days gives the same rollups.
+    """
+    if end >= today():
+        raise ValueError(f"Only days before today can be rebuilt, not {end}")
+
+    with transaction.atomic():
+        EnrollmentRollup.objects.filter(day__gte=start, day__lte=end).delete()
+        return len(EnrollmentRollup.objects.bulk_create(EnrollmentRollup(**row) for row in rollups(start, end)))
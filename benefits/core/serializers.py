@@ -0,0 +1,241 @@
+"""
+The core application: a compact serializer for session data.
+
+With the signed cookie session engine, the whole session is serialized, signed and sent in a cookie with every request and
+response. `CompactSerializer` encodes the same JSON-compatible values as Django's `JSONSerializer` in fewer bytes:
+
+* dictionary keys used by the app (e.g. `enrollment_littlepay_access_token_expiry`) are written as a one byte code
+* integers, and floats with no fractional part (e.g. timestamps), are written as variable-length binary integers
+* UUID strings (e.g. the session's `uid` and `did`) are written as their 16 bytes
+
+Django compresses the serialized data with zlib when that makes it smaller, see `django.core.signing.dumps()`.
+
+Data serialized by `JSONSerializer` (e.g. a cookie set before this serializer was configured) can still be loaded.
+"""
+
+import json
+import struct
+import uuid
+
+# the version of the format, written as the first byte; JSON always starts with "{"
+_FORMAT = b"\xb1"
+
+# dictionary keys written as codes: the position in this tuple, plus 1. Only ever add keys to the end
+KEYS = (
+    # benefits.core.session
+    "agency",
+    "debug",
+    "did",
+    "eligibility",
+    "enrollment_expiry",
+    "flow",
+    "group",
+    "lang",
+    "logged_in",
+    "origin",
+    "start",
+    "uid",
+    # benefits.enrollment_littlepay.session
+    "enrollment_littlepay_access_token",
+    "enrollment_littlepay_access_token_expiry",
+    # benefits.enrollment_switchio.session
+    "enrollment_switchio_registration_id",
+    "enrollment_switchio_gateway_url",
+    # cdt_identity.session and cdt_identity.claims.ClaimsResult
+    "cdt_idg_client",
+    "cdt_idg_request",
+    "cdt_idg_result",
+    "verified",
+    "errors",
+    # authlib's OAuth state
+    "data",
+    "exp",
+    "redirect_uri",
+    "nonce",
+    "url",
+    "code_verifier",
+    "state",
+    # django.contrib.auth, for the Admin
+    "_auth_user_id",
+    "_auth_user_backend",
+    "_auth_user_hash",
+)
+
+_KEY_CODES = {key: code for code, key in enumerate(KEYS, start=1)}
+
+_NONE = 0
+_FALSE = 1
+_TRUE = 2
+_INT = 3
+_WHOLE_FLOAT = 4
+_FLOAT = 5
+_STR = 6
+_UUID = 7
+_LIST = 8
+_DICT = 9
+
+_DOUBLE = struct.Struct(">d")
+
+
+def _write_uint(out: bytearray, value: int):
+    """Write a non-negative integer in 7 bit groups, least significant first, with the high bit set on all but the last."""
+    while value > 0x7F:
+        out.append((value & 0x7F) | 0x80)
+        value >>= 7
+    out.append(value)
+
+
+def _write_int(out: bytearray, value: int):
+    # zigzag: small negative numbers stay small, 0, -1, 1, -2, ... => 0, 1, 2, 3, ...
+    _write_uint(out, value * 2 if value >= 0 else -value * 2 - 1)
+
+
+def _write_str(out: bytearray, value: str):
+    data = value.encode("utf-8")
+    _write_uint(out, len(data))
+    out += data
+
+
+def _is_uuid(value: str) -> bool:
+    if len(value) != 36:
+        return False
+    try:
+        return str(uuid.UUID(value)) == value
+    except ValueError:
+        return False
+
+
+def _write_key(out: bytearray, key):
+    if not isinstance(key, str):
+        # like json.dumps, which writes e.g. {1: ...} as {"1": ...}
+        key = json.dumps(key)
+    code = _KEY_CODES.get(key)
+    if code is None:
+        out.append(0)
+        _write_str(out, key)
+    else:
+        _write_uint(out, code)
+
+
+def _write(out: bytearray, value):
+    if value is None:
+        out.append(_NONE)
+    elif value is False:
+        out.append(_FALSE)
+    elif value is True:
+        out.append(_TRUE)
+    elif isinstance(value, int):
+        out.append(_INT)
+        _write_int(out, value)
+    elif isinstance(value, float):
+        if value.is_integer():
+            out.append(_WHOLE_FLOAT)
+            _write_int(out, int(value))
+        else:
+            out.append(_FLOAT)
+            out += _DOUBLE.pack(value)
+    elif isinstance(value, str):
+        if _is_uuid(value):
+            out.append(_UUID)
+            out += uuid.UUID(value).bytes
+        else:
+            out.append(_STR)
+            _write_str(out, value)
+    elif isinstance(value, (list, tuple)):
+        out.append(_LIST)
+        _write_uint(out, len(value))
+        for item in value:
+            _write(out, item)
+    elif isinstance(value, dict):
+        out.append(_DICT)
+        _write_uint(out, len(value))
+        for key, item in value.items():
+            _write_key(out, key)
+            _write(out, item)
+    else:
+        raise TypeError(f"Object of type {type(value).__name__} is not serializable")
+
+
+class _Reader:
+    def __init__(self, data: bytes):
+        self.data = data
+        self.pos = 0
+
+    def take(self, size) -> bytes:
+        start, end = self.pos, self.pos + size
+        if end > len(self.data):
+            raise ValueError("Truncated data")
+        self.pos = end
+        return self.data[start:end]
+
+    def byte(self) -> int:
+        return self.take(1)[0]
+
+    def unsigned(self) -> int:
+        value, shift = 0, 0
+        while True:
+            b = self.byte()
+            value |= (b & 0x7F) << shift
+            if b < 0x80:
+                return value
+            shift += 7
+
+    def signed(self) -> int:
+        value = self.unsigned()
+        return value // 2 if value % 2 == 0 else -(value + 1) // 2
+
+    def text(self) -> str:
+        return self.take(self.unsigned()).decode("utf-8")
+
+    def key(self) -> str:
+        code = self.unsigned()
+        if code == 0:
+            return self.text()
+        try:
+            return KEYS[code - 1]
+        except IndexError:
+            raise ValueError(f"Unknown key code: {code}")
+
+    def value(self):
+        tag = self.byte()
+        if tag == _NONE:
+            return None
+        if tag == _FALSE:
+            return False
+        if tag == _TRUE:
+            return True
+        if tag == _INT:
+            return self.signed()
+        if tag == _WHOLE_FLOAT:
+            return float(self.signed())
+        if tag == _FLOAT:
+            return _DOUBLE.unpack(self.take(_DOUBLE.size))[0]
+        if tag == _STR:
+            return self.text()
+        if tag == _UUID:
+            return str(uuid.UUID(bytes=self.take(16)))
+        if tag == _LIST:
+            return [self.value() for _ in range(self.unsigned())]
+        if tag == _DICT:
+            return {self.key(): self.value() for _ in range(self.unsigned())}
+        raise ValueError(f"Unknown tag: {tag}")
+
+
+class CompactSerializer:
+    """Serializes JSON-compatible session data to compact bytes, see the module docstring. For `SESSION_SERIALIZER`."""
+
+    def dumps(self, obj) -> bytes:
+        out = bytearray(_FORMAT)
+        _write(out, obj)
+        return bytes(out)
+
+    def loads(self, data: bytes):
+        if data[:1] != _FORMAT:
+            return json.loads(data.decode("latin-1"))
+
+        reader = _Reader(data)
+        reader.pos = 1
+        value = reader.value()
+        if reader.pos != len(data):
+            raise ValueError("Unexpected data after the value")
+        return value
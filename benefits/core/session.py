@@ -18,7 +18,7 @@ from benefits.enrollment_switchio.models import SwitchioGroup
 from benefits.enrollment_switchio.session import Session as SwitchioSession
 from benefits.routes import routes
 
-from . import models
+from . import cache, models, session_wrapper
 
 logger = logging.getLogger(__name__)
 
@@ -37,6 +37,32 @@ _START = "start"
 _UID = "uid"
 
 
+def _changed(request):
+    """Record that the request's session was changed, see `version()`."""
+    request._session_version = version(request) + 1
+
+
+def _write(request, values: dict) -> bool:
+    """Write the values to the request's session, only those that changed. Returns True if any changed."""
+    return session_wrapper.write(request.session, values)
+
+
+def _update_oauth(request, reset: bool = False, **values) -> bool:
+    """Update the OAuth session through its setters (reset first, with `reset`), leaving the request's session unmodified if
+    none of its values changed. Returns True if any changed."""
+    before = dict(request.session)
+    modified = request.session.modified
+
+    oauth_session = OAuthSession(request, reset=reset)
+    for name, value in values.items():
+        setattr(oauth_session, name, value)
+
+    if dict(request.session) == before:
+        request.session.modified = modified
+        return False
+    return True
+
+
 def agency(request):
     """Get the agency from the request's session, or None"""
     agency_id = request.session.get(_AGENCY)
@@ -46,7 +72,7 @@ def agency(request):
     if getattr(request, "_cached_agency", None) and request._cached_agency.id == agency_id:
         return request._cached_agency
     try:
-        agency = models.TransitAgency.by_id(agency_id)
+        agency = cache.agency(agency_id)
         request._cached_agency = agency
         return agency
     except models.TransitAgency.DoesNotExist:
@@ -139,7 +165,7 @@ def flow(request) -> models.EnrollmentFlow | None:
     if getattr(request, "_cached_flow", None) and request._cached_flow.id == flow_id:
         return request._cached_flow
     try:
-        flow = models.EnrollmentFlow.by_id(flow_id)
+        flow = cache.flow(flow_id)
         request._cached_flow = flow
         return flow
     except models.EnrollmentFlow.DoesNotExist:
@@ -159,7 +185,7 @@ def group(request) -> models.EnrollmentGroup | None:
                 return None
 
         try:
-            return group_model.by_id(request.session[_GROUP])
+            return cache.group(group_model, request.session[_GROUP])
         except (KeyError, group_model.DoesNotExist):
             return None
 
@@ -180,8 +206,10 @@ def logout(request):
     """Reset the session claims and tokens."""
     LittlepaySession(request, reset=True)
     SwitchioSession(request, reset=True)
-    OAuthSession(request, claims_result=ClaimsResult())
-    update(request, logged_in=False)
+    changed = _update_oauth(request, claims_result=ClaimsResult())
+    changed |= _write(request, {_LOGGED_IN: False})
+    if changed:
+        _changed(request)
 
 
 def oauth_extra_claims(request):
@@ -206,23 +234,29 @@ def origin(request):
 def reset(request):
     """Reset the session for the request."""
     logger.debug("Reset session")
-    request.session[_AGENCY] = None
-    request.session[_FLOW] = None
-    request.session[_GROUP] = None
-    request.session[_ELIGIBLE] = False
-    request.session[_ORIGIN] = reverse(routes.INDEX)
-    request.session[_ENROLLMENT_EXP] = None
-    request.session[_LOGGED_IN] = False
-    LittlepaySession(request, reset=True)
-    SwitchioSession(request, reset=True)
-    OAuthSession(request, reset=True)
+    values = {
+        _AGENCY: None,
+        _FLOW: None,
+        _GROUP: None,
+        _ELIGIBLE: False,
+        _ORIGIN: reverse(routes.INDEX),
+        _ENROLLMENT_EXP: None,
+        _LOGGED_IN: False,
+    }
 
     if _UID not in request.session or not request.session[_UID]:
         logger.debug("Reset session time and uid")
-        request.session[_START] = int(time.time() * 1000)
         u = str(uuid.uuid4())
-        request.session[_UID] = u
-        request.session[_DID] = str(uuid.UUID(hashlib.sha512(bytes(u, "utf8")).hexdigest()[:32]))
+        values[_START] = int(time.time() * 1000)
+        values[_UID] = u
+        values[_DID] = str(uuid.UUID(hashlib.sha512(bytes(u, "utf8")).hexdigest()[:32]))
+
+    LittlepaySession(request, reset=True)
+    SwitchioSession(request, reset=True)
+    changed = _update_oauth(request, reset=True)
+    changed |= _write(request, values)
+    if changed:
+        _changed(request)
 
 
 def start(request):
@@ -264,6 +298,14 @@ def uid(request):
     return u
 
 
+def version(request):
+    """Get a counter that increases each time the request's session is changed by `update()`, `reset()` or `logout()`.
+
+    Values derived from the session (e.g. for analytics events) can be reused while the version is unchanged.
+    """
+    return getattr(request, "_session_version", 0)
+
+
 def update(
     request,
     agency=None,
@@ -275,13 +317,14 @@ def update(
     logged_in=None,
     origin=None,
 ):
-    """Update the request's session with non-null values."""
+    """Update the request's session with non-null values. Values that didn't change aren't written again."""
+    values = {}
     if agency is not None and isinstance(agency, models.TransitAgency):
-        request.session[_AGENCY] = agency.id
+        values[_AGENCY] = agency.id
     if debug is not None:
-        request.session[_DEBUG] = debug
+        values[_DEBUG] = debug
     if eligible is not None:
-        request.session[_ELIGIBLE] = bool(eligible)
+        values[_ELIGIBLE] = bool(eligible)
     if isinstance(enrollment_expiry, datetime):
         if enrollment_expiry.tzinfo is None or enrollment_expiry.tzinfo.utcoffset(enrollment_expiry) is None:
             # this is a naive datetime instance, update tzinfo for UTC
@@ -290,15 +333,18 @@ def update(
             # > If your application uses this convention and your system timezone is not set to UTC, you can obtain the POSIX
             # > timestamp by supplying tzinfo=timezone.utc
             enrollment_expiry = enrollment_expiry.replace(tzinfo=timezone.utc)
-        request.session[_ENROLLMENT_EXP] = enrollment_expiry.timestamp()
+        values[_ENROLLMENT_EXP] = enrollment_expiry.timestamp()
     if logged_in is not None:
-        request.session[_LOGGED_IN] = logged_in
+        values[_LOGGED_IN] = logged_in
     if origin is not None:
-        request.session[_ORIGIN] = origin
+        values[_ORIGIN] = origin
     if flow is not None and isinstance(flow, models.EnrollmentFlow):
-        request.session[_FLOW] = flow.id
-        oauth_session = OAuthSession(request)
-        oauth_session.client_config = flow.oauth_config
-        oauth_session.claims_request = flow.claims_request
+        values[_FLOW] = flow.id
     if group is not None and isinstance(group, models.EnrollmentGroup):
-        request.session[_GROUP] = group.id
+        values[_GROUP] = group.id
+
+    changed = _write(request, values)
+    if flow is not None and isinstance(flow, models.EnrollmentFlow):
+        changed |= _update_oauth(request, client_config=flow.oauth_config, claims_request=flow.claims_request)
+    if changed:
+        _changed(request)
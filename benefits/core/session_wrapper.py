@@ -0,0 +1,27 @@
+"""
+The core application: a base for the applications' wrappers of the request's session.
+"""
+
+from django.http import HttpRequest
+
+
+def write(session, values: dict) -> bool:
+    """Write the values to the session, only those that changed. Returns True if any changed.
+
+    Writing a value marks the session as modified, so the session cookie is signed and sent again with the response.
+    """
+    changed = {key: value for key, value in values.items() if key not in session or session[key] != value}
+    if changed:
+        session.update(changed)
+    return bool(changed)
+
+
+class SessionWrapper:
+    """Base for a wrapper of the request's session, which only writes values that changed."""
+
+    def __init__(self, request: HttpRequest):
+        self.request = request
+        self.session = request.session
+
+    def _set(self, key, value):
+        write(self.session, {key: value})
@@ -1,24 +1,228 @@
+import copy
+import datetime
+import json
+import logging
+import uuid
+
+import requests
 from django.conf import settings
-from eligibility_api.client import Client
+from eligibility_api import client as api_client, tokens
+from jwcrypto import common as jwcrypto, jwe, jwk, jws, jwt
+
+from benefits.core import cache, http, models
+
+logger = logging.getLogger(__name__)
+
+
+class RequestToken(tokens.RequestToken):
+    """Eligibility API request token, like the library's but signed and encrypted with keys that are already parsed."""
+
+    def __init__(
+        self,
+        types,
+        agency,
+        jws_signing_alg,
+        client_private_jwk,
+        jwe_encryption_alg,
+        jwe_cek_enc,
+        server_public_jwk,
+        sub,
+        name,
+        issuer,
+    ):
+        logger.info("Initialize new request token")
+
+        self.client_private_jwk = client_private_jwk
+        self.server_public_jwk = server_public_jwk
+
+        payload = dict(
+            jti=str(uuid.uuid4()),
+            iss=issuer,
+            iat=int(datetime.datetime.now(datetime.timezone.utc).timestamp()),
+            agency=agency,
+            eligibility=types,
+            sub=sub,
+            name=name,
+        )
+
+        logger.debug("Sign token payload with agency's private key")
+        signed_token = jwt.JWT(header={"typ": "JWS", "alg": jws_signing_alg}, claims=payload)
+        signed_token.make_signed_token(client_private_jwk)
+
+        logger.debug("Encrypt signed token payload with verifier's public key")
+        header = {"typ": "JWE", "alg": jwe_encryption_alg, "enc": jwe_cek_enc}
+        encrypted_token = jwt.JWT(header=header, claims=signed_token.serialize())
+        encrypted_token.make_encrypted_token(server_public_jwk)
+
+        logger.info("Signed and encrypted request token initialized")
+        self._jwe = encrypted_token
+
+
+class ResponseToken(tokens.ResponseToken):
+    """Eligibility API response token, like the library's but decrypted and verified with keys that are already parsed."""
+
+    def __init__(self, response, jwe_encryption_alg, jwe_cek_enc, client_private_jwk, jws_signing_alg, server_public_jwk):
+        logger.info("Read encrypted token from response")
+
+        self.client_private_jwk = client_private_jwk
+        self.server_public_jwk = server_public_jwk
+
+        # strip extra spaces and wrapping quote chars
+        encrypted_signed_token = (response.text or "").strip("'\n\"")
+        if not encrypted_signed_token:
+            raise tokens.TokenError("Invalid response format")
+
+        logger.debug("Decrypt response token using agency's private key")
+        decrypted_token = jwe.JWE(algs=[jwe_encryption_alg, jwe_cek_enc])
+        try:
+            decrypted_token.deserialize(encrypted_signed_token, key=client_private_jwk)
+        except jwe.InvalidJWEData:
+            raise tokens.TokenError("Invalid JWE token")
+        except jwe.InvalidJWEOperation:
+            raise tokens.TokenError("JWE token decryption failed")
+
+        logger.debug("Verify decrypted response token's signature using verifier's public key")
+        signed_token = jws.JWS()
+        try:
+            signed_token.deserialize(str(decrypted_token.payload, "utf-8"), key=server_public_jwk, alg=jws_signing_alg)
+        except jws.InvalidJWSObject:
+            raise tokens.TokenError("Invalid JWS token")
+        except jws.InvalidJWSSignature:
+            raise tokens.TokenError("JWS token signature verification failed")
+
+        logger.info("Response token decrypted and signature verified")
+
+        payload = json.loads(str(signed_token.payload, "utf-8"))
+        self.eligibility = list(payload.get("eligibility", []))
+        self.error = payload.get("error", None)
 
-from benefits.core import models
+
+class Client(api_client.Client):
+    """Eligibility API client for an `EligibilityApiVerificationRequest`, using a pooled HTTP session.
+
+    The keys are parsed into JWKs the first time they are used, and kept for the client and its copies for other agencies
+    (see `for_agency()`): the library parses them again for every token.
+    """
+
+    def __init__(self, api_request: models.EligibilityApiVerificationRequest, agency: str = None):
+        self.api_request = api_request
+        super().__init__(
+            verify_url=api_request.api_url,
+            issuer=settings.ALLOWED_HOSTS[0],
+            agency=agency,
+            jws_signing_alg=api_request.api_jws_signing_alg,
+            client_private_key=api_request.client_private_key_data,
+            jwe_encryption_alg=api_request.api_jwe_encryption_alg,
+            jwe_cek_enc=api_request.api_jwe_cek_enc,
+            server_public_key=api_request.api_public_key_data,
+            timeout=http.timeout(http.ELIGIBILITY_API),
+        )
+        self._jwks = {}
+
+    def for_agency(self, agency: str) -> "Client":
+        """A copy of this client for the agency, sharing its parsed keys."""
+        client = copy.copy(self)
+        client.agency = agency
+        return client
+
+    def has_keys(self, api_request: models.EligibilityApiVerificationRequest) -> bool:
+        """Are this client's keys the request's current keys, read again once their TTL has passed?"""
+        return (
+            self.client_private_key == api_request.client_private_key_data
+            and self.server_public_key == api_request.api_public_key_data
+        )
+
+    def _jwk(self, pem_data):
+        """The PEM data parsed into a JWK, once for the client."""
+        key = self._jwks.get(pem_data)
+        if key is None:
+            key = self._jwks[pem_data] = jwk.JWK.from_pem(pem_data.encode("utf-8") if isinstance(pem_data, str) else pem_data)
+        return key
+
+    def _tokenize_request(self, sub, name, types):
+        """Create a request token with the parsed keys."""
+        return RequestToken(
+            types,
+            self.agency,
+            self.jws_signing_alg,
+            self._jwk(self.client_private_key),
+            self.jwe_encryption_alg,
+            self.jwe_cek_enc,
+            self._jwk(self.server_public_key),
+            sub,
+            name,
+            self.issuer,
+        )
+
+    def _tokenize_response(self, response):
+        """Parse a response token with the parsed keys."""
+        return ResponseToken(
+            response,
+            self.jwe_encryption_alg,
+            self.jwe_cek_enc,
+            self._jwk(self.client_private_key),
+            self.jws_signing_alg,
+            self._jwk(self.server_public_key),
+        )
+
+    def _auth_headers(self, token):
+        headers = super()._auth_headers(token)
+        # read for each request (from the secrets cache), so a rotated key is used without creating a new client
+        headers[self.api_request.api_auth_header] = self.api_request.api_auth_key
+        return headers
+
+    def _request(self, sub, name, types):
+        """Make an API request for eligibility verification, like the base class but with the pooled session.
+
+        The session doesn't retry the request (see `http.NO_RETRIES`): it carries a single-use token.
+        """
+        logger.debug("Start new eligibility verification request")
+
+        try:
+            token = self._tokenize_request(sub, name, types)
+        except jwcrypto.JWException:
+            raise tokens.TokenError("Failed to tokenize form values")
+
+        try:
+            logger.debug(f"GET request to {self.verify_url}")
+            r = http.get(http.ELIGIBILITY_API, self.verify_url, headers=self._auth_headers(token), timeout=self.timeout)
+        except requests.ConnectionError:
+            raise api_client.ApiError("Connection to verification server failed")
+        except requests.Timeout:
+            raise api_client.ApiError("Connection to verification server timed out")
+        except requests.TooManyRedirects:
+            raise api_client.ApiError("Too many redirects to verification server")
+        except requests.HTTPError as e:
+            raise api_client.ApiError(e)
+
+        if r.status_code in {200, 400}:
+            logger.debug("Process eligiblity verification response")
+            return self._tokenize_response(r)
+        else:
+            logger.warning(f"Unexpected eligibility verification response status code: {r.status_code}")
+            raise api_client.ApiError("Unexpected eligibility verification response")
+
+
+def get_client(flow: models.EnrollmentFlow, agency: models.TransitAgency) -> Client:
+    """Get an Eligibility API client for the flow and agency.
+
+    A client is kept for each `EligibilityApiVerificationRequest` with the configuration cache, so it is created again when
+    the request or its `PemData` change. It is also created again when the key material read through `PemData.data`'s TTL
+    no longer matches its keys, so rotated keys are picked up.
+    """
+    api_request = flow.api_request
+    client = cache.derived(
+        ("eligibility_api_client", api_request.id),
+        lambda: Client(api_request),
+        valid=lambda client: client.has_keys(api_request),
+    )
+    return client.for_agency(agency.slug)
 
 
 def eligibility_from_api(flow: models.EnrollmentFlow, form, agency: models.TransitAgency):
     sub, name = form.cleaned_data.get("sub"), form.cleaned_data.get("name")
 
-    client = Client(
-        verify_url=flow.api_request.api_url,
-        headers={flow.api_request.api_auth_header: flow.api_request.api_auth_key},
-        issuer=settings.ALLOWED_HOSTS[0],
-        agency=agency.slug,
-        jws_signing_alg=flow.api_request.api_jws_signing_alg,
-        client_private_key=flow.api_request.client_private_key_data,
-        jwe_encryption_alg=flow.api_request.api_jwe_encryption_alg,
-        jwe_cek_enc=flow.api_request.api_jwe_cek_enc,
-        server_public_key=flow.api_request.api_public_key_data,
-        timeout=settings.REQUESTS_TIMEOUT,
-    )
+    client = get_client(flow, agency)
 
     response = client.verify(sub, name, [flow.system_name])
 
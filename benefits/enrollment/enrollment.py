@@ -2,10 +2,11 @@ from datetime import datetime, timedelta
 from enum import Enum
 
 import sentry_sdk
+from django.db import DatabaseError
 from django.shortcuts import redirect
 from django.utils import timezone
 
-from benefits.core import models, session
+from benefits.core import metrics, models, rollups, session
 from benefits.routes import routes
 
 from . import analytics
@@ -61,6 +62,7 @@ def handle_enrollment_results(
     flow = session.flow(request)
     agency = session.agency(request)
     group_id = str(session.group(request).group_id)  # needs to be a string for the API call
+    metrics.count_enrollment(status.name, agency.transit_processor, enrollment_method)
     match (status):
         case Status.SUCCESS:
             expiry = session.enrollment_expiry(request)
@@ -74,8 +76,10 @@ def handle_enrollment_results(
             agencies_to_report = [agency]
             agencies_to_report.extend(agency.group_agencies())
 
-            for agency in agencies_to_report:
-                event = models.EnrollmentEvent.objects.create(
+            # record the events for all agencies in a single (atomic) insert, and add them to the daily rollups,
+            # then queue the analytics events for delivery
+            events = models.EnrollmentEvent.objects.bulk_create(
+                models.EnrollmentEvent(
                     transit_agency=agency,
                     enrollment_flow=flow,
                     enrollment_method=enrollment_method,
@@ -83,8 +87,15 @@ def handle_enrollment_results(
                     expiration_datetime=expiry,
                     extra_claims=str_extra_claims,
                 )
-                event.save()
+                for agency in agencies_to_report
+            )
+            try:
+                rollups.record(events)
+            except DatabaseError as e:
+                # the rider is enrolled and the events are saved; the scheduled rebuild of the rollups will count them
+                sentry_sdk.capture_exception(e)
 
+            for agency in agencies_to_report:
                 analytics.returned_success(
                     request,
                     agency=agency,
@@ -1,11 +1,20 @@
+import logging
 import re
+import threading
+import uuid
 from dataclasses import dataclass
 
 from littlepay.api.client import Client
 from requests.exceptions import HTTPError
 
-from benefits.core import session
+from benefits.core import http, session
 from benefits.enrollment.enrollment import Status, _calculate_expiry, _is_expired, _is_within_reenrollment_window
+from benefits.enrollment_littlepay.models import LittlepayConfig
+
+logger = logging.getLogger(__name__)
+
+# refresh access tokens this many seconds before they expire
+TOKEN_REFRESH_LEEWAY = 120
 
 
 @dataclass
@@ -17,6 +26,57 @@ class CardTokenizationAccessResponse:
     status_code: int = None
 
 
+@dataclass
+class _RegisteredClient:
+    credentials: tuple
+    client: Client
+    lock: threading.Lock
+
+
+_clients = {}
+_clients_lock = threading.Lock()
+
+
+def get_client(config: LittlepayConfig) -> Client:
+    """Get an authenticated API client for the LittlepayConfig, shared by all threads in this process.
+
+    The client keeps its access token until shortly before it expires, and a new token is fetched only once per expiry.
+    """
+    credentials = (config.api_base_url, config.client_id, config.client_secret, config.audience)
+
+    with _clients_lock:
+        registered = _clients.get(config.id)
+        if registered is None or registered.credentials != credentials:
+            logger.debug(f"Creating Littlepay API client for config: {config.id}")
+            base_url, client_id, client_secret, audience = credentials
+            client = Client(base_url=base_url, client_id=client_id, client_secret=client_secret, audience=audience)
+            client.oauth.mount("https://", http.adapter(http.LITTLEPAY))
+            client.oauth.default_timeout = http.timeout(http.LITTLEPAY)
+            registered = _RegisteredClient(credentials=credentials, client=client, lock=threading.Lock())
+            _clients[config.id] = registered
+
+    client = registered.client
+    if _needs_token(client):
+        # one thread fetches the new token, while the others wait to use it
+        with registered.lock:
+            if _needs_token(client):
+                logger.debug(f"Fetching Littlepay access token for config: {config.id}")
+                client.oauth.token = client.oauth.fetch_token(headers=client.headers, **client.credentials)
+
+    return client
+
+
+def _needs_token(client: Client) -> bool:
+    token = client.oauth.token
+    return token is None or bool(token.is_expired(leeway=TOKEN_REFRESH_LEEWAY))
+
+
+def clear_clients():
+    """Forget all registered clients and their access tokens."""
+    with _clients_lock:
+        _clients.clear()
+
+
 def request_card_tokenization_access(request) -> CardTokenizationAccessResponse:
     """
     Requests an access token to be used for card tokenization.
@@ -24,13 +84,7 @@ def request_card_tokenization_access(request) -> CardTokenizationAccessResponse:
     agency = session.agency(request)
 
     try:
-        client = Client(
-            base_url=agency.littlepay_config.api_base_url,
-            client_id=agency.littlepay_config.client_id,
-            client_secret=agency.littlepay_config.client_secret,
-            audience=agency.littlepay_config.audience,
-        )
-        client.oauth.ensure_active_token(client.token)
+        client = get_client(agency.littlepay_config)
         response = client.request_card_tokenization_access()
 
         return CardTokenizationAccessResponse(
@@ -64,13 +118,7 @@ def enroll(request, card_token) -> tuple[Status, Exception]:
     agency = session.agency(request)
     flow = session.flow(request)
 
-    client = Client(
-        base_url=agency.littlepay_config.api_base_url,
-        client_id=agency.littlepay_config.client_id,
-        client_secret=agency.littlepay_config.client_secret,
-        audience=agency.littlepay_config.audience,
-    )
-    client.oauth.ensure_active_token(client.token)
+    client = get_client(agency.littlepay_config)
 
     funding_source = client.get_funding_source_by_token(card_token)
     group_id = str(session.group(request).group_id)  # needs to be a string for the API call
@@ -152,11 +200,14 @@ def enroll(request, card_token) -> tuple[Status, Exception]:
 
 
 def _get_group_funding_source(client: Client, group_id, funding_source_id):
-    group_funding_sources = client.get_concession_group_linked_funding_sources(group_id)
-    matching_group_funding_source = None
-    for group_funding_source in group_funding_sources:
-        if group_funding_source.id == funding_source_id:
-            matching_group_funding_source = group_funding_source
-            break
-
-    return matching_group_funding_source
+    """Get the funding source's linkage to the concession group, or None if it isn't linked.
+
+    Looks through the (few) groups linked to the funding source, rather than every funding source linked to the group.
+    Group IDs are compared as UUIDs, since the API may format them differently, e.g. in upper case.
+    """
+    group_id = uuid.UUID(str(group_id))
+    for funding_source_group in client.get_funding_source_linked_concession_groups(funding_source_id):
+        if uuid.UUID(str(funding_source_group.group_id)) == group_id:
+            return funding_source_group
+
+    return None
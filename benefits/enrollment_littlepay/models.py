@@ -24,6 +24,9 @@ class LittlepayConfig(TransitProcessorConfig):
         blank=True,
     )
 
+    # secrets used by all LittlepayConfig instances
+    shared_secret_names = ("littlepay-qa-api-base-url", "littlepay-prod-api-base-url")
+
     @property
     def api_base_url(self):
         if self.environment == Environment.TEST.value:
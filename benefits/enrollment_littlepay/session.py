@@ -3,10 +3,12 @@ import time
 
 from django.http import HttpRequest
 
+from benefits.core.session_wrapper import SessionWrapper
+
 logger = logging.getLogger(__name__)
 
 
-class Session:
+class Session(SessionWrapper):
 
     _keys_access_token = "enrollment_littlepay_access_token"
     _keys_access_token_expiry = "enrollment_littlepay_access_token_expiry"
@@ -14,8 +16,7 @@ class Session:
     def __init__(self, request: HttpRequest, reset: bool = False, access_token: str = None, access_token_expiry: str = None):
         """Initialize a new Littlepay session wrapper for this request."""
 
-        self.request = request
-        self.session = request.session
+        super().__init__(request)
 
         if reset:
             self.access_token = None
@@ -32,7 +33,7 @@ class Session:
 
     @access_token.setter
     def access_token(self, value: str) -> None:
-        self.session[self._keys_access_token] = value
+        self._set(self._keys_access_token, value)
 
     @property
     def access_token_expiry(self) -> int:
@@ -41,7 +42,7 @@ class Session:
 
     @access_token_expiry.setter
     def access_token_expiry(self, value: int) -> None:
-        self.session[self._keys_access_token_expiry] = value
+        self._set(self._keys_access_token_expiry, value)
 
     def access_token_valid(self):
         """True if the request's session is configured with a valid card tokenization access token. False otherwise."""
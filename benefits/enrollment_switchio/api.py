@@ -1,6 +1,10 @@
 import hashlib
 import hmac
 import json
+import os
+import ssl
+import threading
+from contextlib import ExitStack, contextmanager
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from enum import Enum
@@ -8,6 +12,8 @@ from tempfile import NamedTemporaryFile
 
 import requests
 
+from benefits.core import http
+
 
 @dataclass
 class Registration:
@@ -39,39 +45,103 @@ class RegistrationStatus:
     cardExp: str = None
 
 
+@contextmanager
+def _pem_path(data: str):
+    """A filesystem path holding the PEM data, for APIs that can only read certificates and keys from a file.
+
+    Uses an anonymous in-memory file where the platform supports it (e.g. Linux), otherwise a temp file on disk.
+    """
+    if hasattr(os, "memfd_create"):
+        fd = os.memfd_create("pem")
+        try:
+            os.write(fd, data.encode("utf-8"))
+            yield f"/proc/self/fd/{fd}"
+        finally:
+            os.close(fd)
+    else:
+        with NamedTemporaryFile("w+") as file:
+            file.write(data)
+            file.flush()
+            yield file.name
+
+
+def _ssl_context(private_key, client_certificate, ca_certificate) -> ssl.SSLContext:
+    """Create an SSLContext for client cert auth, trusting only the given CA certificate."""
+    context = ssl.create_default_context(cadata=ca_certificate)
+    # ssl can only load a certificate chain from files
+    with _pem_path(client_certificate) as cert, _pem_path(private_key) as key:
+        context.load_cert_chain(certfile=cert, keyfile=key)
+    return context
+
+
+class PooledSession(requests.Session):
+    """A pooled requests.Session for client cert auth, trusting only the given CA certificate.
+
+    The SSLContext is created once, and connections are kept alive between requests. Proxy settings are still read from
+    the environment, but requests are always verified against the given CA certificate: a CA bundle from the environment
+    (e.g. REQUESTS_CA_BUNDLE), or the default bundle, would otherwise be loaded into the SSLContext as more trusted CAs.
+    """
+
+    def __init__(self, private_key, client_certificate, ca_certificate):
+        super().__init__()
+        self._files = ExitStack()
+        self.verify = self._files.enter_context(_pem_path(ca_certificate))
+        adapter = http.adapter(http.SWITCHIO, ssl_context=_ssl_context(private_key, client_certificate, ca_certificate))
+        self.mount("https://", adapter)
+        self.mount("http://", adapter)
+
+    def merge_environment_settings(self, url, proxies, stream, verify, cert):
+        return super().merge_environment_settings(url, proxies, stream, self.verify if verify is None else verify, cert)
+
+    def close(self):
+        super().close()
+        self._files.close()
+
+
+_sessions = {}
+_sessions_lock = threading.Lock()
+
+
+def get_session(key, private_key, client_certificate, ca_certificate) -> requests.Session:
+    """Get the PooledSession for a configuration (by `key`, e.g. its id), shared by all threads in the process.
+
+    The session is replaced when the configuration's PEM data changes, e.g. after certificates are rotated.
+    """
+    pem = (private_key, client_certificate, ca_certificate)
+    pid = os.getpid()
+    entry = _sessions.get(key)
+    if entry is None or entry[:2] != (pid, pem):
+        with _sessions_lock:
+            entry = _sessions.get(key)
+            if entry is None or entry[:2] != (pid, pem):
+                # a forked process leaves its parent's session alone
+                if entry is not None and entry[0] == pid:
+                    entry[2].close()
+                entry = _sessions[key] = (pid, pem, PooledSession(*pem))
+    return entry[2]
+
+
+def clear_sessions():
+    """Close and forget all pooled sessions."""
+    with _sessions_lock:
+        for pid, _, session in _sessions.values():
+            if pid == os.getpid():
+                session.close()
+        _sessions.clear()
+
+
 class Client:
-    def __init__(
-        self,
-        private_key,
-        client_certificate,
-        ca_certificate,
-    ):
+    def __init__(self, private_key, client_certificate, ca_certificate, config_id=None):
         self.private_key = private_key
         self.client_certificate = client_certificate
         self.ca_certificate = ca_certificate
+        self.config_id = config_id
 
     # see https://github.com/cal-itp/benefits/issues/2848 for more context about this
-    def _cert_request(self, request_func):
-        """
-        Creates named (on-disk) temp files for client cert auth.
-        * request_func: curried callable from `requests` library (e.g. `requests.get`).
-        """
-        # requests library reads temp files from file path
-        # The "with" context destroys temp files when response comes back
-        with NamedTemporaryFile("w+") as cert, NamedTemporaryFile("w+") as key, NamedTemporaryFile("w+") as ca:
-            # write client cert data to temp files
-            # resetting so they can be read again by requests
-            cert.write(self.client_certificate)
-            cert.seek(0)
-
-            key.write(self.private_key)
-            key.seek(0)
-
-            ca.write(self.ca_certificate)
-            ca.seek(0)
-
-            # request using temp file paths
-            return request_func(verify=ca.name, cert=(cert.name, key.name))
+    @property
+    def session(self) -> requests.Session:
+        """The pooled requests.Session for client cert auth with this client's configuration and certificates."""
+        return get_session(self.config_id, self.private_key, self.client_certificate, self.ca_certificate)
 
 
 class TokenizationClient(Client):
@@ -84,8 +154,9 @@ class TokenizationClient(Client):
         private_key,
         client_certificate,
         ca_certificate,
+        config_id=None,
     ):
-        super().__init__(private_key, client_certificate, ca_certificate)
+        super().__init__(private_key, client_certificate, ca_certificate, config_id)
         self.api_url = api_url.strip("/")
         self.api_key = api_key
         self.api_secret = api_secret
@@ -134,15 +205,11 @@ class TokenizationClient(Client):
             "eshopResponseMode": eshopResponseMode.value,
         }
 
-        response = self._cert_request(
-            lambda verify, cert: requests.post(
-                self.api_url + registration_path,
-                json=request_body,
-                headers=self._get_headers(method="POST", request_path=registration_path, request_body=request_body),
-                cert=cert,
-                verify=verify,
-                timeout=timeout,
-            )
+        response = self.session.post(
+            self.api_url + registration_path,
+            json=request_body,
+            headers=self._get_headers(method="POST", request_path=registration_path, request_body=request_body),
+            timeout=timeout,
         )
 
         response.raise_for_status()
@@ -152,14 +219,10 @@ class TokenizationClient(Client):
     def get_registration_status(self, registration_id, timeout=5) -> RegistrationStatus:
         request_path = f"/api/v1/registration/{registration_id}"
 
-        response = self._cert_request(
-            lambda verify, cert: requests.get(
-                self.api_url + request_path,
-                headers=self._get_headers(method="GET", request_path=request_path),
-                cert=cert,
-                verify=verify,
-                timeout=timeout,
-            )
+        response = self.session.get(
+            self.api_url + request_path,
+            headers=self._get_headers(method="GET", request_path=request_path),
+            timeout=timeout,
         )
 
         response.raise_for_status()
@@ -198,8 +261,8 @@ class GroupExpiry:
 
 class EnrollmentClient(Client):
 
-    def __init__(self, api_url, authorization_header_value, private_key, client_certificate, ca_certificate):
-        super().__init__(private_key, client_certificate, ca_certificate)
+    def __init__(self, api_url, authorization_header_value, private_key, client_certificate, ca_certificate, config_id=None):
+        super().__init__(private_key, client_certificate, ca_certificate, config_id)
         self.api_url = api_url.strip("/")
         self.authorization_header_value = authorization_header_value
 
@@ -228,14 +291,10 @@ class EnrollmentClient(Client):
     def healthcheck(self, timeout=5):
         request_path = "/api/external/discount/echo"
 
-        response = self._cert_request(
-            lambda verify, cert: requests.get(
-                self.api_url.strip("/") + request_path,
-                headers=self._get_headers(),
-                cert=cert,
-                verify=verify,
-                timeout=timeout,
-            )
+        response = self.session.get(
+            self.api_url.strip("/") + request_path,
+            headers=self._get_headers(),
+            timeout=timeout,
         )
 
         response.raise_for_status()
@@ -245,14 +304,10 @@ class EnrollmentClient(Client):
     def get_groups(self, pto_id, timeout=5):
         request_path = f"/api/external/discount/{pto_id}/groups"
 
-        response = self._cert_request(
-            lambda verify, cert: requests.get(
-                self.api_url + request_path,
-                headers=self._get_headers(),
-                cert=cert,
-                verify=verify,
-                timeout=timeout,
-            )
+        response = self.session.get(
+            self.api_url + request_path,
+            headers=self._get_headers(),
+            timeout=timeout,
         )
 
         response.raise_for_status()
@@ -262,14 +317,10 @@ class EnrollmentClient(Client):
     def get_groups_for_token(self, pto_id, token, timeout=5):
         request_path = f"/api/external/discount/{pto_id}/token/{token}"
 
-        response = self._cert_request(
-            lambda verify, cert: requests.get(
-                self.api_url + request_path,
-                headers=self._get_headers(),
-                cert=cert,
-                verify=verify,
-                timeout=timeout,
-            )
+        response = self.session.get(
+            self.api_url + request_path,
+            headers=self._get_headers(),
+            timeout=timeout,
         )
 
         response.raise_for_status()
@@ -283,15 +334,11 @@ class EnrollmentClient(Client):
         if expiry:
             request_body["expiresAt"] = self._format_expiry(expiry)
 
-        response = self._cert_request(
-            lambda verify, cert: requests.post(
-                self.api_url + request_path,
-                json=request_body,
-                headers=self._get_headers(),
-                cert=cert,
-                verify=verify,
-                timeout=timeout,
-            )
+        response = self.session.post(
+            self.api_url + request_path,
+            json=request_body,
+            headers=self._get_headers(),
+            timeout=timeout,
         )
 
         response.raise_for_status()
@@ -303,15 +350,11 @@ class EnrollmentClient(Client):
 
         request_body = {"group": group_id}
 
-        response = self._cert_request(
-            lambda verify, cert: requests.post(
-                self.api_url + request_path,
-                json=request_body,
-                headers=self._get_headers(),
-                cert=cert,
-                verify=verify,
-                timeout=timeout,
-            )
+        response = self.session.post(
+            self.api_url + request_path,
+            json=request_body,
+            headers=self._get_headers(),
+            timeout=timeout,
         )
 
         response.raise_for_status()
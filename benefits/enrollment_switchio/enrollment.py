@@ -1,12 +1,11 @@
 from dataclasses import dataclass
 from datetime import datetime
 
-from django.conf import settings
 from django.http import HttpRequest
 from django.urls import reverse
 from requests import HTTPError
 
-from benefits.core import session
+from benefits.core import http, session
 from benefits.core.models.enrollment import EnrollmentFlow
 from benefits.enrollment.enrollment import Status, _calculate_expiry, _is_expired, _is_within_reenrollment_window
 from benefits.enrollment_switchio.api import (
@@ -59,6 +58,7 @@ def request_registration(
             private_key=switchio_config.private_key_data,
             client_certificate=switchio_config.client_certificate_data,
             ca_certificate=switchio_config.ca_certificate_data,
+            config_id=switchio_config.id,
         )
 
         route = reverse(redirect_route)
@@ -68,7 +68,7 @@ def request_registration(
             eshopRedirectUrl=redirect_url,
             mode=RegistrationMode.REGISTER,
             eshopResponseMode=EshopResponseMode.QUERY,
-            timeout=settings.REQUESTS_TIMEOUT,
+            timeout=http.timeout(http.SWITCHIO),
         )
 
         return RegistrationResponse(status=Status.SUCCESS, registration=registration)
@@ -110,11 +110,12 @@ def get_registration_status(switchio_config: SwitchioConfig, registration_id: st
             private_key=switchio_config.private_key_data,
             client_certificate=switchio_config.client_certificate_data,
             ca_certificate=switchio_config.ca_certificate_data,
+            config_id=switchio_config.id,
         )
 
         registration_status = client.get_registration_status(
             registration_id=registration_id,
-            timeout=settings.REQUESTS_TIMEOUT,
+            timeout=http.timeout(http.SWITCHIO),
         )
 
         return RegistrationStatusResponse(status=Status.SUCCESS, registration_status=registration_status, exception=None)
@@ -158,6 +159,7 @@ def enroll(
         private_key=switchio_config.private_key_data,
         client_certificate=switchio_config.client_certificate_data,
         ca_certificate=switchio_config.ca_certificate_data,
+        config_id=switchio_config.id,
     )
 
     pto_id = switchio_config.pto_id
@@ -204,7 +206,7 @@ def enroll(
                     pto_id=pto_id,
                     group_id=group_id,
                     token=token,
-                    timeout=settings.REQUESTS_TIMEOUT,
+                    timeout=http.timeout(http.SWITCHIO),
                 )
                 status = Status.SUCCESS
             else:  # already enrolled
@@ -218,7 +220,7 @@ def enroll(
                         pto_id=pto_id,
                         group_id=group_id,
                         token=token,
-                        timeout=settings.REQUESTS_TIMEOUT,
+                        timeout=http.timeout(http.SWITCHIO),
                     )
                     status = Status.SUCCESS
     except HTTPError as e:
@@ -236,7 +238,7 @@ def enroll(
 
 
 def _get_group_for_token(client: EnrollmentClient, pto_id, group_id, token):
-    already_enrolled_groups = client.get_groups_for_token(pto_id=pto_id, token=token, timeout=settings.REQUESTS_TIMEOUT)
+    already_enrolled_groups = client.get_groups_for_token(pto_id=pto_id, token=token, timeout=http.timeout(http.SWITCHIO))
 
     for group in already_enrolled_groups:
         if group.group == group_id:
@@ -35,6 +35,17 @@ class SwitchioConfig(TransitProcessorConfig):
         blank=True,
     )
 
+    # secrets used by all SwitchioConfig instances
+    shared_secret_names = (
+        "switchio-tokenization-api-base-url",
+        "switchio-enrollment-api-base-url",
+        "switchio-enrollment-api-authorization-header",
+        "switchio-int-client-cert",
+        "switchio-client-cert",
+        "switchio-ca-cert",
+        "switchio-private-key",
+    )
+
     @property
     def tokenization_api_base_url(self):
         return get_secret_by_name("switchio-tokenization-api-base-url")
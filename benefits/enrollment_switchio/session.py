@@ -2,10 +2,12 @@ import logging
 
 from django.http import HttpRequest
 
+from benefits.core.session_wrapper import SessionWrapper
+
 logger = logging.getLogger(__name__)
 
 
-class Session:
+class Session(SessionWrapper):
 
     _keys_registration_id = "enrollment_switchio_registration_id"
     _keys_gateway_url = "enrollment_switchio_gateway_url"
@@ -13,8 +15,7 @@ class Session:
     def __init__(self, request: HttpRequest, reset: bool = False, registration_id: str = None, gateway_url: str = None):
         """Initialize a new Switchio session wrapper for this request."""
 
-        self.request = request
-        self.session = request.session
+        super().__init__(request)
 
         if reset:
             self.registration_id = None
@@ -31,7 +32,7 @@ class Session:
 
     @registration_id.setter
     def registration_id(self, value: str) -> None:
-        self.session[self._keys_registration_id] = value
+        self._set(self._keys_registration_id, value)
 
     @property
     def gateway_url(self) -> str:
@@ -40,4 +41,4 @@ class Session:
 
     @gateway_url.setter
     def gateway_url(self, value: str) -> None:
-        self.session[self._keys_gateway_url] = value
+        self._set(self._keys_gateway_url, value)
@@ -1,4 +1,9 @@
+from functools import cache
+from types import MappingProxyType
+
 from cdt_identity.routes import Routes as OAuthRoutes
+from django.core import checks
+from django.urls import NoReverseMatch, get_resolver, reverse
 
 
 class Routes:
@@ -189,9 +194,19 @@ class Routes:
         """Enrollment error not caused by the user during in-person enrollment."""
         return "in_person:system_error"
 
-    def to_dict(self) -> dict[str, str]:
-        """Get a mapping of property name --> value for each `@property` in the Routes collection."""
-        return {prop: str(getattr(self, prop)) for prop in dir(Routes) if isinstance(getattr(Routes, prop), property)}
+    def to_dict(self) -> MappingProxyType[str, str]:
+        """Get a read-only mapping of property name --> value for each `@property` in the Routes collection.
+
+        The mapping is built on first use and shared after that, the routes don't change while the app runs.
+        """
+        return _to_dict(type(self))
+
+    def urls(self) -> MappingProxyType[str, str]:
+        """Get a read-only mapping of property name --> URL for each route that takes no arguments.
+
+        The mapping is built on first use, once the URLConf can be loaded, and shared after that.
+        """
+        return _urls(type(self))
 
     @staticmethod
     def name(route: str) -> str:
@@ -199,4 +214,46 @@ class Routes:
         return route.split(":")[-1]
 
 
+@cache
+def _to_dict(cls) -> MappingProxyType[str, str]:
+    """The route table of a Routes class, cached by class rather than on the instance."""
+    instance = cls()
+    return MappingProxyType(
+        {prop: str(getattr(instance, prop)) for prop in dir(cls) if isinstance(getattr(cls, prop), property)}
+    )
+
+
+@cache
+def _urls(cls) -> MappingProxyType[str, str]:
+    """The URLs of a Routes class's routes that take no arguments, cached by class rather than on the instance."""
+    urls = {}
+    for prop, route in _to_dict(cls).items():
+        try:
+            urls[prop] = reverse(route)
+        except NoReverseMatch:
+            # the route takes arguments, e.g. an agency's slug
+            pass
+    return MappingProxyType(urls)
+
+
 routes = Routes()
+
+
+def _defined(route: str) -> bool:
+    """Is the `app:name` route defined in the URLConf, whether or not it takes arguments?"""
+    resolver = get_resolver()
+    *namespaces, name = route.split(":")
+    for namespace in namespaces:
+        if namespace not in resolver.namespace_dict:
+            return False
+        resolver = resolver.namespace_dict[namespace][1]
+    return name in resolver.reverse_dict
+
+
+def check_routes(app_configs, **kwargs):
+    """System check that each route in the Routes collection is defined in the URLConf."""
+    return [
+        checks.Error(f"Route {prop} = {route!r} is not defined in the URLConf.", obj=Routes, id="benefits.E001")
+        for prop, route in routes.to_dict().items()
+        if not _defined(route)
+    ]
@@ -2,13 +2,18 @@ import logging
 import os
 import re
 import sys
+import threading
+import time
+from dataclasses import dataclass
 
-from azure.core.exceptions import ClientAuthenticationError
+from azure.core.exceptions import ClientAuthenticationError, ResourceNotFoundError
 from azure.identity import DefaultAzureCredential
 from azure.keyvault.secrets import SecretClient
 from django.conf import settings
 from django.core.validators import RegexValidator
 
+from benefits.core import http, metrics
+
 logger = logging.getLogger(__name__)
 
 
@@ -41,49 +46,191 @@ class SecretNameValidator(RegexValidator):
 NAME_VALIDATOR = SecretNameValidator()
 
 
-def get_secret_by_name(secret_name, client=None):
-    """Read a value from the secret store, currently Azure KeyVault.
+class LocalSecret:
+    """A secret read by `LocalSecretClient`, with the same `name` and `value` attributes as an Azure KeyVaultSecret."""
 
-    When `settings.RUNTIME_ENVIRONMENT() == "local"`, reads from the environment instead.
+    def __init__(self, name, value):
+        self.name = name
+        self.value = value
+
+
+class LocalSecretClient:
+    """A stand-in for the Azure KeyVault SecretClient that reads secrets from a dict, without any network calls.
+
+    Secret names are looked up with underscores instead of hyphens, since environment variable names cannot contain the
+    hyphen character; by default, the dict is the process environment.
     """
-    NAME_VALIDATOR(secret_name)
 
-    runtime_env = settings.RUNTIME_ENVIRONMENT()
+    def __init__(self, secrets=None):
+        self.secrets = secrets
 
-    if runtime_env == "local":
-        logger.debug("Runtime environment is local, reading from environment instead of Azure KeyVault.")
+    def get_secret(self, name):
+        secrets = os.environ if self.secrets is None else self.secrets
         # environment variable names cannot contain the hyphen character
         # assume the variable name is the same but with underscores instead
-        env_secret_name = secret_name.replace("-", "_")
-        secret_value = os.environ.get(env_secret_name)
+        value = secrets.get(name.replace("-", "_"))
+        if value is None:
+            raise ResourceNotFoundError(f"Secret not found: {name}")
         # we have to replace literal newlines here with the actual newline character
         # to support local environment variables values that span multiple lines (e.g. PEM keys/certs)
         # because the VS Code Python extension doesn't support multiline environment variables
         # https://code.visualstudio.com/docs/python/environments#_environment-variables
-        return secret_value.replace("\\n", "\n")
+        return LocalSecret(name, value.replace("\\n", "\n"))
 
-    elif client is None:
-        # construct the KeyVault URL from the runtime environment
-        # see https://docs.calitp.org/benefits/deployment/infrastructure/#environments
-        # and https://github.com/cal-itp/benefits/blob/main/terraform/key_vault.tf
-        vault_url = KEY_VAULT_URL.format(env=runtime_env[0])
-        logger.debug(f"Configuring Azure KeyVault secrets client for: {vault_url}")
 
-        credential = DefaultAzureCredential()
-        client = SecretClient(vault_url=vault_url, credential=credential)
+@dataclass
+class CachedSecret:
+    value: str
+    fetched_at: float
+    ttl: float
+    refreshing: bool = False
 
-    secret_value = None
+    def age(self):
+        return time.monotonic() - self.fetched_at
 
-    if client is not None:
-        try:
-            secret = client.get_secret(secret_name)
-            secret_value = secret.value
-        except ClientAuthenticationError:
-            logger.error("Could not authenticate to Azure KeyVault")
-    else:
+
+_lock = threading.Lock()
+_clients = {}
+_credential = None
+_cache = {}
+_prefetched = threading.Event()
+
+
+def get_client(vault_url):
+    """Get the SecretClient for the vault, shared by all threads in the process along with its credential."""
+    global _credential
+
+    client = _clients.get(vault_url)
+    if client is None:
+        with _lock:
+            client = _clients.get(vault_url)
+            if client is None:
+                logger.debug(f"Configuring Azure KeyVault secrets client for: {vault_url}")
+                if _credential is None:
+                    _credential = DefaultAzureCredential()
+                client = SecretClient(vault_url=vault_url, credential=_credential)
+                _clients[vault_url] = client
+    return client
+
+
+def clear_cache():
+    """Forget all cached secret values and clients."""
+    global _credential
+
+    with _lock:
+        _cache.clear()
+        _clients.clear()
+        _credential = None
+    _prefetched.clear()
+
+
+def _fetch(client, secret_name):
+    """Read a secret value using the client, or None if it couldn't be read."""
+    if client is None:
         logger.error("Azure KeyVault SecretClient was not configured")
+        return None
+
+    outcome = "error"
+    start = time.perf_counter()
+    try:
+        value = client.get_secret(secret_name).value
+        outcome = "ok"
+        return value
+    except ClientAuthenticationError:
+        logger.error("Could not authenticate to Azure KeyVault")
+    except ResourceNotFoundError:
+        outcome = "not_found"
+        logger.error(f"Secret not found: {secret_name}")
+    finally:
+        # local secrets are read from the environment, not requested from Key Vault
+        if not isinstance(client, LocalSecretClient):
+            metrics.observe_outbound(http.KEY_VAULT, time.perf_counter() - start, outcome)
+    return None
+
+
+def _fetch_and_cache(client, secret_name, ttl):
+    value = _fetch(client, secret_name)
+    with _lock:
+        if value is not None:
+            _cache[secret_name] = CachedSecret(value=value, fetched_at=time.monotonic(), ttl=ttl)
+        elif secret_name in _cache:
+            # keep serving the stale value, and try again on the next read
+            _cache[secret_name].refreshing = False
+    return value
+
+
+def _refresh(secret_name, ttl):
+    """Refresh a cached secret value in a background thread."""
+    with _lock:
+        cached = _cache.get(secret_name)
+        if cached is None or cached.refreshing:
+            return
+        cached.refreshing = True
+
+    vault_url = KEY_VAULT_URL.format(env=settings.RUNTIME_ENVIRONMENT()[0])
+    thread = threading.Thread(
+        target=_fetch_and_cache, args=(get_client(vault_url), secret_name, ttl), name="secrets-refresh", daemon=True
+    )
+    thread.start()
+
+
+def get_secret_by_name(secret_name, client=None, ttl=None):
+    """Read a value from the secret store, currently Azure KeyVault.
+
+    When `settings.RUNTIME_ENVIRONMENT() == "local"`, reads from the environment instead.
+
+    When no `client` is given, values are cached for `ttl` seconds (by default, `settings.SECRETS_CACHE_TTL`). After that,
+    for up to `settings.SECRETS_CACHE_STALE_TTL` more seconds the cached value is returned while a background thread
+    reads a fresh value.
+    """
+    NAME_VALIDATOR(secret_name)
+
+    runtime_env = settings.RUNTIME_ENVIRONMENT()
+
+    if runtime_env == "local":
+        logger.debug("Runtime environment is local, reading from environment instead of Azure KeyVault.")
+        return _fetch(LocalSecretClient(), secret_name)
+
+    elif client is not None:
+        return _fetch(client, secret_name)
+
+    ttl = settings.SECRETS_CACHE_TTL if ttl is None else ttl
+    cached = _cache.get(secret_name)
+
+    if cached is not None:
+        age = cached.age()
+        if age < cached.ttl:
+            return cached.value
+        if age < cached.ttl + settings.SECRETS_CACHE_STALE_TTL:
+            _refresh(secret_name, ttl)
+            return cached.value
+
+    # construct the KeyVault URL from the runtime environment
+    # see https://docs.calitp.org/benefits/deployment/infrastructure/#environments
+    # and https://github.com/cal-itp/benefits/blob/main/terraform/key_vault.tf
+    vault_url = KEY_VAULT_URL.format(env=runtime_env[0])
+
+    return _fetch_and_cache(get_client(vault_url), secret_name, ttl)
+
+
+def prefetch(secret_names):
+    """Read each of the named secrets into the cache, e.g. as a worker process starts."""
+    if settings.RUNTIME_ENVIRONMENT() == "local":
+        # secrets are read from the environment, and aren't cached
+        _prefetched.set()
+        return
+
+    for secret_name in secret_names:
+        try:
+            get_secret_by_name(secret_name)
+        except Exception:
+            logger.warning(f"Could not prefetch secret: {secret_name}", exc_info=True)
+    _prefetched.set()
+
 
-    return secret_value
+def warm() -> bool:
+    """Whether the secrets cache is ready to serve requests: `prefetch()` has finished, or secrets aren't cached."""
+    return settings.RUNTIME_ENVIRONMENT() == "local" or _prefetched.is_set()
 
 
 if __name__ == "__main__":
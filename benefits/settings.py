@@ -90,12 +90,14 @@ SSO_SHOW_FORM_ON_ADMIN_PAGE = os.environ.get("SSO_SHOW_FORM_ON_ADMIN_PAGE", "fal
 STAFF_GROUP_NAME = "Cal-ITP"
 
 MIDDLEWARE = [
+    # first, so that health probes skip the rest of the stack
+    "benefits.core.middleware.Healthcheck",
+    "benefits.core.middleware.HealthcheckUserAgents",
+    "benefits.core.middleware.Metrics",
     "django.middleware.security.SecurityMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
     "django.contrib.messages.middleware.MessageMiddleware",
     "django.middleware.locale.LocaleMiddleware",
-    "benefits.core.middleware.Healthcheck",
-    "benefits.core.middleware.HealthcheckUserAgents",
     "django.middleware.common.CommonMiddleware",
     "django.middleware.csrf.CsrfViewMiddleware",
     "django.middleware.clickjacking.XFrameOptionsMiddleware",
@@ -108,6 +110,13 @@ MIDDLEWARE = [
 if DEBUG:
     MIDDLEWARE.append("benefits.core.middleware.DebugSession")
 
+# Record database queries for each request by route, and warn about routes over their query budget
+QUERY_COUNTS = os.environ.get("DJANGO_QUERY_COUNTS", "false").lower() == "true"
+QUERY_COUNTS_FILE = os.environ.get("DJANGO_QUERY_COUNTS_FILE")
+if QUERY_COUNTS:
+    # first, so the queries made by all other middleware are counted too
+    MIDDLEWARE.insert(0, "benefits.core.middleware.QueryCount")
+
 # The Django Debug Toolbar can be toggled on/off but in both cases the application has to be in debug mode
 DEBUG_TOOLBAR = DEBUG and os.environ.get("DJANGO_DEBUG_TOOLBAR", "false").lower() == "true"
 if DEBUG_TOOLBAR:
@@ -119,7 +128,21 @@ if DEBUG_TOOLBAR:
     }
 
 
+# Metrics are served at /metrics only to requests bearing this token
+METRICS_TOKEN = os.environ.get("DJANGO_METRICS_TOKEN")
+# Each process writes its metrics to this directory, so /metrics can add up the metrics of all processes
+METRICS_DIR = os.environ.get("DJANGO_METRICS_DIR")
+try:
+    METRICS_FLUSH_INTERVAL = float(os.environ.get("DJANGO_METRICS_FLUSH_INTERVAL"))
+except Exception:
+    METRICS_FLUSH_INTERVAL = 10
+
 HEALTHCHECK_USER_AGENTS = _filter_empty(os.environ.get("HEALTHCHECK_USER_AGENTS", "").split(","))
+# How long, in seconds, each process reuses the result of the readiness checks at /healthcheck/ready
+try:
+    HEALTHCHECK_READY_CACHE_TTL = float(os.environ.get("HEALTHCHECK_READY_CACHE_TTL"))
+except Exception:
+    HEALTHCHECK_READY_CACHE_TTL = 10
 
 CSRF_COOKIE_AGE = None
 CSRF_COOKIE_SAMESITE = "Strict"
@@ -135,9 +158,35 @@ CSRF_TRUSTED_ORIGINS = _filter_empty(os.environ.get("DJANGO_TRUSTED_ORIGINS", "h
 # OAuth server, as long as the request is "safe" i.e. GET
 SESSION_COOKIE_SAMESITE = "Lax"
 SESSION_ENGINE = "django.contrib.sessions.backends.signed_cookies"
+# the whole session is sent in a cookie with every request and response, keep it small
+SESSION_SERIALIZER = "benefits.core.serializers.CompactSerializer"
 SESSION_EXPIRE_AT_BROWSER_CLOSE = True
 SESSION_COOKIE_NAME = "_benefitssessionid"
 
+# Keep session data server-side in a cache instead, with only the session key in the cookie
+SESSION_STORE = os.environ.get("DJANGO_SESSION_STORE", "cookie").lower()
+SESSION_CACHE_URL = os.environ.get("DJANGO_SESSION_CACHE_URL")
+
+if SESSION_CACHE_URL:
+    # a Redis-compatible store shared by all processes, requires the redis package
+    _sessions_cache = {"BACKEND": "django.core.cache.backends.redis.RedisCache", "LOCATION": SESSION_CACHE_URL}
+else:
+    # in the memory of each process, requires sticky sessions when running more than one
+    _sessions_cache = {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        "LOCATION": "sessions",
+        "OPTIONS": {"MAX_ENTRIES": 10000},
+    }
+
+CACHES = {
+    "default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"},
+    "sessions": _sessions_cache,
+}
+
+if SESSION_STORE == "cache":
+    SESSION_ENGINE = "django.contrib.sessions.backends.cache"
+    SESSION_CACHE_ALIAS = "sessions"
+
 if not DEBUG:
     CSRF_COOKIE_SECURE = True
     CSRF_FAILURE_VIEW = "benefits.views.csrf_failure_handler"
@@ -222,6 +271,25 @@ DATABASES = {
 }
 
 
+# how often each process checks whether configuration cached in memory was changed by another process
+try:
+    CONFIG_CACHE_VERSION_CHECK_INTERVAL = float(os.environ.get("CONFIG_CACHE_VERSION_CHECK_INTERVAL"))
+except Exception:
+    CONFIG_CACHE_VERSION_CHECK_INTERVAL = 10
+
+# how long each process uses a secret value read from Azure KeyVault before reading it again
+try:
+    SECRETS_CACHE_TTL = float(os.environ.get("SECRETS_CACHE_TTL"))
+except Exception:
+    SECRETS_CACHE_TTL = 300
+
+# how long after SECRETS_CACHE_TTL an expired secret value is still used, while a fresh value is read in the background
+try:
+    SECRETS_CACHE_STALE_TTL = float(os.environ.get("SECRETS_CACHE_STALE_TTL"))
+except Exception:
+    SECRETS_CACHE_STALE_TTL = 3600
+
+
 # Password handling
 
 AUTH_PASSWORD_VALIDATORS = [
@@ -333,6 +401,25 @@ sentry.configure(RUNTIME_ENVIRONMENT())
 
 ANALYTICS_KEY = os.environ.get("ANALYTICS_KEY")
 
+# events are delivered to Amplitude in batches by a background thread in each worker process
+try:
+    ANALYTICS_BATCH_SIZE = int(os.environ.get("ANALYTICS_BATCH_SIZE"))
+except Exception:
+    ANALYTICS_BATCH_SIZE = 100
+
+try:
+    ANALYTICS_FLUSH_INTERVAL = float(os.environ.get("ANALYTICS_FLUSH_INTERVAL"))
+except Exception:
+    ANALYTICS_FLUSH_INTERVAL = 5
+
+try:
+    ANALYTICS_QUEUE_SIZE = int(os.environ.get("ANALYTICS_QUEUE_SIZE"))
+except Exception:
+    ANALYTICS_QUEUE_SIZE = 10000
+
+# events that can't be delivered are spooled to disk, for replay by the replay_analytics management command
+ANALYTICS_SPOOL_DIR = os.environ.get("ANALYTICS_SPOOL_DIR", os.path.join(STORAGE_DIR, ".analytics_spool"))
+
 # reCAPTCHA configuration
 
 RECAPTCHA_API_URL = os.environ.get("DJANGO_RECAPTCHA_API_URL", "https://www.google.com/recaptcha/api.js")
@@ -426,6 +513,38 @@ except Exception:
 
 REQUESTS_TIMEOUT = (REQUESTS_CONNECT_TIMEOUT, REQUESTS_READ_TIMEOUT)
 
+# (connect, read) timeouts for specific integrations, overriding REQUESTS_TIMEOUT
+# e.g. REQUESTS_INTEGRATION_TIMEOUTS=analytics=3:5,recaptcha=3:10
+REQUESTS_INTEGRATION_TIMEOUTS = {}
+for integration_timeout in _filter_empty(os.environ.get("REQUESTS_INTEGRATION_TIMEOUTS", "").split(",")):
+    try:
+        integration, timeouts = integration_timeout.split("=")
+        connect_timeout, read_timeout = timeouts.split(":")
+        REQUESTS_INTEGRATION_TIMEOUTS[integration.strip()] = (float(connect_timeout), float(read_timeout))
+    except Exception:
+        pass
+
+# outbound connections are pooled and kept alive, see benefits.core.http
+try:
+    REQUESTS_POOL_CONNECTIONS = int(os.environ.get("REQUESTS_POOL_CONNECTIONS"))
+except Exception:
+    REQUESTS_POOL_CONNECTIONS = 10
+
+try:
+    REQUESTS_POOL_MAXSIZE = int(os.environ.get("REQUESTS_POOL_MAXSIZE"))
+except Exception:
+    REQUESTS_POOL_MAXSIZE = 10
+
+try:
+    REQUESTS_MAX_RETRIES = int(os.environ.get("REQUESTS_MAX_RETRIES"))
+except Exception:
+    REQUESTS_MAX_RETRIES = 2
+
+try:
+    REQUESTS_BACKOFF_FACTOR = float(os.environ.get("REQUESTS_BACKOFF_FACTOR"))
+except Exception:
+    REQUESTS_BACKOFF_FACTOR = 0.5
+
 # Email
 # https://docs.djangoproject.com/en/stable/ref/settings/#email-backend
 # https://github.com/retech-us/django-azure-communication-email
@@ -7,10 +7,42 @@ For more information on this file, see
 https://docs.djangoproject.com/en/stable/howto/deployment/wsgi/
 """
 
+import logging
 import os
+import threading
 
 from django.core.wsgi import get_wsgi_application
 
 os.environ.setdefault("DJANGO_SETTINGS_MODULE", "benefits.settings")
 
 application = get_wsgi_application()
+
+
+def load_routes():
+    """Build the route table and reverse the URLs of routes without arguments, so requests don't have to."""
+    from benefits.routes import routes
+
+    routes.urls()
+
+
+load_routes()
+
+
+def prefetch_secrets():
+    """Read the secrets used by the app's configuration into the cache, so the first requests don't wait on KeyVault."""
+    from django.db import connection
+
+    from benefits import secrets
+    from benefits.core.models import secret_names
+
+    try:
+        secrets.prefetch(secret_names())
+    except Exception:
+        logging.getLogger(__name__).warning("Could not prefetch secrets", exc_info=True)
+        # don't hold back readiness, secrets are read when first used instead
+        secrets.prefetch([])
+    finally:
+        connection.close()
+
+
+threading.Thread(target=prefetch_secrets, name="secrets-prefetch", daemon=True).start()
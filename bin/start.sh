@@ -9,6 +9,12 @@ python manage.py compilemessages
 
 python manage.py collectstatic --no-input
 
+# remove metrics from previous runs of the application server
+
+if [[ -n "${DJANGO_METRICS_DIR:-}" ]]; then
+    rm -rf "$DJANGO_METRICS_DIR"
+fi
+
 # start the web server
 
 nginx
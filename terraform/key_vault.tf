@@ -128,6 +128,20 @@ resource "azurerm_key_vault_access_policy" "pgadmin_container_app" {
   depends_on = [azurerm_key_vault.main]
 }
 
+# Standalone Access Policies for the scheduled Container App Jobs' Managed Identities
+resource "azurerm_key_vault_access_policy" "container_app_jobs" {
+  for_each = toset(module.application.job_names)
+
+  key_vault_id = azurerm_key_vault.main.id
+  tenant_id    = data.azurerm_client_config.current.tenant_id
+  object_id    = module.application.job_principal_ids[each.key]
+
+  secret_permissions = ["Get"]
+
+  # This ensures the Key Vault itself is created before trying to attach a policy.
+  depends_on = [azurerm_key_vault.main]
+}
+
 # these declarations can be removed as soon as the application service has been torn down in the production env
 moved {
   from = random_password.django_db_password
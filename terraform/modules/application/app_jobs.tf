@@ -0,0 +1,105 @@
+# Scheduled Container App Jobs running Django management commands, with the same image and configuration as the web app
+locals {
+  # cron expressions are in UTC; keys are at most 7 characters, for job names of at most 32
+  scheduled_jobs = {
+    # Rebuild the daily enrollment rollups of the last week, once the day is over in Pacific time
+    "rollups" = {
+      command = "python manage.py rollup_enrollment_events"
+      cron    = "30 9 * * *"
+    }
+    # Create the monthly partitions of the enrollment events for the next 3 months, once the table is partitioned
+    "parts" = {
+      command = "python manage.py partition_enrollment_events --months-ahead 3 --skip-unpartitioned"
+      cron    = "0 10 * * 1"
+    }
+    # Send the analytics events spooled to disk while Amplitude was unavailable
+    "replay" = {
+      command = "python manage.py replay_analytics"
+      cron    = "*/10 * * * *"
+    }
+  }
+}
+
+resource "azurerm_container_app_job" "scheduled" {
+  for_each = local.scheduled_jobs
+
+  name                         = "caj-cdt-pub-vip-calitp-${lower(var.env_letter)}-${each.key}"
+  location                     = var.location
+  container_app_environment_id = azurerm_container_app_environment.main.id
+  resource_group_name          = var.resource_group_name
+  workload_profile_name        = "Consumption"
+  replica_timeout_in_seconds   = 1800
+  replica_retry_limit          = 1
+
+  identity {
+    type = "SystemAssigned"
+  }
+
+  schedule_trigger_config {
+    cron_expression          = each.value.cron
+    parallelism              = 1
+    replica_completion_count = 1
+  }
+
+  dynamic "secret" {
+    # Only include secrets where 'exists' is true
+    for_each = { for k, v in local.app_config_secrets : k => v if v.exists }
+    content {
+      name                = secret.key
+      identity            = "System"
+      key_vault_secret_id = "${var.key_vault_secret_uri_prefix}/${secret.key}"
+    }
+  }
+
+  template {
+    volume {
+      name         = azurerm_container_app_environment_storage.web.name
+      storage_name = azurerm_container_app_environment_storage.web.name
+      storage_type = "AzureFile"
+    }
+
+    container {
+      name   = each.key
+      image  = "${var.container_registry}/${var.container_repository}:${var.container_tag}"
+      cpu    = 0.5
+      memory = "1Gi"
+
+      # the image's entrypoint is bash, run the job's command instead of the app's setup and start scripts
+      command = ["/bin/bash"]
+      args    = ["-c", each.value.command]
+
+      volume_mounts {
+        name = azurerm_container_app_environment_storage.web.name
+        path = local.django_storage_dir_path
+      }
+
+      # Set environment variables referencing secret config values
+      dynamic "env" {
+        for_each = { for k, v in local.app_config_secrets : k => v if v.exists }
+        content {
+          name        = env.value.env_name
+          secret_name = env.key
+        }
+      }
+
+      # Set environment variables referencing non-secret config values
+      dynamic "env" {
+        for_each = local.app_config
+        content {
+          name  = env.key
+          value = env.value
+        }
+      }
+    }
+  }
+
+  lifecycle {
+    ignore_changes = [
+      tags
+    ]
+  }
+
+  depends_on = [
+    azurerm_container_app_environment_storage.web
+  ]
+}
@@ -80,6 +80,14 @@ resource "azurerm_container_app" "web" {
         failure_count_threshold = 5
         initial_delay           = 15
       }
+
+      readiness_probe {
+        transport               = "HTTP"
+        port                    = 8000
+        path                    = "/healthcheck/ready"
+        failure_count_threshold = 3
+        initial_delay           = 15
+      }
     }
   }
 
@@ -9,3 +9,14 @@ output "pgadmin_principal_id" {
   value       = azurerm_container_app.pgadmin.identity[0].principal_id
   sensitive   = true
 }
+
+output "job_names" {
+  description = "The names of the scheduled Container App Jobs, the keys of job_principal_ids"
+  value       = keys(azurerm_container_app_job.scheduled)
+}
+
+output "job_principal_ids" {
+  description = "The Principal IDs of the scheduled Container App Jobs' Managed Identities, by job name"
+  value       = { for name, job in azurerm_container_app_job.scheduled : name => job.identity[0].principal_id }
+  sensitive   = true
+}
@@ -0,0 +1,57 @@
+"""
+Compare two benchmark results files, e.g. from the previous and the upcoming release.
+
+    python -m tests.benchmarks.compare baseline.json current.json
+"""
+
+import argparse
+import json
+
+
+def compare(baseline: dict, current: dict) -> list[str]:
+    """Lines showing the change in median latency, queries and outbound calls for each step in both results."""
+    lines = []
+
+    for funnel, steps in current["funnels"].items():
+        baseline_steps = baseline.get("funnels", {}).get(funnel, {})
+        lines.append(f"{funnel}:")
+        lines.append(f"  {'step':<34} {'median ms':>20} {'queries':>12} {'outbound calls':>16}")
+
+        for step, result in steps.items():
+            before = baseline_steps.get(step)
+            if before is None:
+                lines.append(f"  {step:<34} {'(new)':>20}")
+                continue
+
+            ms, ms_before = result["latency_ms"]["median"], before["latency_ms"]["median"]
+            change = f"{(ms - ms_before) / ms_before:+.0%}" if ms_before else ""
+            queries, queries_before = result["queries_per_request"], before["queries_per_request"]
+            calls = sum(result["outbound_calls_per_request"].values())
+            calls_before = sum(before["outbound_calls_per_request"].values())
+
+            lines.append(
+                f"  {step:<34} {ms_before:>8.1f} -> {ms:>6.1f} {change:>4} {queries_before:>5g} -> {queries:<4g}"
+                f" {calls_before:>6g} -> {calls:<6g}"
+            )
+
+    return lines
+
+
+def main(args=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("baseline", help="Path to the baseline results JSON")
+    parser.add_argument("current", help="Path to the current results JSON")
+    args = parser.parse_args(args)
+
+    with open(args.baseline) as f:
+        baseline = json.load(f)
+    with open(args.current) as f:
+        current = json.load(f)
+
+    print(f"{baseline['version']} -> {current['version']}")
+    for line in compare(baseline, current):
+        print(line)
+
+
+if __name__ == "__main__":
+    main()
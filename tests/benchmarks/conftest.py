@@ -0,0 +1,326 @@
+import datetime
+import json
+import os
+import platform
+import uuid
+from pathlib import Path
+
+import django
+import pytest
+from cryptography import x509
+from cryptography.hazmat.primitives import hashes, serialization
+from cryptography.hazmat.primitives.asymmetric import rsa
+from cryptography.x509.oid import NameOID
+
+import benefits
+from benefits import secrets
+from benefits.core import analytics, cache, http
+from benefits.core.models import (
+    EligibilityApiVerificationRequest,
+    EnrollmentFlow,
+    Environment,
+    PemData,
+    SystemName,
+    TransitAgency,
+)
+from benefits.enrollment_littlepay import enrollment as littlepay_enrollment
+from benefits.enrollment_littlepay.models import LittlepayConfig, LittlepayGroup
+from benefits.enrollment_switchio import api as switchio_api
+from benefits.enrollment_switchio.models import SwitchioConfig, SwitchioGroup
+
+from .fakes import FakeAmplitude, FakeEligibilityApi, FakeKeyVault, FakeLittlepay, FakeSwitchio
+
+RESULTS_DIR = Path(__file__).parent / "results"
+
+results_key = pytest.StashKey[dict]()
+results_path_key = pytest.StashKey[Path]()
+
+
+def _env_int(name, default):
+    try:
+        return int(os.environ.get(name))
+    except Exception:
+        return default
+
+
+def pytest_configure(config):
+    config.stash[results_key] = {}
+
+
+def pytest_terminal_summary(terminalreporter, config):
+    results = config.stash.get(results_key, {})
+    if not results:
+        return
+
+    terminalreporter.section("enrollment funnel benchmarks")
+    for funnel, steps in results.items():
+        terminalreporter.write_line(f"{funnel}:")
+        terminalreporter.write_line(
+            f"  {'step':<34} {'median ms':>10} {'p95 ms':>10} {'queries':>8} {'cookie B':>8} {'as JSON':>8}"
+            f" {'Set-Cookie B':>12}  outbound calls"
+        )
+        for step, result in steps.items():
+            latency = result["latency_ms"]
+            cookie = result["session_cookie_bytes"]
+            calls = ", ".join(f"{name}={count:g}" for name, count in result["outbound_calls_per_request"].items())
+            terminalreporter.write_line(
+                f"  {step:<34} {latency['median']:>10.2f} {latency['p95']:>10.2f} {result['queries_per_request']:>8g}"
+                f" {cookie['compact']:>8} {cookie['json']:>8} {result['set_cookie_bytes_per_request']:>12g}  {calls}"
+            )
+
+    path = config.stash.get(results_path_key, None)
+    if path:
+        terminalreporter.write_line(f"Results written to: {path}")
+
+
+@pytest.fixture(scope="session")
+def latency():
+    """Latency of each fake service, in seconds."""
+    return _env_int("BENCHMARK_LATENCY_MS", 50) / 1000
+
+
+@pytest.fixture(scope="session")
+def rounds():
+    """How many riders go through each funnel."""
+    return max(1, _env_int("BENCHMARK_ROUNDS", 5))
+
+
+@pytest.fixture(scope="session")
+def benchmark_results(pytestconfig, latency, rounds):
+    """Results for each funnel, by name; written as JSON when the session finishes."""
+    results = pytestconfig.stash[results_key]
+    yield results
+
+    if not results:
+        return
+
+    version = getattr(benefits, "__version__", "unknown")
+    path = Path(os.environ.get("BENCHMARK_RESULTS") or RESULTS_DIR / f"benefits-{version}.json")
+    path.parent.mkdir(parents=True, exist_ok=True)
+
+    document = {
+        "version": version,
+        "created": datetime.datetime.now(datetime.timezone.utc).isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "django": django.get_version(),
+        "latency_ms": latency * 1000,
+        "rounds": rounds,
+        "funnels": results,
+    }
+    path.write_text(json.dumps(document, indent=2) + "\n")
+    pytestconfig.stash[results_path_key] = path
+
+
+def _private_key():
+    return rsa.generate_private_key(public_exponent=65537, key_size=2048)
+
+
+def _private_pem(key):
+    return key.private_bytes(
+        serialization.Encoding.PEM, serialization.PrivateFormat.PKCS8, serialization.NoEncryption()
+    ).decode("utf-8")
+
+
+def _public_pem(key):
+    return (
+        key.public_key()
+        .public_bytes(serialization.Encoding.PEM, serialization.PublicFormat.SubjectPublicKeyInfo)
+        .decode("utf-8")
+    )
+
+
+def _certificate_pem(key):
+    name = x509.Name([x509.NameAttribute(NameOID.COMMON_NAME, "benchmark")])
+    now = datetime.datetime.now(datetime.timezone.utc)
+    certificate = (
+        x509.CertificateBuilder()
+        .subject_name(name)
+        .issuer_name(name)
+        .public_key(key.public_key())
+        .serial_number(x509.random_serial_number())
+        .not_valid_before(now - datetime.timedelta(days=1))
+        .not_valid_after(now + datetime.timedelta(days=1))
+        .add_extension(x509.BasicConstraints(ca=True, path_length=None), critical=True)
+        .sign(key, hashes.SHA256())
+    )
+    return certificate.public_bytes(serialization.Encoding.PEM).decode("utf-8")
+
+
+@pytest.fixture(scope="session")
+def keys():
+    """PEM-encoded keys for the Eligibility API client and server, and a client certificate for Switchio."""
+    client, server, switchio = _private_key(), _private_key(), _private_key()
+    return {
+        "client-private-key": _private_pem(client),
+        "client-public-key": _public_pem(client),
+        "server-private-key": _private_pem(server),
+        "server-public-key": _public_pem(server),
+        "switchio-private-key": _private_pem(switchio),
+        "switchio-certificate": _certificate_pem(switchio),
+    }
+
+
+@pytest.fixture(scope="session")
+def fake_littlepay(latency):
+    fake = FakeLittlepay(latency=latency).start()
+    yield fake
+    fake.stop()
+
+
+@pytest.fixture(scope="session")
+def fake_switchio(latency):
+    fake = FakeSwitchio(latency=latency).start()
+    yield fake
+    fake.stop()
+
+
+@pytest.fixture(scope="session")
+def fake_eligibility_api(latency, keys):
+    fake = FakeEligibilityApi(keys["server-private-key"], keys["client-public-key"], latency=latency).start()
+    yield fake
+    fake.stop()
+
+
+@pytest.fixture(scope="session")
+def fake_amplitude(latency):
+    fake = FakeAmplitude(latency=latency).start()
+    yield fake
+    fake.stop()
+
+
+@pytest.fixture(scope="session")
+def fake_key_vault(latency, keys, fake_littlepay, fake_switchio):
+    return FakeKeyVault(
+        {
+            "littlepay-qa-api-base-url": fake_littlepay.url,
+            "littlepay-client-secret": "client-secret",
+            "switchio-tokenization-api-base-url": fake_switchio.url,
+            "switchio-enrollment-api-base-url": fake_switchio.url,
+            "switchio-enrollment-api-authorization-header": "enrollment-api-key",
+            "switchio-tokenization-api-secret": "tokenization-api-secret",
+            "switchio-client-cert": keys["switchio-certificate"],
+            "switchio-ca-cert": keys["switchio-certificate"],
+            "switchio-private-key": keys["switchio-private-key"],
+            "eligibility-api-auth-key": "eligibility-api-key",
+            "eligibility-client-private-key": keys["client-private-key"],
+            "eligibility-client-public-key": keys["client-public-key"],
+            "eligibility-server-public-key": keys["server-public-key"],
+        },
+        latency=latency,
+    )
+
+
+@pytest.fixture
+def fakes(fake_littlepay, fake_switchio, fake_eligibility_api, fake_amplitude, fake_key_vault):
+    return [fake_littlepay, fake_switchio, fake_eligibility_api, fake_amplitude, fake_key_vault]
+
+
+@pytest.fixture(params=["cookie", "cache"])
+def session_store(request, settings):
+    """Run each funnel with the session in a signed cookie, and with the session in a server-side cache."""
+    if request.param == "cache":
+        settings.SESSION_ENGINE = "django.contrib.sessions.backends.cache"
+        settings.SESSION_CACHE_ALIAS = "sessions"
+    return request.param
+
+
+@pytest.fixture
+def funnel_name(session_store):
+    """The name to report a funnel's results under, e.g. `littlepay` or `littlepay (cache sessions)`."""
+
+    def name(funnel):
+        return funnel if session_store == "cookie" else f"{funnel} ({session_store} sessions)"
+
+    return name
+
+
+@pytest.fixture(autouse=True)
+def benchmark_environment(settings, monkeypatch, fake_key_vault, fake_amplitude):
+    """Point the app at the fakes, starting from cold caches and connection pools, as a new worker process would."""
+    # read secrets from the fake Key Vault, through the secrets cache
+    settings.RUNTIME_ENVIRONMENT = lambda: "dev"
+    monkeypatch.setattr(secrets, "get_client", lambda vault_url: fake_key_vault)
+
+    # send analytics events to the fake Amplitude
+    monkeypatch.setattr(analytics.client, "api_key", "benchmark")
+    monkeypatch.setattr(analytics.client, "url", f"{fake_amplitude.url}/2/httpapi")
+
+    # the fakes use plain HTTP
+    monkeypatch.setenv("AUTHLIB_INSECURE_TRANSPORT", "1")
+
+    caches = (secrets.clear_cache, cache.clear, http.clear, littlepay_enrollment.clear_clients, switchio_api.clear_sessions)
+    for clear in caches:
+        clear()
+    yield
+    analytics.client.flush(timeout=10)
+    for clear in caches:
+        clear()
+
+
+@pytest.fixture
+def model_EnrollmentFlow(fake_eligibility_api):
+    api_request = EligibilityApiVerificationRequest.objects.create(
+        label="benchmark",
+        api_url=f"{fake_eligibility_api.url}/verify",
+        api_auth_header="X-Server-API-Key",
+        api_auth_key_secret_name="eligibility-api-auth-key",
+        api_jwe_cek_enc=fake_eligibility_api.enc,
+        api_jwe_encryption_alg=fake_eligibility_api.alg,
+        api_jws_signing_alg=fake_eligibility_api.sig,
+        client_private_key=PemData.objects.create(
+            label="client private key", text_secret_name="eligibility-client-private-key"
+        ),
+        client_public_key=PemData.objects.create(label="client public key", text_secret_name="eligibility-client-public-key"),
+        api_public_key=PemData.objects.create(label="server public key", text_secret_name="eligibility-server-public-key"),
+    )
+
+    return EnrollmentFlow.objects.create(
+        system_name=SystemName.COURTESY_CARD,
+        label="Courtesy Card",
+        api_request=api_request,
+        supports_expiration=False,
+    )
+
+
+def _agency(slug):
+    return TransitAgency.objects.create(
+        slug=slug,
+        short_name=slug.upper(),
+        long_name=f"Benchmark Transit Agency ({slug})",
+        info_url="https://example.com/agency",
+        phone="800-555-5555",
+        active=True,
+        logo="agencies/cst.png",
+    )
+
+
+@pytest.fixture
+def littlepay_agency(model_EnrollmentFlow):
+    agency = _agency("lpbench")
+    agency.enrollment_flows.add(model_EnrollmentFlow)
+    agency.transit_processor_config = LittlepayConfig.objects.create(
+        environment=Environment.TEST,
+        client_id="client-id",
+        client_secret_name="littlepay-client-secret",
+        audience="audience",
+    )
+    agency.save()
+    LittlepayGroup.objects.create(group_id=uuid.uuid4(), enrollment_flow=model_EnrollmentFlow, transit_agency=agency)
+
+    return agency
+
+
+@pytest.fixture
+def switchio_agency(model_EnrollmentFlow):
+    agency = _agency("swbench")
+    agency.enrollment_flows.add(model_EnrollmentFlow)
+    agency.transit_processor_config = SwitchioConfig.objects.create(
+        environment=Environment.TEST,
+        tokenization_api_key="tokenization-api-key",
+        tokenization_api_secret_name="switchio-tokenization-api-secret",
+        pto_id=1,
+    )
+    agency.save()
+    SwitchioGroup.objects.create(enrollment_flow=model_EnrollmentFlow, transit_agency=agency)
+
+    return agency
@@ -0,0 +1,252 @@
+"""
+In-process fakes of the services the app calls out to, for benchmarking the enrollment funnel.
+
+Each fake HTTP server answers every request after a configurable `latency` (in seconds), and counts the requests it
+receives. The Key Vault fake is an in-process `SecretClient` stand-in, since the Azure SDK only talks to HTTPS endpoints
+with Azure AD authentication.
+"""
+
+import json
+import re
+import threading
+import time
+import uuid
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs
+
+from eligibility_api import server as eligibility_server
+
+from benefits.secrets import LocalSecretClient
+
+
+class FakeServer:
+    """Base class for a fake HTTP service: subclasses implement `handle()` for their API."""
+
+    name = None
+
+    def __init__(self, latency=0.0):
+        self.latency = latency
+        self.requests = 0
+        self._lock = threading.Lock()
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), self._handler_class())
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(target=self._server.serve_forever, name=f"fake-{self.name}", daemon=True)
+
+    @property
+    def url(self):
+        return f"http://127.0.0.1:{self._server.server_port}"
+
+    def start(self):
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+    def handle(self, method: str, path: str, headers, body: bytes) -> tuple[int, object]:
+        """Return the (status code, response body) for the request. Dict and list bodies are sent as JSON."""
+        raise NotImplementedError()
+
+    def _dispatch(self, method, path, headers, body):
+        with self._lock:
+            self.requests += 1
+        if self.latency:
+            time.sleep(self.latency)
+        return self.handle(method, path, headers, body)
+
+    def _handler_class(self):
+        fake = self
+
+        class Handler(BaseHTTPRequestHandler):
+            # keep connections alive, like the real services
+            protocol_version = "HTTP/1.1"
+
+            def _respond(self):
+                length = int(self.headers.get("Content-Length") or 0)
+                body = self.rfile.read(length) if length else b""
+                status, content = fake._dispatch(self.command, self.path, self.headers, body)
+
+                if isinstance(content, (dict, list)):
+                    content, content_type = json.dumps(content).encode("utf-8"), "application/json"
+                else:
+                    content, content_type = str(content or "").encode("utf-8"), "text/plain"
+
+                self.send_response(status)
+                self.send_header("Content-Type", content_type)
+                self.send_header("Content-Length", str(len(content)))
+                self.end_headers()
+                self.wfile.write(content)
+
+            do_GET = do_POST = do_PUT = _respond
+
+            def log_message(self, *args):
+                pass
+
+        return Handler
+
+
+class FakeLittlepay(FakeServer):
+    """Littlepay's OAuth, card tokenization, funding source and concession group APIs.
+
+    By default no funding source is enrolled in any group. With a `group_size`, every funding source is linked to the
+    concession group `group_id` (reported in upper case), which lists `group_size` funding sources with `funding_source_id`
+    last.
+    """
+
+    name = "littlepay"
+
+    def __init__(self, latency=0.0):
+        super().__init__(latency=latency)
+        self.group_id = None
+        self.group_size = 0
+        self.funding_source_id = None
+
+    def _group_funding_sources(self, query):
+        """The page of the group's funding sources requested in the `query` string."""
+        params = parse_qs(query)
+        page, per_page = int(params.get("page", ["1"])[0]), int(params.get("per_page", ["100"])[0])
+        start, end = (page - 1) * per_page, min(page * per_page, self.group_size)
+        items = [
+            {
+                "id": (
+                    self.funding_source_id if index == self.group_size - 1 else str(uuid.uuid5(uuid.NAMESPACE_OID, str(index)))
+                ),
+                "created_date": "2025-01-01T00:00:00Z",
+                "updated_date": None,
+                "expiry_date": None,
+            }
+            for index in range(start, end)
+        ]
+        return {"list": items, "total_count": self.group_size}
+
+    def handle(self, method, path, headers, body):
+        path, _, query = path.partition("?")
+
+        if method == "POST" and path == "/api/v1/oauth/token":
+            return 200, {"access_token": uuid.uuid4().hex, "token_type": "Bearer", "expires_in": 3600}
+        elif method == "POST" and path == "/api/v1/cardtokenisation/requestaccess":
+            return 200, {"access_token": uuid.uuid4().hex, "token_type": "Bearer", "expires_at": int(time.time()) + 600}
+        elif match := re.fullmatch(r"/api/v1/fundingsources/bytoken/([^/]+)", path):
+            return 200, {
+                "id": str(uuid.uuid5(uuid.NAMESPACE_OID, match.group(1))),
+                "card_first_digits": "4111",
+                "card_last_digits": "1111",
+                "card_expiry_month": "12",
+                "card_expiry_year": "30",
+                "card_scheme": "Visa",
+                "card_category": "Credit",
+                "form_factor": "physical",
+                "participant_id": "benchmark",
+                "is_fpan": True,
+                "related_funding_sources": [],
+            }
+        elif re.fullmatch(r"/api/v1/fundingsources/[^/]+/concession_groups", path):
+            if not self.group_size:
+                # not yet enrolled in any group
+                return 200, {"list": [], "total_count": 0}
+            group = {"id": "0", "group_id": str(self.group_id).upper(), "label": "Benchmark", "created_date": None}
+            return 200, {"list": [group], "total_count": 1}
+        elif method == "GET" and re.fullmatch(r"/api/v1/concession_groups/[^/]+/fundingsources", path):
+            return 200, self._group_funding_sources(query)
+        elif method in ("POST", "PUT") and re.fullmatch(r"/api/v1/concession_groups/[^/]+/fundingsources(/[^/]+)?", path):
+            return 200, {}
+
+        return 404, {"error": f"Not found: {method} {path}"}
+
+
+class FakeSwitchio(FakeServer):
+    """Switchio's tokenization gateway registration and enrollment (discount group) APIs."""
+
+    name = "switchio"
+
+    def handle(self, method, path, headers, body):
+        if method == "POST" and path == "/api/v1/registration":
+            reg_id = uuid.uuid4().hex
+            return 200, {"regId": reg_id, "gtwUrl": f"{self.url}/gateway/{reg_id}"}
+        elif method == "GET" and path.startswith("/api/v1/registration/"):
+            return 200, {
+                "regState": "tokenization_finished",
+                "created": "2025-01-01T00:00:00Z",
+                "mode": "register",
+                "eshopResponseMode": "query",
+                "tokens": [
+                    {
+                        "token": "benchmark-card-token",
+                        "tokenVersion": 1,
+                        "tokenState": "active",
+                        "validFrom": "2025-01-01T00:00:00Z",
+                        "validTo": "2035-01-01T00:00:00Z",
+                        "testOnly": True,
+                    }
+                ],
+            }
+        elif method == "GET" and re.fullmatch(r"/api/external/discount/[^/]+/token/[^/]+", path):
+            # not yet enrolled in any group
+            return 200, []
+        elif method == "POST" and re.fullmatch(r"/api/external/discount/[^/]+/token/[^/]+/(add|remove)", path):
+            return 200, ""
+
+        return 404, {"error": f"Not found: {method} {path}"}
+
+
+class FakeEligibilityApi(FakeServer):
+    """An Eligibility API server, that verifies every subject for the requested types."""
+
+    name = "eligibility_api"
+
+    def __init__(self, server_private_key, client_public_key, latency=0.0, alg="RSA-OAEP", enc="A256CBC-HS512", sig="RS256"):
+        super().__init__(latency=latency)
+        self.server_private_key = server_private_key
+        self.client_public_key = client_public_key
+        self.alg, self.enc, self.sig = alg, enc, sig
+
+    def handle(self, method, path, headers, body):
+        token = headers.get("Authorization", "").removeprefix("Bearer ")
+        payload = eligibility_server.get_token_payload(
+            token, self.alg, self.enc, self.server_private_key, self.sig, self.client_public_key
+        )
+        if not payload:
+            return 400, "Invalid token"
+
+        response = eligibility_server.create_response_payload(payload, issuer=self.name)
+        response["eligibility"] = payload["eligibility"]
+        return 200, eligibility_server.make_token(
+            response, self.sig, self.server_private_key, self.alg, self.enc, self.client_public_key
+        )
+
+
+class FakeAmplitude(FakeServer):
+    """Amplitude's HTTP V2 API, counting the events it receives."""
+
+    name = "amplitude"
+
+    def __init__(self, latency=0.0):
+        super().__init__(latency=latency)
+        self.events = 0
+
+    def handle(self, method, path, headers, body):
+        events = len(json.loads(body or b"{}").get("events", []))
+        with self._lock:
+            self.events += events
+        return 200, {"code": 200, "events_ingested": events}
+
+
+class FakeKeyVault(LocalSecretClient):
+    """An in-process stand-in for an Azure Key Vault `SecretClient`, with the same `latency` and counting as the servers."""
+
+    name = "key_vault"
+
+    def __init__(self, secrets: dict, latency=0.0):
+        # LocalSecretClient looks up names with underscores instead of hyphens
+        super().__init__({name.replace("-", "_"): value for name, value in secrets.items()})
+        self.latency = latency
+        self.requests = 0
+        self._lock = threading.Lock()
+
+    def get_secret(self, name):
+        with self._lock:
+            self.requests += 1
+        if self.latency:
+            time.sleep(self.latency)
+        return super().get_secret(name)
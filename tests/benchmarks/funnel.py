@@ -0,0 +1,157 @@
+"""
+Records per-view latency, database queries, outbound calls and session cookie size while driving the enrollment funnel.
+"""
+
+import math
+import statistics
+import time
+from dataclasses import dataclass, field
+from importlib import import_module
+
+from django.conf import settings
+from django.core import signing
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from benefits.core import analytics
+
+
+@dataclass
+class Sample:
+    """One request to a view."""
+
+    seconds: float
+    queries: int
+    calls: dict[str, int]
+    cookie_bytes: int
+    json_cookie_bytes: int
+    set_cookie_bytes: int
+
+
+def _percentile(values, percent):
+    """The nearest-rank percentile of the values."""
+    values = sorted(values)
+    return values[max(0, math.ceil(percent / 100 * len(values)) - 1)]
+
+
+def _cookie_bytes(client):
+    """The size of the session cookie in the `client`, and what its size would be as a signed cookie with Django's
+    `JSONSerializer`."""
+    cookie = client.cookies.get(settings.SESSION_COOKIE_NAME)
+    if cookie is None or not cookie.value:
+        return 0, 0
+
+    data = import_module(settings.SESSION_ENGINE).SessionStore(cookie.value).load()
+    as_json = signing.dumps(
+        data, salt="django.contrib.sessions.backends.signed_cookies", compress=True, serializer=signing.JSONSerializer
+    )
+    return len(cookie.value), len(as_json)
+
+
+def _set_cookie_bytes(response):
+    """The size of the response's Set-Cookie header for the session cookie, or 0 if the response doesn't set it."""
+    cookie = response.cookies.get(settings.SESSION_COOKIE_NAME)
+    return len(cookie.output()) if cookie is not None else 0
+
+
+@dataclass
+class Funnel:
+    """Sends requests through a Django test `client`, recording a `Sample` for each named step.
+
+    Outbound calls are counted by the `fakes` that received them during the step. Analytics events are delivered by a
+    background thread off the request path: the queue is flushed after each step (outside the timed section), so that the
+    Amplitude calls are counted against the step that sent the events.
+    """
+
+    fakes: list
+    samples: dict[str, list[Sample]] = field(default_factory=dict)
+
+    def _counts(self):
+        return {fake.name: fake.requests for fake in self.fakes}
+
+    def request(self, client, step, method, path, data=None, **kwargs):
+        """Send a `method` request to `path`, recording its sample under `step`; and return the response."""
+        before = self._counts()
+
+        with CaptureQueriesContext(connection) as queries:
+            start = time.perf_counter()
+            response = getattr(client, method)(path, data, **kwargs)
+            seconds = time.perf_counter() - start
+
+        analytics.client.flush(timeout=10)
+
+        after = self._counts()
+        calls = {name: after[name] - before[name] for name in after}
+        cookie_bytes, json_cookie_bytes = _cookie_bytes(client)
+        self.samples.setdefault(step, []).append(
+            Sample(
+                seconds=seconds,
+                queries=len(queries),
+                calls=calls,
+                cookie_bytes=cookie_bytes,
+                json_cookie_bytes=json_cookie_bytes,
+                set_cookie_bytes=_set_cookie_bytes(response),
+            )
+        )
+
+        return response
+
+    def call(self, step, func, *args, **kwargs):
+        """Call `func` directly rather than through a view, recording its sample under `step`; and return its result."""
+        before = self._counts()
+
+        with CaptureQueriesContext(connection) as queries:
+            start = time.perf_counter()
+            result = func(*args, **kwargs)
+            seconds = time.perf_counter() - start
+
+        after = self._counts()
+        self.samples.setdefault(step, []).append(
+            Sample(
+                seconds=seconds,
+                queries=len(queries),
+                calls={name: after[name] - before[name] for name in after},
+                cookie_bytes=0,
+                json_cookie_bytes=0,
+                set_cookie_bytes=0,
+            )
+        )
+
+        return result
+
+    def get(self, client, step, path, data=None, **kwargs):
+        return self.request(client, step, "get", path, data, **kwargs)
+
+    def post(self, client, step, path, data=None, **kwargs):
+        return self.request(client, step, "post", path, data, **kwargs)
+
+    def summary(self) -> dict:
+        """Latency (in milliseconds), queries, outbound calls and session Set-Cookie bytes per request, and the largest
+        session cookie (in bytes) for each step, in funnel order."""
+        summary = {}
+
+        for step, samples in self.samples.items():
+            ms = [s.seconds * 1000 for s in samples]
+            names = samples[0].calls.keys()
+            summary[step] = {
+                "requests": len(samples),
+                "latency_ms": {
+                    "min": round(min(ms), 2),
+                    "median": round(statistics.median(ms), 2),
+                    "p95": round(_percentile(ms, 95), 2),
+                    "max": round(max(ms), 2),
+                },
+                "queries_per_request": round(statistics.mean(s.queries for s in samples), 2),
+                "outbound_calls_per_request": {
+                    name: round(statistics.mean(s.calls[name] for s in samples), 2)
+                    for name in names
+                    if any(s.calls[name] for s in samples)
+                },
+                "session_cookie_bytes": {
+                    "compact": max(s.cookie_bytes for s in samples),
+                    "json": max(s.json_cookie_bytes for s in samples),
+                },
+                "set_cookie_bytes_per_request": round(statistics.mean(s.set_cookie_bytes for s in samples), 2),
+            }
+
+        return summary
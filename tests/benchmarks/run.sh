@@ -0,0 +1,7 @@
+#!/usr/bin/env bash
+set -eu
+
+# run the enrollment funnel benchmarks
+# configure with BENCHMARK_LATENCY_MS, BENCHMARK_ROUNDS, BENCHMARK_ADMIN_EVENTS and BENCHMARK_RESULTS,
+# and DATABASE_URL to run against PostgreSQL
+pytest tests/benchmarks "$@"
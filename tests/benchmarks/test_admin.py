@@ -0,0 +1,132 @@
+import datetime
+import os
+import random
+
+import pytest
+from django.contrib import admin
+from django.contrib.admin.views.main import ChangeList
+from django.contrib.auth.models import User
+from django.db import connection
+from django.test import Client
+from django.urls import reverse
+
+from benefits.core.models import EnrollmentEvent, EnrollmentMethods
+
+from .conftest import _agency
+from .funnel import Funnel
+
+CHANGELIST = reverse("admin:core_enrollmentevent_changelist")
+
+
+@pytest.fixture
+def events():
+    """How many enrollment events to seed the table with: by default millions on PostgreSQL, where they're generated by the
+    database, and fewer on SQLite, where they're created through the ORM."""
+    try:
+        return int(os.environ.get("BENCHMARK_ADMIN_EVENTS"))
+    except Exception:
+        return 2_000_000 if connection.vendor == "postgresql" else 100_000
+
+
+def _seed_postgresql(events, agencies, flow):
+    """Generate the events in a single INSERT ... SELECT, then update the planner's statistics as autovacuum would."""
+    table = EnrollmentEvent._meta.db_table
+    columns = [
+        EnrollmentEvent._meta.get_field(name).column
+        for name in ("id", "transit_agency", "enrollment_flow", "enrollment_method", "verified_by", "enrollment_datetime")
+    ]
+    columns.append(EnrollmentEvent._meta.get_field("extra_claims").column)
+
+    with connection.cursor() as cursor:
+        cursor.execute("SELECT setseed(0.5)")
+        cursor.execute(
+            f"""
+            INSERT INTO {table} ({", ".join(columns)})
+            SELECT
+                gen_random_uuid(),
+                (%(agencies)s::integer[])[1 + floor(random() * %(agency_count)s)::integer],
+                %(flow)s,
+                (%(methods)s::text[])[1 + floor(random() * 2)::integer],
+                'benchmark',
+                now() - random() * interval '730 days',
+                ''
+            FROM generate_series(1, %(events)s)
+            """,
+            {
+                "agencies": [agency.id for agency in agencies],
+                "agency_count": len(agencies),
+                "flow": flow.id,
+                "methods": [EnrollmentMethods.SELF_SERVICE, EnrollmentMethods.IN_PERSON],
+                "events": events,
+            },
+        )
+        cursor.execute(f"ANALYZE {table}")
+
+
+@pytest.fixture
+def seeded_events(events, model_EnrollmentFlow):
+    """Enrollment events over the last two years, across a few agencies."""
+    agencies = [_agency(slug) for slug in ("admina", "adminb", "adminc", "admind")]
+
+    if connection.vendor == "postgresql":
+        _seed_postgresql(events, agencies, model_EnrollmentFlow)
+        return agencies
+
+    now = datetime.datetime.now(datetime.timezone.utc)
+    rng = random.Random(events)
+
+    batch_size = 10_000
+    for start in range(0, events, batch_size):
+        EnrollmentEvent.objects.bulk_create(
+            EnrollmentEvent(
+                transit_agency=rng.choice(agencies),
+                enrollment_flow=model_EnrollmentFlow,
+                enrollment_method=rng.choice([EnrollmentMethods.SELF_SERVICE, EnrollmentMethods.IN_PERSON]),
+                verified_by="benchmark",
+                enrollment_datetime=now - datetime.timedelta(seconds=rng.randrange(2 * 365 * 24 * 3600)),
+            )
+            for _ in range(min(batch_size, events - start))
+        )
+
+    return agencies
+
+
+@pytest.fixture
+def admin_client():
+    user = User.objects.create(username="benchmark", is_staff=True, is_superuser=True)
+    client = Client()
+    client.force_login(user)
+    return client
+
+
+@pytest.mark.django_db
+def test_admin_changelist(monkeypatch, admin_client, seeded_events, rounds, benchmark_results):
+    funnel = Funnel([])
+    agency = seeded_events[0]
+    deep = 20
+
+    for _ in range(rounds):
+        response = funnel.get(admin_client, "first page", CHANGELIST)
+        assert response.status_code == 200
+
+        # follow the "Next" links, timing the last one
+        cl = response.context["cl"]
+        for _ in range(deep - 2):
+            cl = admin_client.get(CHANGELIST + cl.next_url).context["cl"]
+        response = funnel.get(admin_client, f"page {deep}", CHANGELIST + cl.next_url)
+        assert response.status_code == 200
+
+        response = funnel.get(admin_client, "filtered by agency", CHANGELIST, {"transit_agency__id__exact": agency.id})
+        assert response.status_code == 200
+
+    # for comparison, the same list paged by page number and fully counted, as by Django's default changelist
+    model_admin = admin.site._registry[EnrollmentEvent]
+    monkeypatch.setattr(model_admin, "get_changelist", lambda request, **kwargs: ChangeList)
+    for _ in range(rounds):
+        response = funnel.get(admin_client, "first page (offset)", CHANGELIST)
+        assert response.status_code == 200
+
+        response = funnel.get(admin_client, f"page {deep} (offset)", CHANGELIST, {"p": deep})
+        assert response.status_code == 200
+
+    benchmark_results[f"admin changelist ({EnrollmentEvent.objects.count()} events, {connection.vendor})"] = funnel.summary()
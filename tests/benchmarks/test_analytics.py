@@ -0,0 +1,37 @@
+import pytest
+from django.contrib.sessions.middleware import SessionMiddleware
+from django.middleware.locale import LocaleMiddleware
+from django.test import RequestFactory
+
+from benefits.core import analytics, session
+from benefits.enrollment.analytics import ReturnedEnrollmentEvent
+
+from .funnel import Funnel
+
+# events built per sample, so the milliseconds per sample are the microseconds per event
+EVENTS = 1000
+
+
+def _events(request, agency):
+    for _ in range(EVENTS):
+        ReturnedEnrollmentEvent(request, "success", agency, "group", "littlepay")
+
+
+@pytest.mark.django_db
+def test_analytics_event_context(monkeypatch, littlepay_agency, model_EnrollmentFlow, rounds, benchmark_results):
+    funnel = Funnel([])
+
+    request = RequestFactory().get("/enrollment", HTTP_REFERER="https://example.com/agency", HTTP_USER_AGENT="benchmark")
+    for middleware in [SessionMiddleware(lambda x: x), LocaleMiddleware(lambda x: x)]:
+        middleware.process_request(request)
+    session.reset(request)
+    session.update(request, agency=littlepay_agency, flow=model_EnrollmentFlow)
+
+    # for comparison, the session and request derived values computed for every event, as before EventContext
+    for _ in range(rounds):
+        funnel.call(f"{EVENTS} events, shared context", _events, request, littlepay_agency)
+        with monkeypatch.context() as m:
+            m.setattr(analytics.EventContext, "for_request", staticmethod(analytics.EventContext))
+            funnel.call(f"{EVENTS} events, context per event", _events, request, littlepay_agency)
+
+    benchmark_results["analytics events"] = funnel.summary()
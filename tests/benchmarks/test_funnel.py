@@ -0,0 +1,94 @@
+import pytest
+from django.test import Client
+from django.urls import reverse
+
+from benefits.routes import routes
+
+from .funnel import Funnel
+
+
+def _eligibility(funnel, client, agency, flow):
+    """The steps from the landing page through a verified Eligibility API confirmation."""
+    response = funnel.get(client, "core:index", reverse(routes.INDEX))
+    assert response.status_code == 200
+
+    response = funnel.get(client, "core:agency_index", reverse(routes.AGENCY_INDEX, args=[agency.slug]))
+    assert response.status_code == 200
+
+    response = funnel.get(client, "eligibility:index", reverse(routes.ELIGIBILITY_INDEX))
+    assert response.status_code == 200
+
+    response = funnel.post(client, "eligibility:index (form_valid)", reverse(routes.ELIGIBILITY_INDEX), {"flow": flow.id})
+    assert response.status_code == 302
+    assert response.url == reverse(routes.ELIGIBILITY_START)
+
+    response = funnel.get(client, "eligibility:start", reverse(routes.ELIGIBILITY_START))
+    assert response.status_code == 200
+
+    response = funnel.get(client, "eligibility:confirm", reverse(routes.ELIGIBILITY_CONFIRM))
+    assert response.status_code == 200
+
+    response = funnel.post(
+        client, "eligibility:confirm (form_valid)", reverse(routes.ELIGIBILITY_CONFIRM), {"sub": "12345", "name": "Rider"}
+    )
+    assert response.status_code == 302
+    assert response.url == reverse(routes.ENROLLMENT_INDEX)
+
+    response = funnel.get(client, "enrollment:index", reverse(routes.ENROLLMENT_INDEX))
+    assert response.status_code == 302
+
+
+@pytest.mark.django_db
+def test_littlepay_funnel(fakes, littlepay_agency, model_EnrollmentFlow, rounds, benchmark_results, funnel_name):
+    funnel = Funnel(fakes)
+
+    for _ in range(rounds):
+        client = Client()
+        _eligibility(funnel, client, littlepay_agency, model_EnrollmentFlow)
+
+        response = funnel.get(client, "littlepay:index", reverse(routes.ENROLLMENT_LITTLEPAY_INDEX))
+        assert response.status_code == 200
+
+        response = funnel.get(client, "littlepay:token", reverse(routes.ENROLLMENT_LITTLEPAY_TOKEN))
+        assert "token" in response.json()
+
+        response = funnel.post(
+            client,
+            "littlepay:index (form_valid)",
+            reverse(routes.ENROLLMENT_LITTLEPAY_INDEX),
+            {"card_token": "benchmark-card-token"},
+        )
+        assert response.status_code == 302
+        assert response.url == reverse(routes.ENROLLMENT_SUCCESS)
+
+    benchmark_results[funnel_name("littlepay")] = funnel.summary()
+
+
+@pytest.mark.django_db
+def test_switchio_funnel(fakes, switchio_agency, model_EnrollmentFlow, rounds, benchmark_results, funnel_name):
+    funnel = Funnel(fakes)
+
+    for _ in range(rounds):
+        client = Client()
+        _eligibility(funnel, client, switchio_agency, model_EnrollmentFlow)
+
+        response = funnel.get(client, "switchio:index", reverse(routes.ENROLLMENT_SWITCHIO_INDEX))
+        assert response.status_code == 200
+
+        response = funnel.get(client, "switchio:gateway_url", reverse(routes.ENROLLMENT_SWITCHIO_GATEWAY_URL))
+        assert "gateway_url" in response.json()
+
+        # the rider returns from the tokenization gateway
+        response = funnel.get(client, "switchio:index (tokenized)", reverse(routes.ENROLLMENT_SWITCHIO_INDEX))
+        assert response.context["card_token"] == "benchmark-card-token"
+
+        response = funnel.post(
+            client,
+            "switchio:index (form_valid)",
+            reverse(routes.ENROLLMENT_SWITCHIO_INDEX),
+            {"card_token": response.context["card_token"]},
+        )
+        assert response.status_code == 302
+        assert response.url == reverse(routes.ENROLLMENT_SUCCESS)
+
+    benchmark_results[funnel_name("switchio")] = funnel.summary()
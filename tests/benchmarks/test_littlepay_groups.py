@@ -0,0 +1,49 @@
+import uuid
+
+import pytest
+
+from benefits.enrollment_littlepay import enrollment as littlepay_enrollment
+
+from .funnel import Funnel
+
+GROUP_SIZES = [10, 1_000, 10_000]
+
+
+def _group_funding_source_by_group(client, group_id, funding_source_id):
+    """The lookup before the funding source's groups were used: every funding source linked to the group, page by page."""
+    for group_funding_source in client.get_concession_group_linked_funding_sources(group_id):
+        if group_funding_source.id == funding_source_id:
+            return group_funding_source
+
+    return None
+
+
+@pytest.mark.django_db
+def test_littlepay_group_lookup(monkeypatch, fake_littlepay, littlepay_agency, rounds, benchmark_results):
+    funnel = Funnel([fake_littlepay])
+    client = littlepay_enrollment.get_client(littlepay_agency.transit_processor_config)
+    group_id = str(uuid.uuid4())
+    funding_source_id = str(uuid.uuid4())
+
+    monkeypatch.setattr(fake_littlepay, "group_id", group_id)
+    monkeypatch.setattr(fake_littlepay, "funding_source_id", funding_source_id)
+
+    for size in GROUP_SIZES:
+        monkeypatch.setattr(fake_littlepay, "group_size", size)
+
+        for _ in range(rounds):
+            found = funnel.call(
+                f"funding source's groups ({size})",
+                littlepay_enrollment._get_group_funding_source,
+                client,
+                group_id,
+                funding_source_id,
+            )
+            assert found is not None
+
+            found = funnel.call(
+                f"group's funding sources ({size})", _group_funding_source_by_group, client, group_id, funding_source_id
+            )
+            assert found is not None
+
+    benchmark_results["littlepay group lookup"] = funnel.summary()
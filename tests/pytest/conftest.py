@@ -3,13 +3,15 @@ from unittest.mock import create_autospec
 
 import pytest
 from cdt_identity.models import ClaimsVerificationRequest, IdentityGatewayConfig
+from django.conf import settings
 from django.contrib.auth.models import User
 from django.contrib.sessions.middleware import SessionMiddleware
+from django.db import connection
 from django.middleware.locale import LocaleMiddleware
 from django.utils import timezone
 from pytest_socket import disable_socket
 
-from benefits.core import session
+from benefits.core import cache, query_budgets, session
 from benefits.core.models import (
     EligibilityApiVerificationRequest,
     EnrollmentFlow,
@@ -26,6 +28,26 @@ def pytest_runtest_setup():
     disable_socket()
 
 
+def pytest_sessionfinish(session):
+    # write the query counts for each route, for the query_counts command
+    if settings.QUERY_COUNTS_FILE:
+        query_budgets.save(settings.QUERY_COUNTS_FILE)
+
+
+@pytest.fixture(autouse=True)
+def skip_unless_postgresql(request):
+    if request.node.get_closest_marker("postgresql") and connection.vendor != "postgresql":
+        pytest.skip("requires PostgreSQL, run with DATABASE_URL")
+
+
+# autouse this fixture so cached configuration never leaks between tests
+@pytest.fixture(autouse=True)
+def clear_config_cache():
+    cache.clear()
+    yield
+    cache.clear()
+
+
 @pytest.fixture
 def app_request(rf):
     """
@@ -69,6 +91,17 @@ def model_User():
     return User.objects.create(is_active=True, is_staff=True, first_name="Test", last_name="User")
 
 
+# autouse this fixture so a request over its route's query budget fails the test
+@pytest.fixture(autouse=True)
+def enforce_query_budgets():
+    query_budgets.clear_violations()
+    yield
+    violations = query_budgets.violations()
+    query_budgets.clear_violations()
+    if violations:
+        pytest.fail("Query budget exceeded:\n" + "\n".join(str(v) for v in violations))
+
+
 # autouse this fixture so we never call out to the real secret store
 @pytest.fixture(autouse=True)
 def mock_get_secret_by_name(mocker):
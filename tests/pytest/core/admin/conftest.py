@@ -29,3 +29,12 @@ def admin_user_request(model_AdminUser, rf, staff_group):
         return request
 
     return _admin_user_request
+
+
+@pytest.fixture
+def superuser_client(client, model_AdminUser):
+    model_AdminUser.is_staff = True
+    model_AdminUser.is_superuser = True
+    model_AdminUser.save()
+    client.force_login(model_AdminUser)
+    return client
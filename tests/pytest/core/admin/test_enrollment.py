@@ -1,9 +1,18 @@
+import csv
+import datetime
+import io
+
 import pytest
 from django.contrib import admin
+from django.contrib.admin.helpers import ACTION_CHECKBOX_NAME
 from django.core.exceptions import NON_FIELD_ERRORS
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
 
 from benefits.core import models
-from benefits.core.admin.enrollment import EnrollmentEventAdmin, SortableEnrollmentFlowAdmin
+from benefits.core.admin import changelist
+from benefits.core.admin.enrollment import EnrollmentEventAdmin, EnrollmentRollupAdmin, SortableEnrollmentFlowAdmin
 from benefits.core.admin.mixins import ProdReadOnlyPermissionMixin, StaffPermissionMixin
 
 
@@ -16,6 +25,199 @@ class TestEnrollmentEventAdmin:
     def test_permissions_mixin(self):
         assert isinstance(self.model_admin, ProdReadOnlyPermissionMixin)
 
+    @pytest.fixture
+    def events(self, mocker, model_TransitAgency, model_EnrollmentFlow):
+        mocker.patch.object(admin.site._registry[models.EnrollmentEvent], "list_per_page", 3)
+        start = datetime.datetime(2026, 10, 1, tzinfo=datetime.timezone.utc)
+        # two events at the same time, told apart by their primary key
+        times = [start, start + datetime.timedelta(hours=1), *[start + datetime.timedelta(hours=h) for h in range(1, 6)]]
+        events = models.EnrollmentEvent.objects.bulk_create(
+            models.EnrollmentEvent(
+                transit_agency=model_TransitAgency,
+                enrollment_flow=model_EnrollmentFlow,
+                enrollment_method=models.EnrollmentMethods.SELF_SERVICE,
+                verified_by="test",
+                enrollment_datetime=time,
+            )
+            for time in times
+        )
+        # newest first
+        return sorted(events, key=lambda event: (event.enrollment_datetime, event.pk), reverse=True)
+
+    def _changelist(self, client, query=""):
+        response = client.get(reverse("admin:core_enrollmentevent_changelist") + query)
+        assert response.status_code == 200
+        return response.context["cl"]
+
+    def test_changelist_pages(self, superuser_client, events):
+        pages = []
+        cl = self._changelist(superuser_client)
+        pages.append(cl.result_list)
+        while cl.next_url:
+            cl = self._changelist(superuser_client, cl.next_url)
+            pages.append(cl.result_list)
+
+        assert pages == [events[0:3], events[3:6], events[6:]]
+        assert cl.result_count == len(events)
+
+        cl = self._changelist(superuser_client, cl.previous_url)
+        assert cl.result_list == events[3:6]
+        cl = self._changelist(superuser_client, cl.previous_url)
+        assert cl.result_list == events[0:3]
+        assert cl.previous_url is None
+
+    def test_changelist_ordering_param(self, superuser_client, events):
+        cl = self._changelist(superuser_client, "?o=2")
+
+        assert cl.result_list == events[0:3]
+
+    def test_changelist_filter(self, superuser_client, events, model_TransitAgency_2):
+        query = f"?transit_agency__id__exact={model_TransitAgency_2.id}"
+        cl = self._changelist(superuser_client, query)
+
+        assert cl.result_list == []
+        assert cl.result_count == 0
+        assert cl.next_url is None
+
+    def test_changelist_filter_starts_over(self, superuser_client, events, model_TransitAgency):
+        cl = self._changelist(superuser_client)
+        cl = self._changelist(superuser_client, cl.next_url)
+
+        query = cl.get_query_string({"transit_agency__id__exact": model_TransitAgency.id})
+
+        assert changelist.AFTER_VAR not in query
+
+    def test_changelist_related(self, superuser_client, events, django_assert_num_queries):
+        cl = self._changelist(superuser_client)
+
+        with django_assert_num_queries(0):
+            [(str(event.transit_agency), str(event.enrollment_flow)) for event in cl.result_list]
+
+    def test_changelist_invalid_keyset(self, superuser_client, events):
+        response = superuser_client.get(reverse("admin:core_enrollmentevent_changelist") + "?after=not,valid")
+
+        assert response.status_code == 302
+        assert response.url.endswith("?e=1")
+
+    def test_changelist_estimated_count(self, mocker, superuser_client, events, model_TransitAgency, model_TransitAgency_2):
+        mocker.patch.object(changelist, "estimated_count", return_value=changelist.COUNT_ESTIMATE_THRESHOLD + 1)
+
+        cl = self._changelist(superuser_client)
+        assert cl.result_count == changelist.COUNT_ESTIMATE_THRESHOLD + 1
+        assert cl.result_count_estimated
+
+        cl = self._changelist(superuser_client, f"?transit_agency__id__exact={model_TransitAgency.id}")
+        assert cl.result_count == len(events)
+        assert not cl.result_count_estimated
+
+    def test_estimated_count_not_postgresql(self):
+        assert changelist.estimated_count(models.EnrollmentEvent) is None
+
+    def _export(self, client, data):
+        response = client.post(reverse("admin:core_enrollmentevent_changelist"), {"action": "export_csv", **data})
+        assert response.status_code == 200
+        assert response["Content-Type"] == "text/csv; charset=utf-8"
+        assert response["Content-Disposition"].startswith('attachment; filename="enrollment-events-')
+        return list(csv.DictReader(io.StringIO(b"".join(response.streaming_content).decode())))
+
+    def test_export_csv_selected(self, superuser_client, events):
+        rows = self._export(superuser_client, {ACTION_CHECKBOX_NAME: [events[0].pk, events[6].pk]})
+
+        # oldest first
+        assert [row["id"] for row in rows] == [str(events[6].pk), str(events[0].pk)]
+
+    def test_export_csv_select_across(self, superuser_client, events, model_TransitAgency, model_TransitAgency_2):
+        models.EnrollmentEvent.objects.filter(pk=events[0].pk).update(transit_agency=model_TransitAgency_2)
+        query = f"?transit_agency__id__exact={model_TransitAgency.id}"
+
+        response = superuser_client.post(
+            reverse("admin:core_enrollmentevent_changelist") + query,
+            {"action": "export_csv", "select_across": 1, ACTION_CHECKBOX_NAME: [events[1].pk]},
+        )
+        rows = list(csv.DictReader(io.StringIO(b"".join(response.streaming_content).decode())))
+
+        assert [row["id"] for row in rows] == [str(event.pk) for event in reversed(events[1:])]
+
+
+@pytest.mark.django_db
+class TestEnrollmentRollupAdmin:
+    @pytest.fixture(autouse=True)
+    def init(self):
+        self.model_admin = EnrollmentRollupAdmin(models.EnrollmentRollup, admin.site)
+
+    @pytest.fixture
+    def rollups(self, mocker, model_TransitAgency, model_TransitAgency_2, model_EnrollmentFlow):
+        mocker.patch("benefits.core.admin.enrollment.timezone.localdate", return_value=datetime.date(2026, 10, 18))
+        return models.EnrollmentRollup.objects.bulk_create(
+            models.EnrollmentRollup(
+                day=day,
+                transit_agency=agency,
+                enrollment_flow=model_EnrollmentFlow,
+                enrollment_method=models.EnrollmentMethods.SELF_SERVICE,
+                enrollments=enrollments,
+                with_expiration=1,
+            )
+            for day, agency, enrollments in [
+                (datetime.date(2026, 10, 18), model_TransitAgency, 3),
+                (datetime.date(2026, 10, 17), model_TransitAgency_2, 2),
+                (datetime.date(2026, 10, 1), model_TransitAgency, 5),
+                # before the last 30 days
+                (datetime.date(2026, 9, 18), model_TransitAgency, 7),
+            ]
+        )
+
+    def _dashboard(self, client, query=None):
+        response = client.get(reverse("admin:core_enrollmentrollup_changelist"), query)
+        assert response.status_code == 200
+        return response.context
+
+    def test_permissions_mixin(self):
+        assert isinstance(self.model_admin, ProdReadOnlyPermissionMixin)
+
+    def test_read_only(self, admin_user_request):
+        request = admin_user_request("super")
+
+        assert not self.model_admin.has_add_permission(request)
+        assert not self.model_admin.has_change_permission(request)
+        assert not self.model_admin.has_delete_permission(request)
+
+    def test_dashboard(self, superuser_client, rollups):
+        context = self._dashboard(superuser_client)
+
+        assert context["total"] == {"total_enrollments": 10, "total_with_expiration": 3, "total_with_extra_claims": 0}
+        assert [(row["day"], row["total_enrollments"]) for row in context["by_day"]] == [
+            (datetime.date(2026, 10, 18), 3),
+            (datetime.date(2026, 10, 17), 2),
+            (datetime.date(2026, 10, 1), 5),
+        ]
+        assert [(row["transit_agency__long_name"], row["total_enrollments"]) for row in context["by_agency_flow"]] == [
+            ("Test Transit Agency", 8),
+            ("Test Transit Agency 2", 2),
+        ]
+
+    def test_dashboard_filtered(self, superuser_client, rollups, model_TransitAgency):
+        query = {"start": "2026-09-01", "end": "2026-10-17", "transit_agency": model_TransitAgency.id}
+
+        context = self._dashboard(superuser_client, query)
+
+        assert [(row["day"], row["total_enrollments"]) for row in context["by_day"]] == [
+            (datetime.date(2026, 10, 1), 5),
+            (datetime.date(2026, 9, 18), 7),
+        ]
+
+    def test_dashboard_invalid(self, superuser_client, rollups):
+        context = self._dashboard(superuser_client, {"start": "2026-10-18", "end": "2026-10-01"})
+
+        assert context["form"].errors
+        assert context["total"]["total_enrollments"] is None
+        assert list(context["by_day"]) == []
+
+    def test_dashboard_reads_only_rollups(self, superuser_client, rollups):
+        with CaptureQueriesContext(connection) as queries:
+            self._dashboard(superuser_client)
+
+        assert not [query for query in queries if models.EnrollmentEvent._meta.db_table in query["sql"]]
+
 
 @pytest.mark.django_db
 class TestEnrollmentFlowAdmin:
@@ -96,7 +96,7 @@ def test_pre_login_user(mocker, model_AdminUser):
     mocked_request = mocker.Mock()
     mocked_response = mocker.Mock()
     mocked_response.json.return_value = response_from_google
-    requests_spy = mocker.patch("benefits.core.admin.users.requests.get", return_value=mocked_response)
+    requests_spy = mocker.patch("benefits.core.admin.users.http.get", return_value=mocked_response)
 
     pre_login_user(model_AdminUser, mocked_request)
 
@@ -0,0 +1,86 @@
+import csv
+import datetime
+import io
+
+import pytest
+from django.core.management import CommandError, call_command
+
+from benefits.core import export
+from benefits.core.models import EnrollmentEvent, EnrollmentMethods
+
+
+@pytest.fixture
+def events(model_TransitAgency, model_TransitAgency_2, model_EnrollmentFlow):
+    return EnrollmentEvent.objects.bulk_create(
+        EnrollmentEvent(
+            transit_agency=agency,
+            enrollment_flow=model_EnrollmentFlow,
+            enrollment_method=EnrollmentMethods.SELF_SERVICE,
+            verified_by="test",
+            enrollment_datetime=datetime.datetime(2026, 10, day, 19, tzinfo=datetime.timezone.utc),
+        )
+        for day, agency in [(1, model_TransitAgency), (2, model_TransitAgency_2), (3, model_TransitAgency)]
+    )
+
+
+@pytest.mark.django_db
+def test_export_enrollment_events_stdout(events):
+    out = io.StringIO()
+
+    call_command("export_enrollment_events", stdout=out)
+
+    rows = list(csv.DictReader(io.StringIO(out.getvalue())))
+    assert [row["id"] for row in rows] == [str(event.id) for event in events]
+
+
+@pytest.mark.django_db
+def test_export_enrollment_events_filtered(events):
+    out = io.StringIO()
+
+    call_command("export_enrollment_events", "--agency", "cst", "--start", "2026-10-02", "--end", "2026-10-03", stdout=out)
+
+    rows = list(csv.DictReader(io.StringIO(out.getvalue())))
+    assert [row["id"] for row in rows] == [str(events[2].id)]
+
+
+@pytest.mark.django_db
+def test_export_enrollment_events_output(tmp_path, events):
+    path = tmp_path / "events.csv"
+    out = io.StringIO()
+
+    call_command("export_enrollment_events", "--output", str(path), stdout=out)
+
+    assert len(path.read_text(encoding="utf-8").splitlines()) == len(events) + 1
+    assert f"Exported {len(events)} enrollment events to {path}" in out.getvalue()
+
+
+@pytest.mark.django_db
+def test_export_enrollment_events_invalid_date():
+    with pytest.raises(CommandError, match="Invalid date"):
+        call_command("export_enrollment_events", "--start", "10/01/2026")
+
+
+@pytest.mark.django_db
+def test_export_enrollment_events_parquet_requires_output():
+    with pytest.raises(CommandError, match="--output is required"):
+        call_command("export_enrollment_events", "--format", "parquet")
+
+
+@pytest.mark.django_db
+def test_export_enrollment_events_parquet_requires_pyarrow(mocker, tmp_path):
+    mocker.patch.object(export, "write_parquet", side_effect=ImportError)
+
+    with pytest.raises(CommandError, match="requires the pyarrow package"):
+        call_command("export_enrollment_events", "--format", "parquet", "--output", str(tmp_path / "events.parquet"))
+
+
+@pytest.mark.django_db
+def test_export_enrollment_events_parquet(mocker, tmp_path, events):
+    write_parquet = mocker.patch.object(export, "write_parquet", return_value=len(events))
+    path = str(tmp_path / "events.parquet")
+
+    call_command("export_enrollment_events", "--format", "parquet", "--output", path, "--agency", "cst", stdout=io.StringIO())
+
+    queryset, output = write_parquet.call_args.args
+    assert list(queryset) == [events[0], events[2]]
+    assert output == path
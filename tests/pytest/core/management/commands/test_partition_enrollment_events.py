@@ -0,0 +1,194 @@
+import datetime
+import io
+
+import pytest
+from django.core.management import CommandError, call_command
+from django.db import connection
+
+from benefits.core.management.commands import partition_enrollment_events
+from benefits.core.models import EnrollmentEvent, EnrollmentMethods
+
+
+@pytest.fixture
+def mock_postgresql(mocker, mock_psycopg_cursor):
+    connection = mocker.patch.object(partition_enrollment_events, "connection")
+    connection.vendor = "postgresql"
+    connection.cursor.return_value.__enter__.return_value = mock_psycopg_cursor
+    mocker.patch.object(partition_enrollment_events.transaction, "atomic")
+    mocker.patch.object(
+        partition_enrollment_events.timezone,
+        "now",
+        return_value=datetime.datetime(2026, 11, 20, tzinfo=datetime.timezone.utc),
+    )
+    return mock_psycopg_cursor
+
+
+def _statements(cursor):
+    return [
+        statement if isinstance(statement, str) else statement.as_string(None)
+        for statement, *_ in (call.args for call in cursor.execute.call_args_list)
+    ]
+
+
+@pytest.mark.parametrize(
+    "first,last,expected",
+    [
+        (datetime.date(2026, 11, 20), datetime.date(2026, 11, 1), [datetime.date(2026, 11, 1)]),
+        (
+            datetime.date(2026, 11, 30),
+            datetime.date(2027, 1, 1),
+            [datetime.date(2026, 11, 1), datetime.date(2026, 12, 1), datetime.date(2027, 1, 1)],
+        ),
+        (datetime.date(2026, 12, 1), datetime.date(2026, 11, 1), []),
+    ],
+)
+def test_months(first, last, expected):
+    assert partition_enrollment_events.months(first, last) == expected
+
+
+def test_partition_name():
+    assert partition_enrollment_events.partition_name(datetime.date(2026, 1, 1)) == "core_enrollmentevent_p2026_01"
+
+
+@pytest.mark.django_db
+def test_partition_enrollment_events_not_postgresql():
+    with pytest.raises(CommandError, match="requires PostgreSQL"):
+        call_command("partition_enrollment_events")
+
+
+def test_partition_enrollment_events_not_partitioned(mock_postgresql):
+    mock_postgresql.fetchone.return_value = ("r",)
+
+    with pytest.raises(CommandError, match="run with --convert"):
+        call_command("partition_enrollment_events")
+
+
+def test_partition_enrollment_events_skip_unpartitioned(mock_postgresql):
+    mock_postgresql.fetchone.return_value = ("r",)
+    out = io.StringIO()
+
+    call_command("partition_enrollment_events", "--skip-unpartitioned", stdout=out)
+
+    assert "not partitioned, skipping" in out.getvalue()
+    assert not [s for s in _statements(mock_postgresql) if "CREATE TABLE" in s]
+
+
+def test_partition_enrollment_events_already_partitioned(mock_postgresql):
+    mock_postgresql.fetchone.return_value = ("p",)
+
+    with pytest.raises(CommandError, match="already partitioned"):
+        call_command("partition_enrollment_events", "--convert")
+
+
+def test_partition_enrollment_events(mock_postgresql):
+    # partitioned; this month's partition exists, next month's doesn't
+    mock_postgresql.fetchone.side_effect = [("p",), ("core_enrollmentevent_p2026_11",), (None,)]
+
+    call_command("partition_enrollment_events", "--months-ahead", "1")
+
+    statements = _statements(mock_postgresql)
+    assert statements[-4:] == [
+        'CREATE TABLE "core_enrollmentevent_p2026_12" (LIKE "core_enrollmentevent" INCLUDING DEFAULTS INCLUDING CONSTRAINTS)',
+        'INSERT INTO "core_enrollmentevent_p2026_12" SELECT * FROM "core_enrollmentevent_default" '
+        "WHERE \"enrollment_datetime\" >= '2026-12-01' AND \"enrollment_datetime\" < '2027-01-01'",
+        'DELETE FROM "core_enrollmentevent_default" '
+        "WHERE \"enrollment_datetime\" >= '2026-12-01' AND \"enrollment_datetime\" < '2027-01-01'",
+        'ALTER TABLE "core_enrollmentevent" ATTACH PARTITION "core_enrollmentevent_p2026_12" '
+        "FOR VALUES FROM ('2026-12-01') TO ('2027-01-01')",
+    ]
+
+
+def test_partition_enrollment_events_convert(mock_postgresql):
+    index = "CREATE INDEX enrollmentevent_dt_idx ON public.core_enrollmentevent USING btree (enrollment_datetime)"
+    foreign_key = (
+        "core_enrollmentevent_transit_agency_id_fk",
+        "FOREIGN KEY (transit_agency_id) REFERENCES core_transitagency(id) DEFERRABLE INITIALLY DEFERRED",
+    )
+    mock_postgresql.fetchall.side_effect = [[(index,)], [foreign_key]]
+    # not partitioned; the oldest event is from last month; no monthly partitions exist
+    mock_postgresql.fetchone.side_effect = [
+        ("r",),
+        (datetime.datetime(2026, 10, 5, tzinfo=datetime.timezone.utc),),
+        (None,),
+        (None,),
+        (None,),
+    ]
+
+    call_command("partition_enrollment_events", "--convert", "--months-ahead", "1")
+
+    statements = _statements(mock_postgresql)
+    assert 'ALTER TABLE "core_enrollmentevent" RENAME TO "core_enrollmentevent_unpartitioned"' in statements
+    assert (
+        'CREATE TABLE "core_enrollmentevent" (LIKE "core_enrollmentevent_unpartitioned" INCLUDING DEFAULTS '
+        'INCLUDING CONSTRAINTS) PARTITION BY RANGE ("enrollment_datetime")'
+    ) in statements
+    attached = [s for s in statements if "ATTACH PARTITION" in s]
+    assert [s.split('"')[3] for s in attached] == [
+        "core_enrollmentevent_p2026_10",
+        "core_enrollmentevent_p2026_11",
+        "core_enrollmentevent_p2026_12",
+    ]
+    assert statements[-5:] == [
+        'INSERT INTO "core_enrollmentevent" SELECT * FROM "core_enrollmentevent_unpartitioned"',
+        'DROP TABLE "core_enrollmentevent_unpartitioned"',
+        'ALTER TABLE "core_enrollmentevent" ADD PRIMARY KEY ("id", "enrollment_datetime")',
+        index,
+        'ALTER TABLE "core_enrollmentevent" ADD CONSTRAINT "core_enrollmentevent_transit_agency_id_fk" ' + foreign_key[1],
+    ]
+
+
+def _event(agency, flow, when):
+    return EnrollmentEvent.objects.create(
+        transit_agency=agency,
+        enrollment_flow=flow,
+        enrollment_method=EnrollmentMethods.SELF_SERVICE,
+        verified_by="test",
+        enrollment_datetime=when,
+    )
+
+
+def _partitions():
+    """The event IDs in each partition of the table, by partition name."""
+    with connection.cursor() as cursor:
+        cursor.execute(f"SELECT tableoid::regclass::text, id FROM {partition_enrollment_events.TABLE}")
+        partitions = {}
+        for partition, event_id in cursor.fetchall():
+            partitions.setdefault(partition, set()).add(event_id)
+        return partitions
+
+
+@pytest.mark.postgresql
+@pytest.mark.django_db
+def test_partition_enrollment_events_postgresql(mocker, model_TransitAgency, model_EnrollmentFlow):
+    mocker.patch.object(
+        partition_enrollment_events.timezone,
+        "now",
+        return_value=datetime.datetime(2026, 11, 20, tzinfo=datetime.timezone.utc),
+    )
+    # the test runs in a transaction, where PostgreSQL can't alter a table with deferred foreign key checks pending
+    with connection.cursor() as cursor:
+        cursor.execute("SET CONSTRAINTS ALL IMMEDIATE")
+    september = _event(
+        model_TransitAgency, model_EnrollmentFlow, datetime.datetime(2026, 9, 30, 23, tzinfo=datetime.timezone.utc)
+    )
+    november = _event(model_TransitAgency, model_EnrollmentFlow, datetime.datetime(2026, 11, 1, tzinfo=datetime.timezone.utc))
+
+    call_command("partition_enrollment_events", "--convert", "--months-ahead", "1", stdout=io.StringIO())
+
+    assert _partitions() == {
+        "core_enrollmentevent_p2026_09": {september.id},
+        "core_enrollmentevent_p2026_11": {november.id},
+    }
+
+    # a month without a partition yet goes into the default partition, and is moved into its own when it's created
+    later = _event(model_TransitAgency, model_EnrollmentFlow, datetime.datetime(2027, 2, 14, tzinfo=datetime.timezone.utc))
+    assert _partitions()["core_enrollmentevent_default"] == {later.id}
+
+    call_command("partition_enrollment_events", "--months-ahead", "3", stdout=io.StringIO())
+
+    partitions = _partitions()
+    assert partitions["core_enrollmentevent_p2027_02"] == {later.id}
+    assert "core_enrollmentevent_default" not in partitions
+    # the foreign keys and the ORM still work on the partitioned table
+    assert EnrollmentEvent.objects.filter(transit_agency=model_TransitAgency).count() == 3
+    assert EnrollmentEvent.objects.get(pk=september.pk).enrollment_flow == model_EnrollmentFlow
@@ -0,0 +1,74 @@
+import json
+
+import pytest
+from django.core.management import CommandError, call_command
+
+from benefits.core import query_budgets
+
+
+@pytest.fixture
+def counts_file(tmp_path, mocker):
+    mocker.patch.dict(query_budgets.BUDGETS, {"app:light": 2, "app:heavy": 3}, clear=True)
+    path = tmp_path / "query_counts.json"
+    path.write_text(
+        json.dumps(
+            {
+                "app:light": {"requests": 2, "queries": 2, "max_queries": 1},
+                "app:heavy": {"requests": 2, "queries": 7, "max_queries": 4},
+            }
+        )
+    )
+    return path
+
+
+def test_query_counts(capsys, counts_file):
+    call_command("query_counts", str(counts_file))
+
+    lines = capsys.readouterr().out.splitlines()
+    assert lines[0].split() == ["route", "requests", "mean", "max", "budget"]
+    assert lines[1].split() == ["app:heavy", "2", "3.5", "4", "3"]
+    assert lines[2].split() == ["app:light", "2", "1.0", "1", "2"]
+
+
+def test_query_counts_processes(capsys, counts_file):
+    # another process's counts, written by query_budgets.save()
+    counts_file.with_name(f"{counts_file.name}.123").write_text(
+        json.dumps({"app:light": {"requests": 2, "queries": 6, "max_queries": 3}})
+    )
+
+    call_command("query_counts", str(counts_file))
+
+    lines = capsys.readouterr().out.splitlines()
+    assert lines[1].split() == ["app:heavy", "2", "3.5", "4", "3"]
+    assert lines[2].split() == ["app:light", "4", "2.0", "3", "2"]
+
+
+def test_query_counts_limit(capsys, counts_file):
+    call_command("query_counts", str(counts_file), "--limit", "1")
+
+    assert len(capsys.readouterr().out.splitlines()) == 2
+
+
+def test_query_counts_settings_file(capsys, settings, counts_file):
+    settings.QUERY_COUNTS_FILE = str(counts_file)
+
+    call_command("query_counts")
+
+    assert "app:heavy" in capsys.readouterr().out
+
+
+def test_query_counts_check(counts_file):
+    with pytest.raises(CommandError, match="app:heavy"):
+        call_command("query_counts", str(counts_file), "--check")
+
+
+def test_query_counts_no_file(settings):
+    settings.QUERY_COUNTS_FILE = None
+
+    with pytest.raises(CommandError, match="No query counts file"):
+        call_command("query_counts")
+
+
+def test_query_counts_file_not_found(tmp_path):
+    with pytest.raises(CommandError, match="not found"):
+        call_command("query_counts", str(tmp_path / "missing.json"))
@@ -0,0 +1,38 @@
+import pytest
+from django.core.management import call_command
+
+from benefits.core import analytics
+
+
+@pytest.fixture
+def mock_client(mocker):
+    client = mocker.patch.object(analytics, "client")
+    client.api_key = "api-key"
+    client.spool.replay.return_value = {"sent": 1, "dropped": 0, "deferred": 0}
+    return client
+
+
+def test_replay_analytics(mock_client):
+    call_command("replay_analytics")
+
+    mock_client.spool.replay.assert_called_once_with(mock_client, max_attempts=5)
+
+
+def test_replay_analytics_not_configured(mock_client):
+    mock_client.api_key = None
+
+    call_command("replay_analytics")
+
+    mock_client.spool.replay.assert_not_called()
+
+
+def test_replay_analytics_loop(mocker, mock_client):
+    sleep = mocker.patch(
+        "benefits.core.management.commands.replay_analytics.time.sleep", side_effect=[None, KeyboardInterrupt]
+    )
+
+    with pytest.raises(KeyboardInterrupt):
+        call_command("replay_analytics", "--loop", "--interval", "5", "--max-attempts", "2")
+
+    sleep.assert_called_with(5)
+    assert mock_client.spool.replay.call_count == 2
@@ -0,0 +1,107 @@
+import datetime
+import io
+
+import pytest
+from django.core.management import CommandError, call_command
+
+from benefits.core.management.commands import rollup_enrollment_events
+from benefits.core.models import EnrollmentEvent, EnrollmentMethods, EnrollmentRollup
+
+
+@pytest.fixture
+def mock_rebuild(mocker):
+    return mocker.patch.object(rollup_enrollment_events.rollups, "rebuild", return_value=2)
+
+
+@pytest.fixture(autouse=True)
+def mock_today(mocker):
+    mocker.patch.object(rollup_enrollment_events.rollups, "today", return_value=datetime.date(2026, 10, 18))
+
+
+@pytest.mark.django_db
+def test_rollup_enrollment_events(mock_rebuild):
+    out = io.StringIO()
+
+    call_command("rollup_enrollment_events", stdout=out)
+
+    # the last week, up to yesterday
+    mock_rebuild.assert_called_once_with(datetime.date(2026, 10, 11), datetime.date(2026, 10, 17))
+    assert "Rebuilt 2 enrollment rollups from 2026-10-11 to 2026-10-17" in out.getvalue()
+
+
+@pytest.mark.django_db
+def test_rollup_enrollment_events_days_option(mock_rebuild):
+    call_command("rollup_enrollment_events", "--days", "30", stdout=io.StringIO())
+
+    mock_rebuild.assert_called_once_with(datetime.date(2026, 9, 18), datetime.date(2026, 10, 17))
+
+
+@pytest.mark.django_db
+def test_rollup_enrollment_events_today(mock_rebuild):
+    with pytest.raises(CommandError, match="Only days before today"):
+        call_command("rollup_enrollment_events", "--start", "2026-10-01", "--end", "2026-10-18")
+
+    mock_rebuild.assert_not_called()
+
+
+@pytest.mark.django_db
+def test_rollup_enrollment_events_days(mock_rebuild):
+    call_command("rollup_enrollment_events", "--start", "2026-09-01", "--end", "2026-09-30", stdout=io.StringIO())
+
+    mock_rebuild.assert_called_once_with(datetime.date(2026, 9, 1), datetime.date(2026, 9, 30))
+
+
+@pytest.mark.django_db
+def test_rollup_enrollment_events_invalid_days(mock_rebuild):
+    with pytest.raises(CommandError, match="Invalid date"):
+        call_command("rollup_enrollment_events", "--start", "09/01/2026")
+
+    with pytest.raises(CommandError, match="is after --end"):
+        call_command("rollup_enrollment_events", "--start", "2026-10-02", "--end", "2026-10-01")
+
+    mock_rebuild.assert_not_called()
+
+
+@pytest.mark.django_db
+def test_rollup_enrollment_events_all_from_today(mock_rebuild, model_TransitAgency, model_EnrollmentFlow):
+    EnrollmentEvent.objects.create(
+        transit_agency=model_TransitAgency,
+        enrollment_flow=model_EnrollmentFlow,
+        enrollment_method=EnrollmentMethods.SELF_SERVICE,
+        verified_by="test",
+        enrollment_datetime=datetime.datetime(2026, 10, 18, 19, tzinfo=datetime.timezone.utc),
+    )
+    out = io.StringIO()
+
+    call_command("rollup_enrollment_events", "--all", stdout=out)
+
+    mock_rebuild.assert_not_called()
+    assert "No days before today" in out.getvalue()
+
+
+@pytest.mark.django_db
+def test_rollup_enrollment_events_all_no_events(mock_rebuild):
+    out = io.StringIO()
+
+    call_command("rollup_enrollment_events", "--all", stdout=out)
+
+    mock_rebuild.assert_not_called()
+    assert "No enrollment events" in out.getvalue()
+
+
+@pytest.mark.django_db
+def test_rollup_enrollment_events_all(model_TransitAgency, model_EnrollmentFlow):
+    EnrollmentEvent.objects.create(
+        transit_agency=model_TransitAgency,
+        enrollment_flow=model_EnrollmentFlow,
+        enrollment_method=EnrollmentMethods.SELF_SERVICE,
+        verified_by="test",
+        # October 1 in the app's time zone
+        enrollment_datetime=datetime.datetime(2026, 10, 2, 1, tzinfo=datetime.timezone.utc),
+    )
+
+    call_command("rollup_enrollment_events", "--all", stdout=io.StringIO())
+
+    rollup = EnrollmentRollup.objects.get()
+    assert rollup.day == datetime.date(2026, 10, 1)
+    assert rollup.enrollments == 1
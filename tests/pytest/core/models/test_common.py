@@ -4,13 +4,14 @@ import pytest
 from django.conf import settings
 
 import benefits.secrets
-from benefits.core.models import SecretNameField, template_path
+from benefits.core import http
+from benefits.core.models import SecretNameField, secret_names, template_path
 
 
 @pytest.fixture
 def mock_requests_get_pem_data(mocker):
     # intercept and spy on the GET request
-    return mocker.patch("benefits.core.models.common.requests.get", return_value=mocker.Mock(text="PEM text"))
+    return mocker.patch("benefits.core.models.common.http.get", return_value=mocker.Mock(text="PEM text"))
 
 
 @pytest.mark.django_db
@@ -92,10 +93,29 @@ def test_PemData_data_remote(model_PemData, mock_requests_get_pem_data):
 
     data = model_PemData.data
 
-    mock_requests_get_pem_data.assert_called_once_with(model_PemData.remote_url, timeout=settings.REQUESTS_TIMEOUT)
+    mock_requests_get_pem_data.assert_called_once_with(http.PEM_DATA, model_PemData.remote_url)
     assert data == mock_requests_get_pem_data.return_value.text
 
 
+@pytest.mark.django_db
+def test_PemData_data_kept_for_ttl(mocker, settings, model_PemData, mock_requests_get_pem_data):
+    settings.SECRETS_CACHE_TTL = 300
+    monotonic = mocker.patch("benefits.core.models.common.time.monotonic", return_value=1000)
+    model_PemData.text_secret_name = None
+    model_PemData.remote_url = "http://localhost/publickey"
+
+    model_PemData.data
+    monotonic.return_value = 1299
+    model_PemData.data
+    mock_requests_get_pem_data.assert_called_once()
+
+    # read again once the TTL has passed, e.g. to pick up a rotated key
+    monotonic.return_value = 1300
+    mock_requests_get_pem_data.return_value.text = "new PEM text"
+    assert model_PemData.data == "new PEM text"
+    assert mock_requests_get_pem_data.call_count == 2
+
+
 @pytest.mark.django_db
 def test_PemData_data_text_secret_name_and_remote__uses_text_secret(
     mock_field_secret_value, model_PemData, mock_requests_get_pem_data
@@ -120,5 +140,17 @@ def test_PemData_data_text_secret_name_and_remote__uses_remote(
 
     data = model_PemData.data
 
-    mock_requests_get_pem_data.assert_called_once_with(model_PemData.remote_url, timeout=settings.REQUESTS_TIMEOUT)
+    mock_requests_get_pem_data.assert_called_once_with(http.PEM_DATA, model_PemData.remote_url)
     assert data == mock_requests_get_pem_data.return_value.text
+
+
+@pytest.mark.django_db
+def test_secret_names(model_PemData, model_LittlepayConfig):
+    names = secret_names()
+
+    assert model_PemData.text_secret_name in names
+    assert model_LittlepayConfig.client_secret_name in names
+    assert "littlepay-qa-api-base-url" in names
+    assert "switchio-private-key" in names
+    assert "" not in names
+    assert names == sorted(set(names))
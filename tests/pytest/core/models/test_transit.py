@@ -1,6 +1,7 @@
 import pytest
 from django.contrib.auth.models import Group, User
 from django.core.exceptions import NON_FIELD_ERRORS, ValidationError
+from django.urls import reverse
 
 from benefits.core.models import (
     CardSchemes,
@@ -59,6 +60,14 @@ class TestTransitAgency:
 
         assert result.endswith(model_TransitAgency.slug)
 
+    def test_index_url_unsaved_slug(self, model_TransitAgency):
+        # the saved agency's URLs are cached
+        assert model_TransitAgency.index_url.endswith(model_TransitAgency.slug)
+
+        model_TransitAgency.slug = "unsaved"
+
+        assert model_TransitAgency.index_url == reverse(routes.AGENCY_INDEX, args=["unsaved"])
+
     def test_by_id_matching(self, model_TransitAgency):
         result = TransitAgency.by_id(model_TransitAgency.id)
 
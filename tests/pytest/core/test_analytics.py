@@ -1,9 +1,11 @@
+import os
+
 import pytest
 from django.contrib.sessions.middleware import SessionMiddleware
 from django.middleware.locale import LocaleMiddleware
 
 import benefits.core.analytics
-from benefits.core.analytics import Event, ViewedPageEvent
+from benefits.core.analytics import Client, Event, EventContext, Spool, ViewedPageEvent
 
 
 @pytest.fixture
@@ -61,6 +63,58 @@ def test_Event_reads_session(app_request, mocker):
     session_spy.flow.assert_called_once_with(app_request)
 
 
+@pytest.mark.django_db
+def test_Event_reads_session_once_per_request(app_request, mocker):
+    session_spy = mocker.spy(benefits.core.analytics, "session")
+
+    Event(app_request, "event_type")
+    Event(app_request, "event_type")
+
+    session_spy.agency.assert_called_once_with(app_request)
+    session_spy.did.assert_called_once_with(app_request)
+    session_spy.start.assert_called_once_with(app_request)
+    session_spy.uid.assert_called_once_with(app_request)
+    session_spy.flow.assert_called_once_with(app_request)
+
+
+@pytest.mark.django_db
+def test_Event_reads_session_again_after_update(app_request, mocker, model_EnrollmentFlow):
+    first = Event(app_request, "event_type")
+    benefits.core.analytics.session.update(app_request, flow=model_EnrollmentFlow)
+    second = Event(app_request, "event_type")
+
+    assert "enrollment_flows" not in first.event_properties
+    assert second.event_properties["enrollment_flows"] == [model_EnrollmentFlow.system_name]
+
+
+@pytest.mark.django_db
+def test_EventContext_for_request(app_request):
+    context = EventContext.for_request(app_request)
+
+    assert EventContext.for_request(app_request) is context
+    assert context.path == app_request.path
+    assert context.user_id == benefits.core.analytics.session.uid(app_request)
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize(
+    "referer,expected",
+    [
+        (None, None),
+        ("https://www.example.com/path?q=1", "example.com"),
+        ("http://user@sub.example.org:8000/", "sub.example.org"),
+    ],
+)
+def test_EventContext_referring_domain(rf, app_request, referer, expected):
+    if referer:
+        app_request.META["HTTP_REFERER"] = referer
+
+    context = EventContext(app_request)
+
+    assert context.referrer == referer
+    assert context.referring_domain == expected
+
+
 @pytest.mark.django_db
 def test_Event_uses_passed_agency_instead_of_session(app_request, mocker, model_TransitAgency):
     session_spy = mocker.spy(benefits.core.analytics, "session")
@@ -166,3 +220,322 @@ def test_ViewedPageEvent_without_UTM(app_request, utm_code_data):
     for key in utm_code_data:
         assert event.event_properties[key] is None
         assert event.user_properties[key] is None
+
+
+@pytest.fixture
+def mock_requests_post(mocker):
+    response = mocker.Mock(status_code=200)
+    response.json.return_value = {}
+    return mocker.patch("benefits.core.analytics.http.post", return_value=response)
+
+
+@pytest.fixture
+def analytics_client():
+    client = Client("api-key", batch_size=2, flush_interval=60, queue_size=2)
+    yield client
+    client.shutdown(timeout=1)
+
+
+def test_Client_send_not_Event(analytics_client):
+    with pytest.raises(ValueError):
+        analytics_client.send({})
+
+
+@pytest.mark.django_db
+def test_Client_send_no_api_key(app_request, mock_requests_post):
+    client = Client(None)
+
+    client.send(Event(app_request, "event_type"))
+
+    assert client._worker is None
+    mock_requests_post.assert_not_called()
+
+
+@pytest.mark.django_db
+def test_Client_send_does_not_post_inline(app_request, analytics_client, mock_requests_post):
+    analytics_client.send(Event(app_request, "event_type"))
+
+    # a single event is below the batch size, and the flush interval hasn't elapsed
+    assert analytics_client._worker.is_alive()
+    mock_requests_post.assert_not_called()
+
+
+@pytest.mark.django_db
+def test_Client_send_batch_size(app_request, analytics_client, mock_requests_post):
+    events = [Event(app_request, "event_type"), Event(app_request, "event_type")]
+
+    for event in events:
+        analytics_client.send(event)
+    analytics_client._wait(timeout=1)
+
+    mock_requests_post.assert_called_once()
+    payload = mock_requests_post.call_args.kwargs["json"]
+    assert payload["api_key"] == "api-key"
+    assert [e["insert_id"] for e in payload["events"]] == [e.insert_id for e in events]
+
+
+@pytest.mark.django_db
+def test_Client_send_queue_full(app_request, analytics_client, mock_requests_post, mocker):
+    analytics_client._ensure_worker()
+    mocker.patch.object(analytics_client._queue, "put_nowait", side_effect=benefits.core.analytics.queue.Full)
+    spy = mocker.spy(benefits.core.analytics.logger, "error")
+
+    analytics_client.send(Event(app_request, "event_type"))
+
+    spy.assert_called_once()
+    mock_requests_post.assert_not_called()
+
+
+@pytest.mark.django_db
+def test_Client_flush(app_request, analytics_client, mock_requests_post):
+    analytics_client.send(Event(app_request, "event_type"))
+
+    analytics_client.flush(timeout=1)
+
+    mock_requests_post.assert_called_once()
+    assert len(mock_requests_post.call_args.kwargs["json"]["events"]) == 1
+
+
+@pytest.mark.django_db
+def test_Client_shutdown(app_request, analytics_client, mock_requests_post):
+    analytics_client.send(Event(app_request, "event_type"))
+    worker = analytics_client._worker
+
+    analytics_client.shutdown(timeout=1)
+
+    mock_requests_post.assert_called_once()
+    assert not worker.is_alive()
+    assert analytics_client._worker is None
+
+
+@pytest.mark.django_db
+def test_Client_post_exception(app_request, analytics_client, mock_requests_post):
+    mock_requests_post.side_effect = Exception("boom")
+
+    # exceptions from the analytics API never propagate out of the worker
+    analytics_client._post([Event(app_request, "event_type")])
+
+    mock_requests_post.assert_called_once()
+
+
+@pytest.fixture
+def spool(tmp_path):
+    return Spool(str(tmp_path / "spool"))
+
+
+@pytest.fixture
+def spool_client(spool):
+    client = Client("api-key", batch_size=2, flush_interval=60, queue_size=2, spool=spool)
+    yield client
+    client.shutdown(timeout=1)
+
+
+def _response(mocker, status_code, body=None):
+    response = mocker.Mock(status_code=status_code)
+    response.json.return_value = body or {}
+    return response
+
+
+def test_Spool_append_seal_segments(spool):
+    assert spool.segments() == []
+
+    spool.append([{"user_id": "1"}, {"user_id": "2"}])
+
+    # open segments are not available for replay
+    assert spool.segments() == []
+
+    spool.seal()
+    segments = spool.segments()
+
+    assert len(segments) == 1
+    assert list(spool._read(segments[0])) == [{"user_id": "1"}, {"user_id": "2"}]
+
+
+def test_Spool_append_rolls_segment_by_size(tmp_path):
+    spool = Spool(str(tmp_path), segment_bytes=1)
+
+    spool.append([{"user_id": "1"}])
+    spool.append([{"user_id": "2"}])
+
+    assert len(spool.segments()) == 1
+
+
+def test_Spool_segments_seals_abandoned(tmp_path):
+    abandoned = tmp_path / "1-1-0.open"
+    abandoned.write_text("{}\n")
+    spool = Spool(str(tmp_path), segment_seconds=0)
+
+    assert spool.segments() == [str(tmp_path / "1-1-0.jsonl")]
+
+
+def test_Spool_segments_seals_abandoned_claim(tmp_path):
+    claimed = tmp_path / "1-1-0.replaying"
+    claimed.write_text("{}\n")
+
+    # the claim is renewed by a running replay
+    assert Spool(str(tmp_path)).segments() == []
+    # but not by a replay that was killed
+    assert Spool(str(tmp_path), claim_lease=0).segments() == [str(tmp_path / "1-1-0.jsonl")]
+
+
+class Killed(BaseException):
+    """A replay killed part way through, e.g. by the job's timeout."""
+
+
+def _sent_users(mock_requests_post):
+    return [event["user_id"] for c in mock_requests_post.call_args_list for event in c.kwargs["json"]["events"]]
+
+
+def test_Spool_replay_killed(mocker, spool, spool_client, mock_requests_post):
+    spool.append([{"user_id": "1"}, {"user_id": "2"}])
+    spool.seal()
+    spool.append([{"user_id": "3"}, {"user_id": "4"}])
+    spool.seal()
+    mock_requests_post.side_effect = [
+        _response(mocker, 429, {"throttled_users": {"1": 10}}),
+        _response(mocker, 200),
+        _response(mocker, 503),
+    ]
+
+    # killed while backing off, after the first segment's throttled user was deferred
+    with pytest.raises(Killed):
+        spool.replay(spool_client, sleep=mocker.Mock(side_effect=[None, Killed()]))
+
+    assert _sent_users(mock_requests_post) == ["1", "2", "2", "3", "4"]
+
+    # once the killed replay's claim has expired, another replay sends the events that weren't sent
+    spool.claim_lease = 0
+    mock_requests_post.reset_mock(side_effect=True)
+    mock_requests_post.return_value = _response(mocker, 200)
+
+    result = spool.replay(spool_client)
+
+    assert sorted(_sent_users(mock_requests_post)) == ["1", "3", "4"]
+    assert result == {"sent": 3, "dropped": 0, "deferred": 0}
+    assert spool.segments() == []
+    assert os.listdir(spool.path) == []
+
+
+def test_Spool_replay_success(spool, spool_client, mock_requests_post):
+    spool.append([{"user_id": "1"}, {"user_id": "2"}, {"user_id": "3"}])
+    spool.seal()
+
+    result = spool.replay(spool_client)
+
+    assert result == {"sent": 3, "dropped": 0, "deferred": 0}
+    assert mock_requests_post.call_count == 2
+    assert spool.segments() == []
+
+
+def test_Spool_replay_invalid(mocker, spool, spool_client, mock_requests_post):
+    mock_requests_post.return_value = _response(mocker, 400)
+    spool.append([{"user_id": "1"}])
+    spool.seal()
+
+    result = spool.replay(spool_client)
+
+    assert result == {"sent": 0, "dropped": 1, "deferred": 0}
+    assert spool.segments() == []
+
+
+def test_Spool_replay_throttled_user(mocker, spool, spool_client, mock_requests_post):
+    mock_requests_post.side_effect = [
+        _response(mocker, 429, {"throttled_users": {"1": 10}}),
+        _response(mocker, 200),
+        _response(mocker, 200),
+    ]
+    sleep = mocker.Mock()
+    spool.append([{"user_id": "1"}, {"user_id": "2"}, {"user_id": "1"}, {"user_id": "3"}])
+    spool.seal()
+
+    result = spool.replay(spool_client, backoff=1, sleep=sleep)
+
+    # events for the throttled user are kept for the next replay, the rest of the batch is retried after a backoff
+    assert result == {"sent": 2, "dropped": 0, "deferred": 2}
+    sleep.assert_called_once_with(1)
+    segments = spool.segments()
+    assert len(segments) == 1
+    assert list(spool._read(segments[0])) == [{"user_id": "1"}, {"user_id": "1"}]
+
+
+@pytest.mark.parametrize("body", [{}, {"throttled_users": {"other": 10}}])
+def test_Spool_replay_throttled_batch(mocker, spool, spool_client, mock_requests_post, body):
+    mock_requests_post.side_effect = [_response(mocker, 429, body), _response(mocker, 200)]
+    sleep = mocker.Mock()
+    spool.append([{"user_id": "1"}, {"user_id": "2"}, {"user_id": "1"}, {"user_id": "3"}])
+    spool.seal()
+
+    result = spool.replay(spool_client, sleep=sleep)
+
+    # none of the batch's users are named, so the whole batch is throttled
+    assert result == {"sent": 1, "dropped": 0, "deferred": 3}
+    assert mock_requests_post.call_count == 2
+    sleep.assert_not_called()
+    assert list(spool._read(spool.segments()[0])) == [{"user_id": "1"}, {"user_id": "2"}, {"user_id": "1"}]
+
+
+def test_Spool_replay_throttled_max_attempts(mocker, spool, mock_requests_post):
+    mock_requests_post.side_effect = [
+        _response(mocker, 429, {"throttled_users": {"1": 10}}),
+        _response(mocker, 429, {"throttled_users": {"2": 10}}),
+    ]
+    sleep = mocker.Mock()
+    client = Client("api-key", batch_size=3, spool=spool)
+    spool.append([{"user_id": "1"}, {"user_id": "2"}, {"user_id": "3"}])
+    spool.seal()
+
+    result = spool.replay(client, max_attempts=2, backoff=1, sleep=sleep)
+
+    # each 429 counts as an attempt
+    assert mock_requests_post.call_count == 2
+    assert [c.args[0] for c in sleep.call_args_list] == [1]
+    assert result == {"sent": 0, "dropped": 0, "deferred": 3}
+
+
+def test_Spool_replay_backoff(mocker, spool, spool_client, mock_requests_post):
+    mock_requests_post.return_value = _response(mocker, 503)
+    sleep = mocker.Mock()
+    spool.append([{"user_id": "1"}, {"user_id": "2"}, {"user_id": "3"}])
+    spool.seal()
+
+    result = spool.replay(spool_client, max_attempts=3, backoff=1, sleep=sleep)
+
+    assert mock_requests_post.call_count == 3
+    assert [c.args[0] for c in sleep.call_args_list] == [1, 2]
+    assert result == {"sent": 0, "dropped": 0, "deferred": 3}
+    assert len(spool.segments()) == 1
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("status_code", [429, 500, 503])
+def test_Client_post_failure_spools(mocker, app_request, spool, spool_client, mock_requests_post, status_code):
+    mock_requests_post.return_value = _response(mocker, status_code)
+
+    spool_client._post([Event(app_request, "event_type")])
+    spool.seal()
+
+    assert len(list(spool._read(spool.segments()[0]))) == 1
+
+
+@pytest.mark.django_db
+def test_Client_post_backoff_skips_request(mocker, app_request, spool, spool_client, mock_requests_post):
+    mock_requests_post.side_effect = Exception("timeout")
+
+    spool_client._post([Event(app_request, "event_type")])
+    spool_client._post([Event(app_request, "event_type")])
+    spool.seal()
+
+    # the second batch goes straight to the spool while backing off
+    mock_requests_post.assert_called_once()
+    assert len(list(spool._read(spool.segments()[0]))) == 2
+
+
+@pytest.mark.django_db
+def test_Client_send_queue_full_spools(mocker, app_request, spool, spool_client):
+    spool_client._ensure_worker()
+    mocker.patch.object(spool_client._queue, "put_nowait", side_effect=benefits.core.analytics.queue.Full)
+
+    spool_client.send(Event(app_request, "event_type"))
+    spool.seal()
+
+    assert len(list(spool._read(spool.segments()[0]))) == 1
@@ -0,0 +1,256 @@
+import pytest
+from django.urls import reverse
+
+from benefits.core import cache
+from benefits.core.context_processors import active_agencies
+from benefits.core.models import ConfigurationVersion, EnrollmentFlow, TransitAgency, TransitAgencyGroup
+from benefits.enrollment_littlepay.models import LittlepayGroup
+from benefits.routes import routes
+
+
+@pytest.fixture
+def version_check_every_time(settings):
+    settings.CONFIG_CACHE_VERSION_CHECK_INTERVAL = 0
+
+
+@pytest.mark.django_db
+def test_agency(django_assert_num_queries, model_LittlepayConfig, model_TransitAgency):
+    # version check, and the agencies with their transit processor configuration
+    with django_assert_num_queries(2):
+        agency = cache.agency(model_TransitAgency.id)
+        assert agency == model_TransitAgency
+        assert agency.littlepay_config == model_LittlepayConfig
+        assert agency.switchio_config is None
+
+    with django_assert_num_queries(0):
+        assert cache.agency(model_TransitAgency.id) is agency
+
+
+@pytest.mark.django_db
+def test_agency_does_not_exist():
+    with pytest.raises(TransitAgency.DoesNotExist):
+        cache.agency(99999)
+
+
+@pytest.mark.django_db
+def test_flow(django_assert_num_queries, model_EnrollmentFlow_with_eligibility_api):
+    cache.flow(model_EnrollmentFlow_with_eligibility_api.id)
+
+    with django_assert_num_queries(0):
+        flow = cache.flow(model_EnrollmentFlow_with_eligibility_api.id)
+        assert flow.api_request.api_public_key.label == "Test public key"
+        assert flow.oauth_config is None
+
+
+@pytest.mark.django_db
+def test_flow_does_not_exist():
+    with pytest.raises(EnrollmentFlow.DoesNotExist):
+        cache.flow(99999)
+
+
+@pytest.mark.django_db
+def test_group(django_assert_num_queries, model_LittlepayGroup):
+    cache.group(LittlepayGroup, model_LittlepayGroup.id)
+
+    with django_assert_num_queries(0):
+        group = cache.group(LittlepayGroup, model_LittlepayGroup.id)
+        assert group.group_id == model_LittlepayGroup.group_id
+        assert group.enrollment_flow == model_LittlepayGroup.enrollment_flow
+
+
+@pytest.mark.django_db
+def test_group_does_not_exist():
+    with pytest.raises(LittlepayGroup.DoesNotExist):
+        cache.group(LittlepayGroup, 99999)
+
+
+@pytest.mark.django_db
+def test_save_invalidates(model_TransitAgency):
+    assert cache.agency(model_TransitAgency.id).short_name == "TEST"
+
+    model_TransitAgency.short_name = "CHANGED"
+    model_TransitAgency.save()
+
+    assert cache.agency(model_TransitAgency.id).short_name == "CHANGED"
+
+
+@pytest.mark.django_db
+def test_related_save_invalidates(model_EnrollmentFlow_with_eligibility_api, model_PemData):
+    assert cache.flow(model_EnrollmentFlow_with_eligibility_api.id).api_request.api_public_key.label == "Test public key"
+
+    model_PemData.label = "Changed"
+    model_PemData.save()
+
+    assert cache.flow(model_EnrollmentFlow_with_eligibility_api.id).api_request.api_public_key.label == "Changed"
+
+
+@pytest.mark.django_db
+def test_delete_invalidates(model_TransitAgency):
+    cache.agency(model_TransitAgency.id)
+    id = model_TransitAgency.id
+
+    model_TransitAgency.delete()
+
+    with pytest.raises(TransitAgency.DoesNotExist):
+        cache.agency(id)
+
+
+@pytest.mark.django_db
+def test_m2m_invalidates(mocker, model_TransitAgency, model_EnrollmentFlow):
+    spy = mocker.spy(cache, "invalidate")
+
+    model_TransitAgency.enrollment_flows.add(model_EnrollmentFlow)
+
+    spy.assert_called_once()
+
+
+@pytest.mark.django_db
+def test_untracked_model_does_not_invalidate(mocker, model_User):
+    spy = mocker.spy(cache, "invalidate")
+
+    model_User.save()
+
+    spy.assert_not_called()
+
+
+@pytest.mark.django_db
+def test_invalidate_increments_version_on_commit(django_capture_on_commit_callbacks):
+    assert ConfigurationVersion.current() == 0
+
+    with django_capture_on_commit_callbacks(execute=True) as callbacks:
+        cache.invalidate()
+
+    assert len(callbacks) == 1
+    assert ConfigurationVersion.current() == 1
+
+    ConfigurationVersion.increment()
+
+    assert ConfigurationVersion.current() == 2
+
+
+@pytest.mark.django_db
+@pytest.mark.usefixtures("version_check_every_time")
+def test_version_change_clears(django_assert_num_queries, model_TransitAgency):
+    agency = cache.agency(model_TransitAgency.id)
+
+    # another process changed the agency
+    TransitAgency.objects.filter(pk=model_TransitAgency.pk).update(short_name="CHANGED")
+    with django_assert_num_queries(1):
+        assert cache.agency(model_TransitAgency.id) is agency
+
+    ConfigurationVersion.increment()
+
+    assert cache.agency(model_TransitAgency.id).short_name == "CHANGED"
+
+
+@pytest.mark.django_db
+def test_version_check_interval(settings, django_assert_num_queries, model_TransitAgency):
+    settings.CONFIG_CACHE_VERSION_CHECK_INTERVAL = 60
+    cache.agency(model_TransitAgency.id)
+
+    ConfigurationVersion.increment()
+
+    # not checked again until the interval has passed
+    with django_assert_num_queries(0):
+        cache.agency(model_TransitAgency.id)
+
+
+@pytest.mark.django_db
+def test_check_version(settings, model_TransitAgency):
+    settings.CONFIG_CACHE_VERSION_CHECK_INTERVAL = 60
+    cache.agency(model_TransitAgency.id)
+    TransitAgency.objects.filter(pk=model_TransitAgency.pk).update(short_name="CHANGED")
+    ConfigurationVersion.increment()
+
+    # checked right away, regardless of the interval
+    assert cache.check_version() == ConfigurationVersion.current()
+    assert cache.agency(model_TransitAgency.id).short_name == "CHANGED"
+
+
+@pytest.mark.django_db
+def test_active_agencies(model_TransitAgency, model_TransitAgency_2):
+    model_TransitAgency_2.long_name = "A first agency"
+    model_TransitAgency_2.save()
+
+    assert cache.active_agencies() == list(TransitAgency.all_active())
+
+    model_TransitAgency.active = False
+    model_TransitAgency.save()
+
+    assert cache.active_agencies() == [model_TransitAgency_2]
+
+
+@pytest.mark.django_db
+def test_agency_urls(model_TransitAgency):
+    urls = cache.agency_urls(model_TransitAgency.id)
+
+    assert urls.index_url == reverse(routes.AGENCY_INDEX, args=[model_TransitAgency.slug])
+    assert urls.entrypoint_url == reverse(routes.ELIGIBILITY_INDEX)
+
+
+@pytest.mark.django_db
+def test_agency_urls_grouped(model_TransitAgencyGroup, model_TransitAgency, model_TransitAgency_2):
+    assert cache.agency_urls(model_TransitAgency.id).entrypoint_url == reverse(routes.ADDITIONAL_AGENCIES)
+    assert cache.agency_urls(model_TransitAgency_2.id).entrypoint_url == reverse(routes.ADDITIONAL_AGENCIES)
+
+    model_TransitAgency_2.active = False
+    model_TransitAgency_2.save()
+
+    # like TransitAgency.group_agencies(), only other active agencies count
+    assert cache.agency_urls(model_TransitAgency.id).entrypoint_url == reverse(routes.ELIGIBILITY_INDEX)
+    assert cache.agency_urls(model_TransitAgency_2.id).entrypoint_url == reverse(routes.ADDITIONAL_AGENCIES)
+
+
+@pytest.mark.django_db
+def test_agency_urls_group_changed(model_TransitAgencyGroup, model_TransitAgency):
+    assert cache.agency_urls(model_TransitAgency.id).entrypoint_url == reverse(routes.ADDITIONAL_AGENCIES)
+
+    model_TransitAgencyGroup.transit_agencies.remove(model_TransitAgency)
+
+    assert cache.agency_urls(model_TransitAgency.id).entrypoint_url == reverse(routes.ELIGIBILITY_INDEX)
+
+
+@pytest.mark.django_db
+def test_agency_urls_does_not_exist():
+    assert cache.agency_urls(99999) is None
+
+
+@pytest.mark.django_db
+def test_agency_urls_queries(django_assert_num_queries, model_TransitAgency):
+    agencies = [
+        TransitAgency.objects.create(slug=f"agency-{letter}", short_name=letter, long_name=letter, active=True)
+        for letter in "abcdefgh"
+    ]
+    group = TransitAgencyGroup.objects.create(label="group")
+    group.transit_agencies.add(*agencies[:4])
+
+    # version check, the agencies, and the agencies in each group; however many agencies there are
+    with django_assert_num_queries(3):
+        context = [agency["entrypoint_url"] for agency in active_agencies(None)["active_agencies"]]
+
+    assert context.count(reverse(routes.ADDITIONAL_AGENCIES)) == 4
+    assert context.count(reverse(routes.ELIGIBILITY_INDEX)) == 5
+
+
+@pytest.mark.django_db
+def test_derived(mocker):
+    compute = mocker.Mock(return_value="value")
+
+    assert cache.derived("key", compute) == "value"
+    assert cache.derived("key", compute) == "value"
+    compute.assert_called_once()
+
+    cache.invalidate()
+
+    assert cache.derived("key", compute) == "value"
+    assert compute.call_count == 2
+
+
+@pytest.mark.django_db
+def test_derived_invalid(mocker):
+    compute = mocker.Mock(side_effect=["old", "new"])
+
+    assert cache.derived("key", compute, valid=lambda value: True) == "old"
+    assert cache.derived("key", compute, valid=lambda value: value == "new") == "new"
+    assert cache.derived("key", compute, valid=lambda value: value == "new") == "new"
+    assert compute.call_count == 2
@@ -1,9 +1,10 @@
 from datetime import datetime, timedelta, timezone
 
 import pytest
+from django.urls import reverse
 
 from benefits.core import session
-from benefits.core.context_processors import agency, enrollment, feature_flags, routes
+from benefits.core.context_processors import active_agencies, agency, enrollment, feature_flags, routes
 from benefits.core.models import CardSchemes
 from benefits.routes import routes as app_routes
 
@@ -37,6 +38,37 @@ def test_agency_session_agency(app_request, mocked_session_agency):
     assert "switchio_config" in agency_context
 
 
+@pytest.mark.django_db
+def test_active_agencies_lazy(app_request, django_assert_num_queries, model_TransitAgency):
+    # nothing is queried until a template uses active_agencies
+    with django_assert_num_queries(0):
+        context = active_agencies(app_request)
+
+    assert len(context["active_agencies"]) == 1
+    assert context["active_agencies"][0]["slug"] == model_TransitAgency.slug
+
+
+@pytest.mark.django_db
+def test_active_agencies_shared(app_request, django_assert_num_queries, model_TransitAgency, model_TransitAgency_2):
+    list(active_agencies(app_request)["active_agencies"])
+
+    with django_assert_num_queries(0):
+        agencies = list(active_agencies(app_request)["active_agencies"])
+
+    assert [a["slug"] for a in agencies] == [model_TransitAgency.slug, model_TransitAgency_2.slug]
+
+
+@pytest.mark.django_db
+def test_active_agencies_inactive(app_request, model_TransitAgency, model_TransitAgency_2):
+    assert len(active_agencies(app_request)["active_agencies"]) == 2
+
+    model_TransitAgency_2.active = False
+    model_TransitAgency_2.save()
+
+    agencies = active_agencies(app_request)["active_agencies"]
+    assert [a["slug"] for a in agencies] == [model_TransitAgency.slug]
+
+
 @pytest.mark.django_db
 def test_enrollment_default(app_request):
     context = enrollment(app_request)
@@ -79,3 +111,10 @@ def test_routes(app_request):
     for route_name in app_routes_dict.keys():
         assert route_name in context_routes
         assert context_routes[route_name] == app_routes_dict[route_name]
+
+
+@pytest.mark.django_db
+def test_routes_template(client):
+    response = client.get(reverse(app_routes.INDEX))
+
+    assert f'href="{reverse(app_routes.HELP)}"' in response.content.decode()
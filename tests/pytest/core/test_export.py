@@ -0,0 +1,120 @@
+import csv
+import datetime
+import io
+
+import pytest
+from django.db.models import QuerySet
+from django.utils import timezone
+
+from benefits.core import export
+from benefits.core.models import EnrollmentEvent, EnrollmentMethods
+
+
+@pytest.fixture
+def events(model_TransitAgency, model_TransitAgency_2, model_EnrollmentFlow):
+    # noon Pacific time, on consecutive days
+    start = datetime.datetime(2026, 10, 1, 19, tzinfo=datetime.timezone.utc)
+    return EnrollmentEvent.objects.bulk_create(
+        EnrollmentEvent(
+            transit_agency=agency,
+            enrollment_flow=model_EnrollmentFlow,
+            enrollment_method=method,
+            verified_by="test",
+            enrollment_datetime=start + datetime.timedelta(days=day),
+        )
+        for day, agency, method in [
+            (0, model_TransitAgency, EnrollmentMethods.SELF_SERVICE),
+            (1, model_TransitAgency_2, EnrollmentMethods.SELF_SERVICE),
+            (2, model_TransitAgency, EnrollmentMethods.IN_PERSON),
+        ]
+    )
+
+
+def _csv(queryset):
+    return list(csv.DictReader(io.StringIO("".join(export.csv_lines(queryset)))))
+
+
+@pytest.mark.django_db
+def test_enrollment_events(events):
+    assert list(export.enrollment_events()) == events
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize(
+    "filters,expected",
+    [
+        ({"agency": "cst"}, [0, 2]),
+        ({"flow": "senior"}, [0, 1, 2]),
+        ({"flow": "other"}, []),
+        ({"method": EnrollmentMethods.IN_PERSON}, [2]),
+        ({"start": datetime.date(2026, 10, 2)}, [1, 2]),
+        ({"end": datetime.date(2026, 10, 2)}, [0, 1]),
+        ({"agency": "cst", "start": datetime.date(2026, 10, 2), "end": datetime.date(2026, 10, 3)}, [2]),
+    ],
+)
+def test_enrollment_events_filtered(events, filters, expected):
+    assert list(export.enrollment_events(**filters)) == [events[i] for i in expected]
+
+
+@pytest.mark.django_db
+def test_enrollment_events_filtered_app_time_zone(events):
+    # days are in the app's time zone, whatever time zone is active; noon Pacific is the next day in Tokyo
+    with timezone.override("Asia/Tokyo"):
+        assert list(export.enrollment_events(start=datetime.date(2026, 10, 2))) == events[1:]
+
+
+@pytest.mark.django_db
+def test_csv_lines(events, django_assert_num_queries):
+    with django_assert_num_queries(1):
+        rows = _csv(export.enrollment_events())
+
+    assert [row["id"] for row in rows] == [str(event.id) for event in events]
+    assert rows[0] == {
+        "id": str(events[0].id),
+        "enrollment_datetime": "2026-10-01T19:00:00+00:00",
+        "expiration_datetime": "",
+        "transit_agency": "cst",
+        "transit_agency_name": "Test Transit Agency",
+        "enrollment_flow": "senior",
+        "enrollment_flow_label": "Test flow label",
+        "enrollment_method": EnrollmentMethods.SELF_SERVICE,
+        "verified_by": "test",
+        "extra_claims": "",
+    }
+
+
+@pytest.mark.django_db
+def test_csv_lines_chunked(mocker, events):
+    iterator = mocker.spy(QuerySet, "iterator")
+
+    assert len(_csv(export.enrollment_events())) == len(events)
+    assert iterator.call_args.kwargs == {"chunk_size": export.CHUNK_SIZE}
+
+
+@pytest.mark.django_db
+def test_csv_lines_empty():
+    assert list(export.csv_lines(export.enrollment_events())) == [",".join(export.COLUMNS.keys()) + "\r\n"]
+
+
+@pytest.mark.django_db
+def test_write_csv(events):
+    file = io.StringIO()
+
+    assert export.write_csv(export.enrollment_events(agency="cst"), file) == 2
+    assert len(file.getvalue().splitlines()) == 3
+
+
+@pytest.mark.django_db
+def test_write_parquet(mocker, tmp_path, events):
+    pq = pytest.importorskip("pyarrow.parquet")
+    mocker.patch.object(export, "CHUNK_SIZE", 2)
+    path = tmp_path / "events.parquet"
+
+    assert export.write_parquet(export.enrollment_events(), path) == len(events)
+
+    file = pq.ParquetFile(path)
+    assert file.num_row_groups == 2
+    table = file.read()
+    assert table.column_names == list(export.COLUMNS.keys())
+    assert table.column("id").to_pylist() == [str(event.id) for event in events]
+    assert table.column("enrollment_datetime").to_pylist() == [event.enrollment_datetime for event in events]
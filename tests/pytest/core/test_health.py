@@ -0,0 +1,75 @@
+import pytest
+
+from benefits.core import health
+
+
+@pytest.fixture(autouse=True)
+def clear_readiness():
+    health.clear()
+    yield
+    health.clear()
+
+
+@pytest.fixture
+def mocked_checks(mocker):
+    checks = {"first": mocker.Mock(return_value="ok"), "second": mocker.Mock(return_value="ok")}
+    mocker.patch.dict(health.CHECKS, checks, clear=True)
+    return checks
+
+
+def test_readiness(mocked_checks):
+    result = health.readiness()
+
+    assert result.ready
+    assert result.to_dict() == {"ready": True, "checks": {"first": "ok", "second": "ok"}}
+
+
+def test_readiness__not_ready(mocked_checks):
+    mocked_checks["second"].return_value = "waiting"
+
+    assert not health.readiness().ready
+
+
+def test_readiness__error(mocked_checks):
+    mocked_checks["first"].side_effect = Exception("boom")
+
+    result = health.readiness()
+
+    assert result.checks == {"first": "error", "second": "ok"}
+    mocked_checks["second"].assert_called_once()
+
+
+def test_readiness__cached(settings, mocked_checks):
+    settings.HEALTHCHECK_READY_CACHE_TTL = 60
+
+    assert health.readiness() is health.readiness()
+    mocked_checks["first"].assert_called_once()
+
+
+def test_readiness__expired(settings, mocked_checks):
+    settings.HEALTHCHECK_READY_CACHE_TTL = 0
+
+    health.readiness()
+    health.readiness()
+
+    assert mocked_checks["first"].call_count == 2
+
+
+@pytest.mark.django_db
+def test_check_database():
+    assert health.check_database() == "ok"
+
+
+@pytest.mark.django_db
+def test_check_config(mocker):
+    check_version = mocker.patch("benefits.core.health.cache.check_version")
+
+    assert health.check_config() == "ok"
+    check_version.assert_called_once()
+
+
+@pytest.mark.parametrize("warm,expected", [(True, "ok"), (False, "prefetching")])
+def test_check_secrets(mocker, warm, expected):
+    mocker.patch("benefits.core.health.secrets.warm", return_value=warm)
+
+    assert health.check_secrets() == expected
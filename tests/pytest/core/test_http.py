@@ -0,0 +1,149 @@
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+import requests
+
+from benefits.core import http
+
+
+@pytest.fixture(autouse=True)
+def clear_sessions():
+    http.clear()
+    yield
+    http.clear()
+
+
+class KeepAliveHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        self.send_response(200)
+        self.send_header("Content-Length", "2")
+        self.end_headers()
+        self.wfile.write(b"ok")
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def local_server(socket_enabled):
+    server = ThreadingHTTPServer(("127.0.0.1", 0), KeepAliveHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_port}/"
+    server.shutdown()
+    server.server_close()
+
+
+def test_session__shared():
+    session = http.session(http.RECAPTCHA)
+
+    assert http.session(http.RECAPTCHA) is session
+    assert http.session(http.PEM_DATA) is not session
+
+
+def test_session__new_process(mocker):
+    session = http.session(http.RECAPTCHA)
+
+    mocker.patch("benefits.core.http.os.getpid", return_value=-1)
+
+    assert http.session(http.RECAPTCHA) is not session
+
+
+def test_session__pool_settings(settings):
+    settings.REQUESTS_POOL_CONNECTIONS = 3
+    settings.REQUESTS_POOL_MAXSIZE = 7
+
+    adapter = http.session(http.RECAPTCHA).get_adapter("https://example.com")
+
+    assert isinstance(adapter, http.PooledAdapter)
+    assert adapter.poolmanager.connection_pool_kw["maxsize"] == 7
+    assert adapter.poolmanager.pools._maxsize == 3
+
+
+def test_retries(settings):
+    settings.REQUESTS_MAX_RETRIES = 4
+    settings.REQUESTS_BACKOFF_FACTOR = 0.25
+
+    retries = http.retries(http.RECAPTCHA)
+
+    assert retries.total == 4
+    assert retries.backoff_factor == 0.25
+    assert set(retries.status_forcelist) == {502, 503, 504}
+    assert "POST" not in retries.allowed_methods
+
+
+@pytest.mark.parametrize("integration", [http.ANALYTICS, http.ELIGIBILITY_API])
+def test_retries__no_retries(integration):
+    retries = http.retries(integration)
+
+    assert retries.total == 0
+    assert http.session(integration).get_adapter("https://example.com").max_retries.total == 0
+
+
+def test_timeout(settings):
+    settings.REQUESTS_TIMEOUT = (1, 2)
+    settings.REQUESTS_INTEGRATION_TIMEOUTS = {http.ANALYTICS: (3, 4)}
+
+    assert http.timeout(http.ANALYTICS) == (3, 4)
+    assert http.timeout(http.RECAPTCHA) == (1, 2)
+
+
+@pytest.mark.parametrize("method", ["get", "post"])
+def test_request__default_timeout(mocker, settings, method):
+    settings.REQUESTS_TIMEOUT = (1, 2)
+    session = mocker.patch("benefits.core.http.session").return_value
+
+    response = getattr(http, method)(http.RECAPTCHA, "https://example.com")
+
+    request = getattr(session, method)
+    request.assert_called_once()
+    assert request.call_args.args == ("https://example.com",)
+    assert request.call_args.kwargs["timeout"] == (1, 2)
+    assert response == request.return_value
+
+
+def test_request__timeout(mocker):
+    session = mocker.patch("benefits.core.http.session").return_value
+
+    http.get(http.RECAPTCHA, "https://example.com", timeout=9)
+
+    assert session.get.call_args.kwargs["timeout"] == 9
+
+
+def test_stats(local_server):
+    for _ in range(3):
+        response = http.get(http.PEM_DATA, local_server)
+        assert response.text == "ok"
+
+    stats = http.stats()[http.PEM_DATA]
+
+    assert stats["requests"] == 3
+    assert stats["pool_misses"] == 1
+    assert stats["pool_hits"] == 2
+    assert stats["connections"] == 1
+    assert stats["connect_seconds"] > 0
+
+
+def test_stats__empty():
+    assert http.stats() == {}
+
+
+def test_metrics(mocker, local_server):
+    observe_outbound = mocker.patch.object(http.metrics, "observe_outbound")
+
+    http.get(http.PEM_DATA, local_server)
+
+    observe_outbound.assert_called_once_with(http.PEM_DATA, mocker.ANY, "200")
+
+
+def test_metrics__error(mocker, socket_enabled):
+    observe_outbound = mocker.patch.object(http.metrics, "observe_outbound")
+
+    with pytest.raises(requests.ConnectionError):
+        # nothing listens on port 9
+        http.get(http.ANALYTICS, "http://127.0.0.1:9/")
+
+    observe_outbound.assert_called_once_with(http.ANALYTICS, mocker.ANY, "error")
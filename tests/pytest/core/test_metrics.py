@@ -0,0 +1,219 @@
+import json
+import os
+
+import pytest
+from django.urls import reverse
+
+from benefits.core import metrics
+from benefits.core.middleware import METRICS_PATH
+from benefits.routes import routes
+
+
+@pytest.fixture(autouse=True)
+def clear_metrics():
+    metrics.clear()
+    yield
+    metrics.clear()
+
+
+@pytest.fixture
+def metrics_token(settings):
+    settings.METRICS_TOKEN = "the-token"
+    return settings.METRICS_TOKEN
+
+
+def test_Counter():
+    metrics.ENROLLMENTS.inc("SUCCESS", "littlepay", "digital")
+    metrics.ENROLLMENTS.inc("SUCCESS", "littlepay", "digital")
+
+    assert metrics.snapshot()[metrics.ENROLLMENTS.name] == [[["SUCCESS", "littlepay", "digital"], [2.0]]]
+
+
+def test_Counter__wrong_labels():
+    with pytest.raises(ValueError, match="expects labels"):
+        metrics.ENROLLMENTS.inc("SUCCESS")
+
+
+def test_Histogram():
+    metrics.observe_outbound("littlepay", 0.03, "200")
+    metrics.observe_outbound("littlepay", 20, "200")
+
+    [[key, values]] = metrics.snapshot()[metrics.OUTBOUND_DURATION.name]
+
+    assert key == ["littlepay", "200"]
+    # buckets at and above 0.05 count the first value; no bucket counts the second
+    assert values[: len(metrics.DEFAULT_BUCKETS)] == [0, 0, 0, 1, 1, 1, 1, 1, 1, 1, 1]
+    assert values[-2:] == [20.03, 2]
+
+
+def test_merge():
+    metrics.count_enrollment("SUCCESS", "switchio", "digital")
+    first = metrics.snapshot()
+    metrics.count_enrollment("SYSTEM_ERROR", "switchio", "digital")
+    second = metrics.snapshot()
+
+    merged = metrics.merge([first, second])[metrics.ENROLLMENTS.name]
+
+    assert merged == {("SUCCESS", "switchio", "digital"): [2.0], ("SYSTEM_ERROR", "switchio", "digital"): [1.0]}
+
+
+def test_render():
+    metrics.observe_request("core:index", "GET", 200, 0.2, 3, 0.01)
+
+    text = metrics.render(metrics.merge([metrics.snapshot()]))
+
+    assert "# TYPE benefits_request_duration_seconds histogram" in text
+    assert 'benefits_request_duration_seconds_bucket{route="core:index",method="GET",status="200",le="0.1"} 0' in text
+    assert 'benefits_request_duration_seconds_bucket{route="core:index",method="GET",status="200",le="0.25"} 1' in text
+    assert 'benefits_request_duration_seconds_bucket{route="core:index",method="GET",status="200",le="+Inf"} 1' in text
+    assert 'benefits_request_duration_seconds_count{route="core:index",method="GET",status="200"} 1' in text
+    assert 'benefits_db_queries_total{route="core:index"} 3' in text
+    assert 'benefits_db_query_seconds_total{route="core:index"} 0.01' in text
+    assert "# TYPE benefits_enrollments_total counter" in text
+
+
+def test_render__escapes_labels():
+    metrics.observe_outbound('a"b\\c', 0.1, "error")
+
+    text = metrics.render(metrics.merge([metrics.snapshot()]))
+
+    assert 'integration="a\\"b\\\\c"' in text
+
+
+def test_flush__no_directory(settings, tmp_path):
+    settings.METRICS_DIR = None
+
+    metrics.flush(force=True)
+
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_flush(settings, tmp_path):
+    settings.METRICS_DIR = str(tmp_path)
+    metrics.count_enrollment("SUCCESS", "littlepay", "digital")
+
+    metrics.flush()
+
+    [path] = tmp_path.iterdir()
+    assert json.loads(path.read_text()) == metrics.snapshot()
+
+
+def test_flush__interval(settings, tmp_path):
+    settings.METRICS_DIR = str(tmp_path)
+    settings.METRICS_FLUSH_INTERVAL = 60
+    metrics.flush()
+
+    metrics.count_enrollment("SUCCESS", "littlepay", "digital")
+    metrics.flush()
+
+    [path] = tmp_path.iterdir()
+    assert json.loads(path.read_text())[metrics.ENROLLMENTS.name] == []
+
+
+def test_collect__adds_up_processes(settings, tmp_path):
+    settings.METRICS_DIR = str(tmp_path)
+    other_process = {metrics.ENROLLMENTS.name: [[["SUCCESS", "littlepay", "digital"], [4.0]]]}
+    (tmp_path / f"metrics-{os.getppid()}-abc.json").write_text(json.dumps(other_process))
+    (tmp_path / f"metrics-{os.getppid()}-def.json").write_text("not json")
+    metrics.count_enrollment("SUCCESS", "littlepay", "digital")
+
+    text = metrics.collect()
+
+    assert 'benefits_enrollments_total{status="SUCCESS",transit_processor="littlepay",enrollment_method="digital"} 5' in text
+
+
+def test_flush__new_process(settings, tmp_path, mocker):
+    settings.METRICS_DIR = str(tmp_path)
+    metrics.flush(force=True)
+
+    # e.g. a later worker with the same pid
+    mocker.patch.object(metrics, "_process", (-1, "metrics-other.json"))
+    metrics.flush(force=True)
+
+    names = sorted(path.name for path in tmp_path.iterdir())
+    assert len(names) == 2
+    assert all(name.startswith(f"metrics-{os.getpid()}-") for name in names)
+
+
+def test_collect__exited_processes(settings, tmp_path, mocker):
+    settings.METRICS_DIR = str(tmp_path)
+    mocker.patch.object(metrics, "_alive", side_effect=lambda pid: pid == os.getpid())
+    key = ["SUCCESS", "littlepay", "digital"]
+    (tmp_path / "metrics-1-abc.json").write_text(json.dumps({metrics.ENROLLMENTS.name: [[key, [4.0]]]}))
+    (tmp_path / "metrics-1-def.json").write_text(json.dumps({metrics.ENROLLMENTS.name: [[key, [2.0]]]}))
+    (tmp_path / metrics.EXITED_SNAPSHOT).write_text(json.dumps({metrics.ENROLLMENTS.name: [[key, [1.0]]]}))
+    metrics.count_enrollment(*key)
+
+    text = metrics.collect()
+
+    assert 'benefits_enrollments_total{status="SUCCESS",transit_processor="littlepay",enrollment_method="digital"} 8' in text
+    # the exited processes' snapshots are added into one
+    names = {path.name for path in tmp_path.iterdir() if path.suffix == ".json"}
+    assert names == {metrics.EXITED_SNAPSHOT, metrics._snapshot_name()}
+    assert json.loads((tmp_path / metrics.EXITED_SNAPSHOT).read_text()) == {metrics.ENROLLMENTS.name: [[key, [7.0]]]}
+    # and still counted
+    assert metrics.collect() == text
+
+
+def test_collect__no_directory(settings):
+    settings.METRICS_DIR = None
+    metrics.count_enrollment("SUCCESS", "littlepay", "digital")
+
+    assert "benefits_enrollments_total{" in metrics.collect()
+
+
+@pytest.mark.django_db
+def test_middleware__records_request(client):
+    client.get(reverse(routes.INDEX))
+
+    [[key, values]] = metrics.snapshot()[metrics.REQUEST_DURATION.name]
+    assert key == [routes.INDEX, "GET", "200"]
+    assert values[-1] == 1
+    assert metrics.snapshot()[metrics.DB_QUERIES.name][0][1][0] > 0
+
+
+@pytest.mark.django_db
+def test_middleware__session_cookie_writes(client):
+    client.get(reverse(routes.INDEX))
+    # the session didn't change, so the cookie isn't sent again
+    client.get(reverse(routes.INDEX))
+
+    assert metrics.snapshot()[metrics.SESSION_COOKIE_WRITES.name] == [[[routes.INDEX], [1.0]]]
+
+
+@pytest.mark.django_db
+def test_middleware__unresolved(client):
+    client.get("/not/a/route")
+
+    assert metrics.snapshot()[metrics.REQUEST_DURATION.name] == []
+
+
+@pytest.mark.django_db
+def test_middleware__metrics_not_configured(client, settings):
+    settings.METRICS_TOKEN = None
+
+    response = client.get(METRICS_PATH)
+
+    assert response.status_code == 404
+
+
+def test_middleware__metrics_no_token(client, metrics_token):
+    response = client.get(METRICS_PATH)
+
+    assert response.status_code == 403
+
+
+def test_middleware__metrics_wrong_token(client, metrics_token):
+    response = client.get(METRICS_PATH, headers={"Authorization": "Bearer not-the-token"})
+
+    assert response.status_code == 403
+
+
+def test_middleware__metrics(client, metrics_token):
+    metrics.count_enrollment("SUCCESS", "littlepay", "digital")
+
+    response = client.get(METRICS_PATH, headers={"Authorization": f"Bearer {metrics_token}"})
+
+    assert response.status_code == 200
+    assert response["Content-Type"] == metrics.CONTENT_TYPE
+    assert "benefits_enrollments_total{" in response.content.decode()
@@ -1,6 +1,50 @@
-from benefits.core.middleware import HEALTHCHECK_PATH
+import pytest
+
+from benefits.core import health
+from benefits.core.middleware import HEALTHCHECK_PATH, READINESS_PATH
+
+
+@pytest.fixture(autouse=True)
+def clear_readiness():
+    health.clear()
+    yield
+    health.clear()
 
 
 def test_healthcheck(client):
     response = client.get(HEALTHCHECK_PATH)
     assert response.status_code == 200
+
+
+def test_healthcheck__skips_session(client):
+    response = client.get(HEALTHCHECK_PATH)
+
+    assert not response.cookies
+
+
+@pytest.mark.django_db
+def test_readiness(client):
+    response = client.get(READINESS_PATH)
+
+    assert response.status_code == 200
+    assert response.json() == {"ready": True, "checks": {"database": "ok", "secrets": "ok", "config": "ok"}}
+
+
+@pytest.mark.django_db
+def test_readiness__not_ready(client, mocker):
+    mocker.patch("benefits.core.health.secrets.warm", return_value=False)
+
+    response = client.get(READINESS_PATH)
+
+    assert response.status_code == 503
+    assert response.json()["checks"]["secrets"] == "prefetching"
+
+
+@pytest.mark.django_db
+def test_readiness__check_error(client, mocker):
+    mocker.patch.dict(health.CHECKS, {"database": mocker.Mock(side_effect=Exception("connection refused"))})
+
+    response = client.get(READINESS_PATH)
+
+    assert response.status_code == 503
+    assert response.json()["checks"]["database"] == "error"
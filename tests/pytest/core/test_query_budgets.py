@@ -0,0 +1,244 @@
+import json
+import os
+from unittest.mock import Mock
+
+import pytest
+from django.contrib.auth.models import User
+from django.urls import reverse
+
+from benefits.core import cache, query_budgets
+from benefits.routes import routes
+
+
+@pytest.fixture
+def empty_query_counts():
+    """Start the test with no query counts, keeping the counts recorded for the rest of the test session."""
+    stats, violations = query_budgets._stats, query_budgets._violations
+    query_budgets._stats, query_budgets._violations = {}, []
+    yield
+    query_budgets._stats, query_budgets._violations = stats, violations
+
+
+@pytest.fixture
+def cold_client(client):
+    """A test client that empties the configuration cache before every request, like the first request to a new process."""
+
+    def request(method):
+        def send(*args, **kwargs):
+            cache.clear()
+            return getattr(client, method)(*args, **kwargs)
+
+        return send
+
+    return Mock(get=request("get"), post=request("post"))
+
+
+@pytest.fixture
+def agency(model_TransitAgency, model_EnrollmentFlow_with_eligibility_api):
+    model_TransitAgency.enrollment_flows.add(model_EnrollmentFlow_with_eligibility_api)
+    return model_TransitAgency
+
+
+@pytest.fixture
+def mocked_verify(mocker):
+    response = Mock(error=None, eligibility=["courtesy_card"])
+    return mocker.patch("benefits.eligibility.verify.Client.verify", return_value=response)
+
+
+def _verify_eligibility(client, agency, flow):
+    assert client.get(reverse(routes.INDEX)).status_code == 200
+    assert client.get(reverse(routes.AGENCY_INDEX, args=[agency.slug])).status_code == 200
+    assert client.get(reverse(routes.ELIGIBILITY_INDEX)).status_code == 200
+    assert client.post(reverse(routes.ELIGIBILITY_INDEX), {"flow": flow.id}).status_code == 302
+    assert client.get(reverse(routes.ELIGIBILITY_START)).status_code == 200
+    assert client.get(reverse(routes.ELIGIBILITY_CONFIRM)).status_code == 200
+
+    response = client.post(reverse(routes.ELIGIBILITY_CONFIRM), {"sub": "12345", "name": "Rider"})
+    assert response.url == reverse(routes.ENROLLMENT_INDEX)
+
+    assert client.get(reverse(routes.ENROLLMENT_INDEX)).status_code == 302
+
+
+@pytest.mark.django_db
+def test_counting():
+    with query_budgets.counting() as counter:
+        list(User.objects.all())
+        User.objects.count()
+
+    assert counter.count == 2
+
+
+@pytest.mark.django_db
+def test_counting__outside_block():
+    with query_budgets.counting() as counter:
+        pass
+    User.objects.count()
+
+    assert counter.count == 0
+
+
+@pytest.mark.usefixtures("empty_query_counts")
+def test_record(mocker):
+    mocker.patch.dict(query_budgets.BUDGETS, {"app:route": 2})
+
+    assert query_budgets.record("app:route", "/route", 1) is None
+    violation = query_budgets.record("app:route", "/route", 3)
+
+    assert violation == query_budgets.Violation(route="app:route", path="/route", queries=3, budget=2)
+    assert query_budgets.violations() == [violation]
+    assert query_budgets.stats() == {"app:route": {"requests": 2, "queries": 4, "max_queries": 3}}
+
+
+@pytest.mark.usefixtures("empty_query_counts")
+def test_record__no_budget():
+    assert query_budgets.record("app:unbudgeted", "/route", 100) is None
+    assert query_budgets.violations() == []
+
+
+@pytest.mark.usefixtures("empty_query_counts")
+def test_clear_violations(mocker):
+    mocker.patch.dict(query_budgets.BUDGETS, {"app:route": 0})
+    query_budgets.record("app:route", "/route", 1)
+
+    query_budgets.clear_violations()
+
+    assert query_budgets.violations() == []
+    assert query_budgets.stats()["app:route"]["requests"] == 1
+
+
+@pytest.mark.usefixtures("empty_query_counts")
+def test_save_load(tmp_path):
+    query_budgets.record("app:route", "/route", 1)
+    path = tmp_path / "query_counts.json"
+
+    query_budgets.save(path)
+
+    # a file for each process
+    assert json.loads((tmp_path / f"query_counts.json.{os.getpid()}").read_text()) == query_budgets.stats()
+    assert query_budgets.load(path) == query_budgets.stats()
+
+
+def test_load_merges_processes(tmp_path):
+    path = tmp_path / "query_counts.json"
+    (tmp_path / "query_counts.json.100").write_text(
+        json.dumps(
+            {
+                "app:a": {"requests": 2, "queries": 6, "max_queries": 4},
+                "app:b": {"requests": 1, "queries": 1, "max_queries": 1},
+            }
+        )
+    )
+    (tmp_path / "query_counts.json.200").write_text(json.dumps({"app:a": {"requests": 3, "queries": 6, "max_queries": 2}}))
+    # not a process's counts
+    (tmp_path / "query_counts.json.200.tmp").write_text("{")
+
+    assert query_budgets.load(path) == {
+        "app:a": {"requests": 5, "queries": 12, "max_queries": 4},
+        "app:b": {"requests": 1, "queries": 1, "max_queries": 1},
+    }
+
+
+def test_load_not_found(tmp_path):
+    with pytest.raises(FileNotFoundError):
+        query_budgets.load(tmp_path / "query_counts.json")
+
+
+def test_report(mocker):
+    mocker.patch.dict(query_budgets.BUDGETS, {"app:light": 2, "app:heavy": 3}, clear=True)
+
+    report = query_budgets.report(
+        {
+            "app:light": {"requests": 2, "queries": 2, "max_queries": 1},
+            "app:heavy": {"requests": 2, "queries": 7, "max_queries": 4},
+            "app:unbudgeted": {"requests": 1, "queries": 3, "max_queries": 3},
+        }
+    )
+
+    assert [row["route"] for row in report] == ["app:heavy", "app:unbudgeted", "app:light"]
+    assert report[0] == dict(route="app:heavy", requests=2, mean_queries=3.5, max_queries=4, budget=3, over_budget=True)
+    assert report[1]["budget"] is None
+    assert report[1]["over_budget"] is False
+
+
+@pytest.mark.django_db
+@pytest.mark.usefixtures("empty_query_counts")
+def test_middleware(client, mocker):
+    logger = mocker.patch("benefits.core.middleware.logger")
+    mocker.patch.dict(query_budgets.BUDGETS, {routes.INDEX: 0})
+
+    client.get(reverse(routes.INDEX))
+
+    stats = query_budgets.stats()[routes.INDEX]
+    assert stats["requests"] == 1
+    assert stats["max_queries"] > 0
+    assert query_budgets.violations()[0].route == routes.INDEX
+    logger.warning.assert_called_once()
+
+
+@pytest.mark.django_db
+@pytest.mark.usefixtures("empty_query_counts")
+def test_middleware__unresolved(client):
+    client.get("/not/a/route")
+
+    assert query_budgets.stats() == {}
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("route", [routes.INDEX, routes.HELP, routes.LOGGED_OUT])
+def test_budget__static_pages(cold_client, route):
+    cold_client.get(reverse(route))
+
+    assert query_budgets.violations() == []
+
+
+@pytest.mark.django_db
+def test_budget__littlepay_funnel(
+    mocker,
+    cold_client,
+    agency,
+    model_LittlepayConfig,
+    model_LittlepayGroup,
+    model_EnrollmentFlow_with_eligibility_api,
+    mocked_verify,
+):
+    littlepay = mocker.patch("benefits.enrollment_littlepay.enrollment.get_client").return_value
+    littlepay.request_card_tokenization_access.return_value = {"access_token": "token", "expires_at": 9999999999}
+    littlepay.get_funding_source_by_token.return_value = Mock(id="0", card_category="Credit", card_scheme="Visa")
+    littlepay.get_funding_source_linked_concession_groups.return_value = []
+
+    _verify_eligibility(cold_client, agency, model_EnrollmentFlow_with_eligibility_api)
+
+    assert cold_client.get(reverse(routes.ENROLLMENT_LITTLEPAY_INDEX)).status_code == 200
+    assert cold_client.get(reverse(routes.ENROLLMENT_LITTLEPAY_TOKEN)).json() == {"token": "token"}
+    response = cold_client.post(reverse(routes.ENROLLMENT_LITTLEPAY_INDEX), {"card_token": "card-token"})
+    assert response.url == reverse(routes.ENROLLMENT_SUCCESS)
+    assert cold_client.get(reverse(routes.ENROLLMENT_SUCCESS)).status_code == 200
+
+    assert query_budgets.violations() == []
+
+
+@pytest.mark.django_db
+def test_budget__switchio_funnel(
+    mocker,
+    cold_client,
+    agency,
+    model_SwitchioConfig,
+    model_SwitchioGroup,
+    model_EnrollmentFlow_with_eligibility_api,
+    mocked_verify,
+):
+    registration = Mock(regId="reg", gtwUrl="https://example.com/gateway")
+    mocker.patch(
+        "benefits.enrollment_switchio.enrollment.TokenizationClient"
+    ).return_value.request_registration.return_value = registration
+    enrollment = mocker.patch("benefits.enrollment_switchio.enrollment.EnrollmentClient").return_value
+    enrollment.get_groups_for_token.return_value = []
+
+    _verify_eligibility(cold_client, agency, model_EnrollmentFlow_with_eligibility_api)
+
+    assert cold_client.get(reverse(routes.ENROLLMENT_SWITCHIO_INDEX)).status_code == 200
+    assert cold_client.get(reverse(routes.ENROLLMENT_SWITCHIO_GATEWAY_URL)).json() == {"gateway_url": registration.gtwUrl}
+    response = cold_client.post(reverse(routes.ENROLLMENT_SWITCHIO_INDEX), {"card_token": "card-token"})
+    assert response.url == reverse(routes.ENROLLMENT_SUCCESS)
+
+    assert query_budgets.violations() == []
@@ -0,0 +1,129 @@
+import datetime
+import zoneinfo
+
+import pytest
+
+from benefits.core import rollups
+from benefits.core.models import EnrollmentEvent, EnrollmentMethods, EnrollmentRollup
+
+PACIFIC = zoneinfo.ZoneInfo("America/Los_Angeles")
+
+
+@pytest.fixture
+def event(model_TransitAgency, model_EnrollmentFlow):
+    def _event(when, method=EnrollmentMethods.SELF_SERVICE, agency=model_TransitAgency, **kwargs):
+        return EnrollmentEvent(
+            transit_agency=agency,
+            enrollment_flow=model_EnrollmentFlow,
+            enrollment_method=method,
+            verified_by="test",
+            enrollment_datetime=when,
+            **kwargs,
+        )
+
+    return _event
+
+
+def _rollups():
+    return {
+        (rollup.day, rollup.transit_agency.slug, rollup.enrollment_method): (
+            rollup.enrollments,
+            rollup.with_expiration,
+            rollup.with_extra_claims,
+        )
+        for rollup in EnrollmentRollup.objects.select_related("transit_agency")
+    }
+
+
+@pytest.fixture
+def events(event, model_TransitAgency_2):
+    return EnrollmentEvent.objects.bulk_create(
+        [
+            event(datetime.datetime(2026, 10, 1, 9, tzinfo=PACIFIC)),
+            event(
+                datetime.datetime(2026, 10, 1, 23, 30, tzinfo=PACIFIC),
+                expiration_datetime=datetime.datetime(2027, 10, 1, tzinfo=PACIFIC),
+                extra_claims="claim",
+            ),
+            event(datetime.datetime(2026, 10, 1, 12, tzinfo=PACIFIC), method=EnrollmentMethods.IN_PERSON),
+            event(datetime.datetime(2026, 10, 1, 12, tzinfo=PACIFIC), agency=model_TransitAgency_2),
+            # the next day in the app's time zone, though the same day in UTC as the events above
+            event(datetime.datetime(2026, 10, 2, 0, 30, tzinfo=PACIFIC)),
+        ]
+    )
+
+
+EXPECTED = {
+    (datetime.date(2026, 10, 1), "cst", EnrollmentMethods.SELF_SERVICE): (2, 1, 1),
+    (datetime.date(2026, 10, 1), "cst", EnrollmentMethods.IN_PERSON): (1, 0, 0),
+    (datetime.date(2026, 10, 1), "cst2", EnrollmentMethods.SELF_SERVICE): (1, 0, 0),
+    (datetime.date(2026, 10, 2), "cst", EnrollmentMethods.SELF_SERVICE): (1, 0, 0),
+}
+
+
+def test_day_start():
+    assert rollups.day_start(datetime.date(2026, 10, 1)) == datetime.datetime(2026, 10, 1, tzinfo=PACIFIC)
+
+
+@pytest.mark.django_db
+def test_record(events, django_assert_num_queries):
+    with django_assert_num_queries(1):
+        rollups.record(events)
+
+    assert _rollups() == EXPECTED
+
+
+@pytest.mark.django_db
+def test_record_adds_to_existing(event, events):
+    rollups.record(events)
+    more = EnrollmentEvent.objects.bulk_create([event(datetime.datetime(2026, 10, 1, 10, tzinfo=PACIFIC))])
+
+    rollups.record(more)
+
+    assert _rollups()[(datetime.date(2026, 10, 1), "cst", EnrollmentMethods.SELF_SERVICE)] == (3, 1, 1)
+    assert EnrollmentRollup.objects.count() == len(EXPECTED)
+
+
+@pytest.mark.django_db
+def test_record_nothing(django_assert_num_queries):
+    with django_assert_num_queries(0):
+        rollups.record([])
+
+
+@pytest.fixture(autouse=True)
+def mock_today(mocker):
+    mocker.patch.object(rollups, "today", return_value=datetime.date(2026, 10, 18))
+
+
+@pytest.mark.django_db
+def test_rebuild_not_today(events):
+    with pytest.raises(ValueError, match="Only days before today"):
+        rollups.rebuild(datetime.date(2026, 10, 1), datetime.date(2026, 10, 18))
+
+
+@pytest.mark.django_db
+def test_rebuild(events):
+    assert rollups.rebuild(datetime.date(2026, 10, 1), datetime.date(2026, 10, 2)) == len(EXPECTED)
+    assert _rollups() == EXPECTED
+
+
+@pytest.mark.django_db
+def test_rebuild_idempotent(events):
+    rollups.record(events)
+
+    rollups.rebuild(datetime.date(2026, 10, 1), datetime.date(2026, 10, 2))
+    rollups.rebuild(datetime.date(2026, 10, 1), datetime.date(2026, 10, 2))
+
+    assert _rollups() == EXPECTED
+
+
+@pytest.mark.django_db
+def test_rebuild_only_days(events):
+    # counts that drifted from the events, e.g. when recording the rollups failed
+    rollups.record(events + events)
+
+    rollups.rebuild(datetime.date(2026, 10, 2), datetime.date(2026, 10, 2))
+
+    result = _rollups()
+    assert result[(datetime.date(2026, 10, 2), "cst", EnrollmentMethods.SELF_SERVICE)] == (1, 0, 0)
+    assert result[(datetime.date(2026, 10, 1), "cst", EnrollmentMethods.IN_PERSON)] == (2, 0, 0)
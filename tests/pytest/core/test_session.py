@@ -1,5 +1,6 @@
 import time
 from datetime import datetime, timedelta, timezone
+from importlib import import_module
 
 import pytest
 from cdt_identity.claims import ClaimsResult
@@ -240,6 +241,64 @@ def test_origin_default(rf):
     assert session.origin(app_request) == reverse(routes.INDEX)
 
 
+@pytest.mark.django_db
+def test_version(app_request):
+    v = session.version(app_request)
+
+    session.update(app_request, eligible=True)
+    assert session.version(app_request) == v + 1
+
+    session.reset(app_request)
+    assert session.version(app_request) == v + 2
+
+    # writing unchanged values does not change the version
+    session.reset(app_request)
+    session.update(app_request, eligible=False)
+    assert session.version(app_request) == v + 2
+
+    # reading from the session does not change the version
+    session.agency(app_request)
+    session.uid(app_request)
+    assert session.version(app_request) == v + 2
+
+
+@pytest.mark.django_db
+def test_reset_unchanged(app_request):
+    app_request.session.modified = False
+
+    session.reset(app_request)
+
+    assert not app_request.session.modified
+
+
+@pytest.mark.django_db
+def test_logout_unchanged(app_request):
+    app_request.session.modified = False
+
+    session.logout(app_request)
+
+    assert not app_request.session.modified
+
+
+@pytest.mark.django_db
+def test_update_unchanged(app_request, model_EnrollmentFlow_with_scope_and_claim):
+    session.update(app_request, debug=True, origin="/origin", flow=model_EnrollmentFlow_with_scope_and_claim)
+    app_request.session.modified = False
+
+    session.update(app_request, debug=True, origin="/origin", flow=model_EnrollmentFlow_with_scope_and_claim)
+
+    assert not app_request.session.modified
+
+
+@pytest.mark.django_db
+def test_update_changed(app_request):
+    app_request.session.modified = False
+
+    session.update(app_request, debug=True)
+
+    assert app_request.session.modified
+
+
 @pytest.mark.django_db
 def test_reset_agency(model_TransitAgency, app_request):
     session.update(app_request, agency=model_TransitAgency)
@@ -548,3 +607,17 @@ def test_oauth_extra_claims_claims_no_flow(app_request):
     OAuthSession(app_request).claims_result = ClaimsResult(verified={"eligibility_claim": True, "extra_claim": True})
     with pytest.raises(Exception, match="Oauth claims but no flow"):
         session.oauth_extra_claims(app_request)
+
+
+@pytest.mark.django_db
+def test_cache_session_store(client, settings):
+    settings.SESSION_ENGINE = "django.contrib.sessions.backends.cache"
+    settings.SESSION_CACHE_ALIAS = "sessions"
+
+    client.get(reverse(routes.INDEX))
+
+    # only the session key is sent in the cookie
+    session_key = client.cookies[settings.SESSION_COOKIE_NAME].value
+    assert len(session_key) == 32
+    stored = import_module(settings.SESSION_ENGINE).SessionStore(session_key)
+    assert stored[session._UID]
@@ -0,0 +1,36 @@
+import pytest
+
+from benefits.core.session_wrapper import SessionWrapper, write
+
+
+@pytest.mark.django_db
+def test_write(app_request):
+    app_request.session["key"] = "value"
+    app_request.session.modified = False
+
+    assert write(app_request.session, {"key": "value", "other": "new"})
+    assert app_request.session["other"] == "new"
+    assert app_request.session.modified
+
+
+@pytest.mark.django_db
+def test_write_unchanged(app_request):
+    app_request.session["key"] = "value"
+    app_request.session.modified = False
+
+    assert not write(app_request.session, {"key": "value"})
+    assert not app_request.session.modified
+
+
+@pytest.mark.django_db
+def test_SessionWrapper_set(app_request):
+    wrapper = SessionWrapper(app_request)
+    app_request.session.modified = False
+
+    wrapper._set("key", None)
+    assert app_request.session.modified
+    assert app_request.session["key"] is None
+
+    app_request.session.modified = False
+    wrapper._set("key", None)
+    assert not app_request.session.modified
@@ -1,7 +1,14 @@
 import pytest
-
+import requests
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import rsa
+from eligibility_api import server
+from eligibility_api.client import ApiError
+
+from benefits.core import http
+from benefits.eligibility import verify as verify_module
 from benefits.eligibility.forms import EligibilityVerificationForm
-from benefits.eligibility.verify import eligibility_from_api
+from benefits.eligibility.verify import Client, eligibility_from_api, get_client
 
 
 @pytest.fixture
@@ -51,3 +58,170 @@ def test_eligibility_from_api_no_verified_types(
     response = eligibility_from_api(model_EnrollmentFlow_with_eligibility_api, form, model_TransitAgency)
 
     assert response is False
+
+
+@pytest.fixture
+def api_client(model_TransitAgency, model_EnrollmentFlow_with_eligibility_api):
+    return get_client(model_EnrollmentFlow_with_eligibility_api, model_TransitAgency)
+
+
+@pytest.fixture
+def mock_http_get(mocker):
+    mocker.patch.object(Client, "_tokenize_request", return_value="request-token")
+    mocker.patch.object(Client, "_tokenize_response", return_value="response-token")
+    return mocker.patch("benefits.eligibility.verify.http.get")
+
+
+@pytest.mark.django_db
+def test_get_client(model_TransitAgency, model_EnrollmentFlow_with_eligibility_api, api_client):
+    api_request = model_EnrollmentFlow_with_eligibility_api.api_request
+
+    assert isinstance(api_client, Client)
+    assert api_client.verify_url == api_request.api_url
+    assert api_client.agency == model_TransitAgency.slug
+    assert api_client.client_private_key == api_request.client_private_key_data
+    assert api_client.server_public_key == api_request.api_public_key_data
+    assert api_client.timeout == http.timeout(http.ELIGIBILITY_API)
+
+
+@pytest.mark.django_db
+def test_get_client__reused(model_TransitAgency, model_EnrollmentFlow_with_eligibility_api, api_client):
+    client = get_client(model_EnrollmentFlow_with_eligibility_api, model_TransitAgency)
+
+    # a copy for the agency, sharing the parsed keys
+    assert client is not api_client
+    assert client._jwks is api_client._jwks
+
+
+@pytest.mark.django_db
+def test_get_client__agencies(
+    model_TransitAgency, model_TransitAgency_2, model_EnrollmentFlow_with_eligibility_api, api_client
+):
+    client = get_client(model_EnrollmentFlow_with_eligibility_api, model_TransitAgency_2)
+
+    assert client.agency == model_TransitAgency_2.slug
+    assert api_client.agency == model_TransitAgency.slug
+    assert client._jwks is api_client._jwks
+
+
+@pytest.mark.django_db
+def test_get_client__api_request_changed(model_TransitAgency, model_EnrollmentFlow_with_eligibility_api, api_client):
+    api_request = model_EnrollmentFlow_with_eligibility_api.api_request
+    api_request.api_url = "https://example.com/verify/v2"
+    api_request.save()
+
+    client = get_client(model_EnrollmentFlow_with_eligibility_api, model_TransitAgency)
+
+    assert client._jwks is not api_client._jwks
+    assert client.verify_url == "https://example.com/verify/v2"
+
+
+@pytest.mark.django_db
+def test_get_client__pem_data_changed(model_TransitAgency, model_EnrollmentFlow_with_eligibility_api, api_client):
+    model_EnrollmentFlow_with_eligibility_api.api_request.api_public_key.save()
+
+    client = get_client(model_EnrollmentFlow_with_eligibility_api, model_TransitAgency)
+
+    assert client._jwks is not api_client._jwks
+
+
+@pytest.mark.django_db
+def test_get_client__new_key_material(mocker, model_TransitAgency, model_EnrollmentFlow_with_eligibility_api, api_client):
+    api_request = model_EnrollmentFlow_with_eligibility_api.api_request
+    mocker.patch.object(type(api_request), "client_private_key_data", new_callable=mocker.PropertyMock, return_value="new key")
+
+    client = get_client(model_EnrollmentFlow_with_eligibility_api, model_TransitAgency)
+
+    assert client._jwks is not api_client._jwks
+    assert client.client_private_key == "new key"
+
+
+@pytest.mark.django_db
+def test_client_request(api_client, mock_http_get):
+    mock_http_get.return_value.status_code = 200
+
+    response = api_client.verify("A1234567", "Garcia", ["courtesy_card"])
+
+    assert response == "response-token"
+    mock_http_get.assert_called_once()
+    assert mock_http_get.call_args.args == (http.ELIGIBILITY_API, api_client.verify_url)
+    assert mock_http_get.call_args.kwargs["headers"] == {
+        "Authorization": "Bearer request-token",
+        "X-API-AUTH": "secret value!",
+    }
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize(
+    "exception", [requests.ConnectionError, requests.Timeout, requests.TooManyRedirects, requests.HTTPError]
+)
+def test_client_request__exception(api_client, mock_http_get, exception):
+    mock_http_get.side_effect = exception
+
+    with pytest.raises(ApiError):
+        api_client.verify("A1234567", "Garcia", ["courtesy_card"])
+
+
+@pytest.mark.django_db
+def test_client_request__unexpected_status(api_client, mock_http_get):
+    mock_http_get.return_value.status_code = 500
+
+    with pytest.raises(ApiError):
+        api_client.verify("A1234567", "Garcia", ["courtesy_card"])
+
+
+@pytest.fixture
+def keys():
+    """PEM-encoded client and server key pairs."""
+    pems = {}
+    for name in ("client", "server"):
+        key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+        pems[f"{name}_private"] = key.private_bytes(
+            serialization.Encoding.PEM, serialization.PrivateFormat.PKCS8, serialization.NoEncryption()
+        ).decode("utf-8")
+        pems[f"{name}_public"] = (
+            key.public_key()
+            .public_bytes(serialization.Encoding.PEM, serialization.PublicFormat.SubjectPublicKeyInfo)
+            .decode("utf-8")
+        )
+    return pems
+
+
+@pytest.mark.django_db
+def test_eligibility_from_api_keys_parsed_once(
+    mocker, model_TransitAgency, model_EnrollmentFlow_with_eligibility_api, form, keys
+):
+    api_request = model_EnrollmentFlow_with_eligibility_api.api_request
+    api_request_type = type(api_request)
+    mocker.patch.object(
+        api_request_type, "client_private_key_data", new_callable=mocker.PropertyMock, return_value=keys["client_private"]
+    )
+    mocker.patch.object(
+        api_request_type, "api_public_key_data", new_callable=mocker.PropertyMock, return_value=keys["server_public"]
+    )
+    alg, enc, sig = "RSA-OAEP", "A256CBC-HS512", "RS256"
+    api_request.api_jwe_encryption_alg, api_request.api_jwe_cek_enc, api_request.api_jws_signing_alg = alg, enc, sig
+    api_request.save()
+
+    def verify(service, url, headers, timeout):
+        # the Eligibility API server: decrypt the request token, and respond that the rider is eligible
+        token = headers["Authorization"].removeprefix("Bearer ")
+        payload = server.get_token_payload(token, alg, enc, keys["server_private"], sig, keys["client_public"])
+        response = server.create_response_payload(payload, issuer="test")
+        response["eligibility"] = payload["eligibility"]
+        token = server.make_token(response, sig, keys["server_private"], alg, enc, keys["client_public"])
+        return mocker.Mock(status_code=200, text=token)
+
+    mocker.patch("benefits.eligibility.verify.http.get", side_effect=verify)
+    from_pem = mocker.spy(verify_module.jwk.JWK, "from_pem")
+
+    def client_parses():
+        # the server also parses its own keys
+        client_keys = {keys["client_private"].encode("utf-8"), keys["server_public"].encode("utf-8")}
+        return [call.args[-1] for call in from_pem.call_args_list if call.args[-1] in client_keys]
+
+    assert eligibility_from_api(model_EnrollmentFlow_with_eligibility_api, form, model_TransitAgency) is True
+    assert len(client_parses()) == 2
+
+    assert eligibility_from_api(model_EnrollmentFlow_with_eligibility_api, form, model_TransitAgency) is True
+    assert len(client_parses()) == 2
@@ -1,6 +1,7 @@
 from datetime import timedelta
 
 import pytest
+from django.db import DatabaseError
 from django.urls import reverse
 from django.utils import timezone
 from requests import HTTPError
@@ -169,7 +170,6 @@ def test_is_within_enrollment_window_equal_expiry_date(mocker):
     "mocked_session_agency", "mocked_session_flow", "mocked_session_group", "mocked_session_eligible", "model_LittlepayGroup"
 )
 def test_handle_enrollment_results_success_claims(
-    mocker,
     app_request,
     mocked_session_oauth_extra_claims,
     model_TransitAgency,
@@ -178,18 +178,16 @@ def test_handle_enrollment_results_success_claims(
     mocked_analytics_module,
 ):
     mocked_session_oauth_extra_claims.return_value = ["claim_1", "claim_2"]
-    spy = mocker.spy(benefits.enrollment.enrollment.models.EnrollmentEvent.objects, "create")
 
     response = handle_enrollment_results(app_request, Status.SUCCESS, "verified by")
 
-    spy.assert_called_once_with(
-        transit_agency=model_TransitAgency,
-        enrollment_flow=model_EnrollmentFlow_with_scope_and_claim,
-        enrollment_method=models.EnrollmentMethods.SELF_SERVICE,
-        verified_by="verified by",
-        expiration_datetime=None,
-        extra_claims="claim_1, claim_2",
-    )
+    event = models.EnrollmentEvent.objects.get()
+    assert event.transit_agency == model_TransitAgency
+    assert event.enrollment_flow == model_EnrollmentFlow_with_scope_and_claim
+    assert event.enrollment_method == models.EnrollmentMethods.SELF_SERVICE
+    assert event.verified_by == "verified by"
+    assert event.expiration_datetime is None
+    assert event.extra_claims == "claim_1, claim_2"
 
     assert response.status_code == 302
     assert response.url == reverse(routes.ENROLLMENT_SUCCESS)
@@ -204,47 +202,61 @@ def test_handle_enrollment_results_success_claims(
 def test_handle_enrollment_results_success_transitagencygroup(
     mocker,
     app_request,
+    django_assert_num_queries,
     model_EnrollmentFlow,
     model_TransitAgency,
     model_TransitAgency_2,
     mocked_analytics_module,
 ):
-    spy = mocker.spy(benefits.enrollment.enrollment.models.EnrollmentEvent.objects, "create")
-
-    handle_enrollment_results(app_request, Status.SUCCESS, "verified by")
-
-    expected_calls = [
-        mocker.call(
-            transit_agency=model_TransitAgency,
-            enrollment_flow=model_EnrollmentFlow,
-            enrollment_method=models.EnrollmentMethods.SELF_SERVICE,
-            verified_by="verified by",
-            expiration_datetime=None,
-            extra_claims="",
-        ),
-        mocker.call(
-            transit_agency=model_TransitAgency_2,
-            enrollment_flow=model_EnrollmentFlow,
-            enrollment_method=models.EnrollmentMethods.SELF_SERVICE,
-            verified_by="verified by",
-            expiration_datetime=None,
-            extra_claims="",
-        ),
+    spy = mocker.spy(benefits.enrollment.enrollment.models.EnrollmentEvent.objects, "bulk_create")
+
+    # the group's agencies, then the events for all agencies in one insert, then their rollups in one upsert
+    with django_assert_num_queries(3):
+        handle_enrollment_results(app_request, Status.SUCCESS, "verified by")
+
+    spy.assert_called_once()
+    events = models.EnrollmentEvent.objects.order_by("transit_agency__slug")
+    assert [event.transit_agency for event in events] == [model_TransitAgency, model_TransitAgency_2]
+    for event in events:
+        assert event.enrollment_flow == model_EnrollmentFlow
+        assert event.enrollment_method == models.EnrollmentMethods.SELF_SERVICE
+        assert event.verified_by == "verified by"
+        assert event.expiration_datetime is None
+        assert event.extra_claims == ""
+
+    assert [(rollup.transit_agency, rollup.enrollments) for rollup in models.EnrollmentRollup.objects.all()] == [
+        (model_TransitAgency, 1),
+        (model_TransitAgency_2, 1),
     ]
-    spy.assert_has_calls(expected_calls)
-    assert spy.call_count == 2  # assert_has_calls doesn't assert that those are the _only_ calls
 
     assert mocked_analytics_module.returned_success.call_count == 2
     analytics_kwargs = mocked_analytics_module.returned_success.call_args.kwargs
     assert analytics_kwargs["agency"] == model_TransitAgency_2
 
 
+@pytest.mark.django_db
+@pytest.mark.usefixtures("mocked_session_agency", "mocked_session_flow", "mocked_session_group", "model_LittlepayGroup")
+def test_handle_enrollment_results_success_rollups_error(
+    mocker, app_request, mocked_analytics_module, mocked_sentry_sdk_module
+):
+    error = DatabaseError("rollups")
+    mocker.patch.object(benefits.enrollment.enrollment.rollups, "record", side_effect=error)
+
+    response = handle_enrollment_results(app_request, Status.SUCCESS, "verified by")
+
+    # the rider is enrolled all the same, and the event is saved for the rebuild of the rollups
+    assert response.status_code == 302
+    assert response.url == reverse(routes.ENROLLMENT_SUCCESS)
+    assert models.EnrollmentEvent.objects.count() == 1
+    mocked_analytics_module.returned_success.assert_called_once()
+    mocked_sentry_sdk_module.capture_exception.assert_called_once_with(error)
+
+
 @pytest.mark.django_db
 @pytest.mark.usefixtures(
     "mocked_session_agency", "mocked_session_flow", "mocked_session_group", "mocked_session_eligible", "model_LittlepayGroup"
 )
 def test_handle_enrollment_results_success_eligibility_api(
-    mocker,
     app_request,
     mocked_session_oauth_extra_claims,
     model_TransitAgency,
@@ -253,18 +265,16 @@ def test_handle_enrollment_results_success_eligibility_api(
     mocked_analytics_module,
 ):
     mocked_session_oauth_extra_claims.return_value = ["claim_1", "claim_2"]
-    spy = mocker.spy(benefits.enrollment.enrollment.models.EnrollmentEvent.objects, "create")
 
     response = handle_enrollment_results(app_request, Status.SUCCESS, "verified by")
 
-    spy.assert_called_once_with(
-        transit_agency=model_TransitAgency,
-        enrollment_flow=model_EnrollmentFlow_with_eligibility_api,
-        enrollment_method=models.EnrollmentMethods.SELF_SERVICE,
-        verified_by="verified by",
-        expiration_datetime=None,
-        extra_claims="claim_1, claim_2",
-    )
+    event = models.EnrollmentEvent.objects.get()
+    assert event.transit_agency == model_TransitAgency
+    assert event.enrollment_flow == model_EnrollmentFlow_with_eligibility_api
+    assert event.enrollment_method == models.EnrollmentMethods.SELF_SERVICE
+    assert event.verified_by == "verified by"
+    assert event.expiration_datetime is None
+    assert event.extra_claims == "claim_1, claim_2"
 
     assert response.status_code == 302
     assert response.url == reverse(routes.ENROLLMENT_SUCCESS)
@@ -317,3 +327,19 @@ def test_handle_enrollment_results_reenrollment_error(app_request, mocked_analyt
     assert response.status_code == 302
     assert response.url == reverse(routes.ENROLLMENT_REENROLLMENT_ERROR)
     mocked_analytics_module.returned_error.assert_called_once()
+
+
+@pytest.mark.django_db
+@pytest.mark.usefixtures(
+    "mocked_session_agency", "mocked_session_flow", "mocked_session_group", "mocked_session_eligible", "model_LittlepayGroup"
+)
+@pytest.mark.parametrize("status", [Status.SUCCESS, Status.SYSTEM_ERROR, Status.REENROLLMENT_ERROR])
+def test_handle_enrollment_results_counts_status(mocker, app_request, model_TransitAgency, status, mocked_analytics_module):
+    mocker.patch.object(benefits.enrollment.enrollment, "sentry_sdk")
+    count_enrollment = mocker.patch.object(benefits.enrollment.enrollment.metrics, "count_enrollment")
+
+    handle_enrollment_results(app_request, status, "verified by", Exception("some exception"))
+
+    count_enrollment.assert_called_once_with(
+        status.name, model_TransitAgency.transit_processor, models.EnrollmentMethods.SELF_SERVICE
+    )
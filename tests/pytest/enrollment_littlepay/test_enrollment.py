@@ -1,10 +1,30 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
+
 import pytest
-from littlepay.api.funding_sources import FundingSourceResponse
+from littlepay.api.funding_sources import FundingSourceGroupResponse, FundingSourceResponse
 from littlepay.api.groups import GroupFundingSourceResponse
 from requests import HTTPError
 
+from benefits.core import http
 from benefits.enrollment.enrollment import Status, _calculate_expiry
-from benefits.enrollment_littlepay.enrollment import _get_group_funding_source, enroll, request_card_tokenization_access
+from benefits.enrollment_littlepay.enrollment import (
+    TOKEN_REFRESH_LEEWAY,
+    _get_group_funding_source,
+    clear_clients,
+    enroll,
+    get_client,
+    request_card_tokenization_access,
+)
+
+GROUP_ID = "0a1b2c3d-0000-4000-8000-000000000123"
+
+
+@pytest.fixture(autouse=True)
+def clear_littlepay_clients():
+    clear_clients()
+    yield
+    clear_clients()
 
 
 @pytest.fixture
@@ -55,28 +75,65 @@ def card_token():
     return "card_token_1234"
 
 
+@pytest.fixture
+def mocked_funding_source_group():
+    return FundingSourceGroupResponse(
+        id="0",
+        group_id=GROUP_ID,
+        label="Group 123",
+        created_date="2023-01-01T00:00:00Z",
+        updated_date=None,
+        expiry_date=None,
+    )
+
+
+@pytest.fixture
+def mocked_funding_source_other_group():
+    return FundingSourceGroupResponse(id="1", group_id="0a1b2c3d-0000-4000-8000-000000000456", label="Group 456")
+
+
 @pytest.mark.django_db
 @pytest.mark.usefixtures("model_EnrollmentFlow")
-def test_get_group_funding_sources_funding_source_not_enrolled_yet(mocker, mocked_funding_source):
+def test_get_group_funding_sources_funding_source_not_enrolled_yet(
+    mocker, mocked_funding_source, mocked_funding_source_other_group
+):
     mock_client = mocker.Mock()
-    mock_client.get_concession_group_linked_funding_sources.return_value = []
+    mock_client.get_funding_source_linked_concession_groups.return_value = [mocked_funding_source_other_group]
 
-    matching_group_funding_source = _get_group_funding_source(mock_client, "group123", mocked_funding_source.id)
+    matching_group_funding_source = _get_group_funding_source(mock_client, GROUP_ID, mocked_funding_source.id)
 
     assert matching_group_funding_source is None
+    mock_client.get_funding_source_linked_concession_groups.assert_called_once_with(mocked_funding_source.id)
 
 
 @pytest.mark.django_db
 @pytest.mark.usefixtures("model_EnrollmentFlow")
 def test_get_group_funding_sources_funding_source_already_enrolled(
-    mocker, mocked_funding_source, mocked_group_funding_source_no_expiry
+    mocker, mocked_funding_source, mocked_funding_source_group, mocked_funding_source_other_group
 ):
     mock_client = mocker.Mock()
-    mock_client.get_concession_group_linked_funding_sources.return_value = [mocked_group_funding_source_no_expiry]
+    mock_client.get_funding_source_linked_concession_groups.return_value = [
+        mocked_funding_source_other_group,
+        mocked_funding_source_group,
+    ]
+
+    matching_group_funding_source = _get_group_funding_source(mock_client, GROUP_ID, mocked_funding_source.id)
+
+    assert matching_group_funding_source == mocked_funding_source_group
+    mock_client.get_concession_group_linked_funding_sources.assert_not_called()
+
+
+@pytest.mark.django_db
+@pytest.mark.usefixtures("model_EnrollmentFlow")
+def test_get_group_funding_sources_group_id_case(mocker, mocked_funding_source, mocked_funding_source_group):
+    mock_client = mocker.Mock()
+    mock_client.get_funding_source_linked_concession_groups.return_value = [mocked_funding_source_group]
 
-    matching_group_funding_source = _get_group_funding_source(mock_client, "group123", mocked_funding_source.id)
+    matching_group_funding_source = _get_group_funding_source(
+        mock_client, mocked_funding_source_group.group_id.upper(), mocked_funding_source.id
+    )
 
-    assert matching_group_funding_source == mocked_group_funding_source_no_expiry
+    assert matching_group_funding_source == mocked_funding_source_group
 
 
 @pytest.mark.django_db
@@ -547,7 +604,6 @@ def test_request_card_tokenization_access(mocker, app_request):
     assert response.expires_at == "2024-01-01T00:00:00"
     assert response.exception is None
     assert response.status_code is None
-    mock_client.oauth.ensure_active_token.assert_called_once()
 
 
 @pytest.mark.django_db
@@ -610,3 +666,65 @@ def test_request_card_tokenization_access_exception(mocker, app_request):
     assert response.expires_at is None
     assert response.exception == exception
     assert response.status_code is None
+
+
+@pytest.fixture
+def mock_fetch_token(mocker):
+    def fetch_token(*args, **kwargs):
+        return dict(access_token="token", expires_at=int(time.time()) + 3600)
+
+    return mocker.patch("littlepay.api.client.OAuth2Session.fetch_token", side_effect=fetch_token)
+
+
+@pytest.mark.django_db
+@pytest.mark.usefixtures("mocked_api_base_url")
+def test_get_client(model_LittlepayConfig, mock_fetch_token):
+    client = get_client(model_LittlepayConfig)
+
+    mock_fetch_token.assert_called_once()
+    assert client.base_url == "https://example.com/backend-api"
+    assert client.oauth.token["access_token"] == "token"
+    assert isinstance(client.oauth.get_adapter("https://example.com"), http.PooledAdapter)
+
+
+@pytest.mark.django_db
+@pytest.mark.usefixtures("mocked_api_base_url")
+def test_get_client__reused(model_LittlepayConfig, mock_fetch_token):
+    client = get_client(model_LittlepayConfig)
+
+    assert get_client(model_LittlepayConfig) is client
+    mock_fetch_token.assert_called_once()
+
+
+@pytest.mark.django_db
+@pytest.mark.usefixtures("mocked_api_base_url")
+def test_get_client__token_expiring(model_LittlepayConfig, mock_fetch_token):
+    client = get_client(model_LittlepayConfig)
+    client.oauth.token["expires_at"] = int(time.time()) + TOKEN_REFRESH_LEEWAY - 1
+
+    assert get_client(model_LittlepayConfig) is client
+    assert mock_fetch_token.call_count == 2
+    assert client.oauth.token["expires_at"] > time.time() + TOKEN_REFRESH_LEEWAY
+
+
+@pytest.mark.django_db
+@pytest.mark.usefixtures("mocked_api_base_url")
+def test_get_client__credentials_changed(model_LittlepayConfig, mock_fetch_token):
+    client = get_client(model_LittlepayConfig)
+
+    model_LittlepayConfig.client_id = "new_client_id"
+
+    new_client = get_client(model_LittlepayConfig)
+    assert new_client is not client
+    assert new_client.credentials["client_id"] == "new_client_id"
+    assert mock_fetch_token.call_count == 2
+
+
+@pytest.mark.django_db
+@pytest.mark.usefixtures("mocked_api_base_url")
+def test_get_client__threads(model_LittlepayConfig, mock_fetch_token):
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        clients = list(executor.map(lambda _: get_client(model_LittlepayConfig), range(16)))
+
+    assert len(set(map(id, clients))) == 1
+    mock_fetch_token.assert_called_once()
@@ -37,3 +37,11 @@ def test_access_token_valid_valid(app_request):
     session = Session(app_request, access_token=token, access_token_expiry=exp)
 
     assert session.access_token_valid()
+
+
+def test_reset_unchanged(app_request):
+    app_request.session.modified = False
+
+    Session(app_request, reset=True)
+
+    assert not app_request.session.modified
@@ -1,23 +1,47 @@
 import json
+import os
 from datetime import datetime, timedelta, timezone
 
 import pytest
 from django.utils import timezone as tz
 
 import benefits.enrollment_switchio.api
+from benefits.core.http import PooledAdapter
 from benefits.enrollment_switchio.api import (
     Client,
     EnrollmentClient,
     EshopResponseMode,
     Group,
     GroupExpiry,
+    PooledSession,
     Registration,
     RegistrationMode,
     RegistrationStatus,
     TokenizationClient,
+    _pem_path,
+    _ssl_context,
+    clear_sessions,
+    get_session,
 )
 
 
+@pytest.fixture(autouse=True)
+def clear_switchio_sessions():
+    clear_sessions()
+    yield
+    clear_sessions()
+
+
+@pytest.fixture
+def mock_ssl_context(mocker):
+    return mocker.patch("benefits.enrollment_switchio.api._ssl_context")
+
+
+@pytest.fixture
+def mock_session(mocker):
+    return mocker.patch("benefits.enrollment_switchio.api.get_session").return_value
+
+
 @pytest.fixture
 def tokenization_client():
     return TokenizationClient(
@@ -41,22 +65,117 @@ def enrollment_client():
     )
 
 
-@pytest.mark.django_db
-def test_client_cert_request(mocker):
-    temp_file = mocker.patch("benefits.enrollment_switchio.api.NamedTemporaryFile")
-    request_func = mocker.Mock()
+@pytest.mark.skipif(not hasattr(os, "memfd_create"), reason="memfd_create is not supported on this platform")
+def test_pem_path__memfd():
+    with _pem_path("pem contents") as path:
+        assert path.startswith("/proc/self/fd/")
+        with open(path) as file:
+            assert file.read() == "pem contents"
+
+
+def test_pem_path__temp_file(mocker):
+    # no memfd_create on this platform
+    mocker.patch("benefits.enrollment_switchio.api.os", spec=[])
+
+    with _pem_path("pem contents") as path:
+        with open(path) as file:
+            assert file.read() == "pem contents"
+
+    assert not os.path.exists(path)
+
+
+def test_ssl_context(mocker):
+    create_default_context = mocker.patch("benefits.enrollment_switchio.api.ssl.create_default_context")
+    context = create_default_context.return_value
+    loaded = {}
+
+    def load_cert_chain(certfile, keyfile):
+        with open(certfile) as cert, open(keyfile) as key:
+            loaded.update(cert=cert.read(), key=key.read())
+
+    context.load_cert_chain.side_effect = load_cert_chain
+
+    result = _ssl_context("private key contents", "client cert contents", "ca cert contents")
+
+    assert result == context
+    create_default_context.assert_called_once_with(cadata="ca cert contents")
+    assert loaded == dict(cert="client cert contents", key="private key contents")
+
+
+def test_get_session(mock_ssl_context):
+    session = get_session(1, "private key contents", "client cert contents", "ca cert contents")
+
+    mock_ssl_context.assert_called_once_with("private key contents", "client cert contents", "ca cert contents")
+    assert isinstance(session, PooledSession)
+    adapter = session.get_adapter("https://example.com")
+    assert isinstance(adapter, PooledAdapter)
+    assert adapter.ssl_context == mock_ssl_context.return_value
+    assert adapter.poolmanager.connection_pool_kw["ssl_context"] == mock_ssl_context.return_value
+
 
+def test_get_session__shared(mock_ssl_context):
+    session = get_session(1, "private key contents", "client cert contents", "ca cert contents")
+
+    assert get_session(1, "private key contents", "client cert contents", "ca cert contents") is session
+    assert get_session(2, "private key contents", "client cert contents", "ca cert contents") is not session
+    assert mock_ssl_context.call_count == 2
+
+
+def test_get_session__rotated(mocker, mock_ssl_context):
+    session = get_session(1, "private key contents", "client cert contents", "ca cert contents")
+    close = mocker.spy(session, "close")
+
+    rotated = get_session(1, "rotated key contents", "client cert contents", "ca cert contents")
+
+    # one session per configuration, replaced when its PEM data changes
+    assert rotated is not session
+    close.assert_called_once()
+    assert get_session(1, "rotated key contents", "client cert contents", "ca cert contents") is rotated
+    assert len(benefits.enrollment_switchio.api._sessions) == 1
+
+
+def test_get_session__forked(mocker, mock_ssl_context):
+    session = get_session(1, "private key contents", "client cert contents", "ca cert contents")
+    close = mocker.spy(session, "close")
+    mocker.patch("benefits.enrollment_switchio.api.os.getpid", return_value=os.getpid() + 1)
+
+    assert get_session(1, "private key contents", "client cert contents", "ca cert contents") is not session
+    close.assert_not_called()
+
+
+def test_PooledSession_environment(monkeypatch, mock_ssl_context):
+    monkeypatch.setenv("REQUESTS_CA_BUNDLE", "/etc/ssl/other-bundle.pem")
+    monkeypatch.setenv("HTTPS_PROXY", "http://proxy.example.com:8080")
+    session = PooledSession("private key contents", "client cert contents", "ca cert contents")
+
+    settings = session.merge_environment_settings("https://example.com", {}, None, None, None)
+
+    # proxies from the environment, but only the configured CA
+    assert session.trust_env
+    assert settings["proxies"]["https"] == "http://proxy.example.com:8080"
+    assert settings["verify"] == session.verify
+    with open(session.verify) as file:
+        assert file.read() == "ca cert contents"
+
+    session.close()
+
+
+def test_client_session(mock_ssl_context):
     client = Client(
         private_key="private key contents",
         client_certificate="client cert contents",
         ca_certificate="ca cert contents",
+        config_id=1,
+    )
+    other_client = Client(
+        private_key="private key contents",
+        client_certificate="client cert contents",
+        ca_certificate="ca cert contents",
+        config_id=1,
     )
-    client._cert_request(request_func)
 
-    temp_file.assert_called()
-    request_func.assert_called_once()
-    assert "verify" in request_func.call_args.kwargs
-    assert "cert" in request_func.call_args.kwargs
+    assert client.session is other_client.session
+    mock_ssl_context.assert_called_once()
 
 
 @pytest.mark.parametrize("method", ["GET", "POST"])
@@ -123,11 +242,11 @@ def test_tokenization_client_get_headers(mocker, tokenization_client, method, bo
     assert headers == expected
 
 
-def test_tokenization_client_request_registration(mocker, tokenization_client):
+def test_tokenization_client_request_registration(mocker, mock_session, tokenization_client):
     mock_response = mocker.Mock()
     mock_json = dict(regId="1234", gtwUrl="https://example.com/cst/?regId=1234")
     mock_response.json.return_value = mock_json
-    mocker.patch("benefits.enrollment_switchio.api.TokenizationClient._cert_request", return_value=mock_response)
+    mock_session.post.return_value = mock_response
 
     registration = tokenization_client.request_registration(
         eshopRedirectUrl="https://localhost/enrollment",
@@ -138,7 +257,7 @@ def test_tokenization_client_request_registration(mocker, tokenization_client):
     assert registration == Registration(**mock_json)
 
 
-def test_tokenization_client_get_registration_status(mocker, tokenization_client):
+def test_tokenization_client_get_registration_status(mocker, mock_session, tokenization_client):
     mock_response = mocker.Mock()
     mock_json = dict(
         regState="created",
@@ -151,7 +270,7 @@ def test_tokenization_client_get_registration_status(mocker, tokenization_client
         cardExp="1119",
     )
     mock_response.json.return_value = mock_json
-    mocker.patch("benefits.enrollment_switchio.api.TokenizationClient._cert_request", return_value=mock_response)
+    mock_session.get.return_value = mock_response
 
     registration_status = tokenization_client.get_registration_status(registration_id="1234")
 
@@ -191,17 +310,17 @@ def test_enrollment_client_get_headers(enrollment_client):
     assert headers == {"Authorization": "Basic abc123"}
 
 
-def test_enrollment_client_healthcheck(mocker, enrollment_client):
+def test_enrollment_client_healthcheck(mocker, mock_session, enrollment_client):
     mock_response = mocker.Mock()
     mock_response.text.return_value = "Egibility is alive!"
-    mocker.patch("benefits.enrollment_switchio.api.EnrollmentClient._cert_request", return_value=mock_response)
+    mock_session.get.return_value = mock_response
 
     response = enrollment_client.healthcheck()
 
     assert response == mock_response.text
 
 
-def test_enrollment_client_get_groups(mocker, enrollment_client):
+def test_enrollment_client_get_groups(mocker, mock_session, enrollment_client):
     mock_response = mocker.Mock()
     mock_json = dict(
         id=1,
@@ -211,18 +330,18 @@ def test_enrollment_client_get_groups(mocker, enrollment_client):
         value=10,
     )
     mock_response.json.return_value = [mock_json]
-    mocker.patch("benefits.enrollment_switchio.api.EnrollmentClient._cert_request", return_value=mock_response)
+    mock_session.get.return_value = mock_response
 
     groups = enrollment_client.get_groups(pto_id="123")
 
     assert groups == [Group(**mock_json)]
 
 
-def test_enrollment_client_get_groups_for_token(mocker, enrollment_client):
+def test_enrollment_client_get_groups_for_token(mocker, mock_session, enrollment_client):
     mock_response = mocker.Mock()
     mock_json = dict(group="veteran-discount", expiresAt=None)
     mock_response.json.return_value = [mock_json]
-    mocker.patch("benefits.enrollment_switchio.api.EnrollmentClient._cert_request", return_value=mock_response)
+    mock_session.get.return_value = mock_response
 
     groups = enrollment_client.get_groups_for_token(pto_id="123", token="abcde12345")
 
@@ -236,15 +355,8 @@ def test_enrollment_client_get_groups_for_token(mocker, enrollment_client):
         (datetime(2025, 9, 12, 19, 15, 0, tzinfo=timezone.utc), "2025-09-12T19:15:00Z"),
     ],
 )
-def test_enrollment_client_add_group_to_token(mocker, enrollment_client, expiry, expected_expires_at):
-    mock_post = mocker.patch("benefits.enrollment_switchio.api.requests.post")
-
-    def cert_request_spy(request_func):
-        # the original `_cert_request` adds `verify` and `cert` kwargs.
-        # pass dummy values here to satisfy the lambda's signature.
-        return request_func(verify="dummy_ca_path", cert=("dummy_cert_path", "dummy_key_path"))
-
-    mocker.patch.object(enrollment_client, "_cert_request", side_effect=cert_request_spy)
+def test_enrollment_client_add_group_to_token(mock_session, enrollment_client, expiry, expected_expires_at):
+    mock_post = mock_session.post
 
     pto_id = "123"
     group_id = "test-group"
@@ -256,20 +368,20 @@ def test_enrollment_client_add_group_to_token(mocker, enrollment_client, expiry,
     if expected_expires_at:
         expected_body["expiresAt"] = expected_expires_at
 
-    # Assert that `requests.post` was called with the correct URL and body.
+    # Assert that the session's `post` was called with the correct URL and body.
     expected_url = f"{enrollment_client.api_url}/api/external/discount/{pto_id}/token/{token}/add"
     mock_post.assert_called_once()
     assert mock_post.call_args.args == (expected_url,)
     assert mock_post.call_args.kwargs["json"] == expected_body
 
 
-def test_enrollment_client_remove_group_from_token(mocker, enrollment_client):
+def test_enrollment_client_remove_group_from_token(mocker, mock_session, enrollment_client):
     group_code = "veteran-discount"
     token = "abcde12345"
 
     mock_response = mocker.Mock()
     mock_response.text.return_value = f"Discount {group_code} removed successfully for token {token}"
-    mocker.patch("benefits.enrollment_switchio.api.EnrollmentClient._cert_request", return_value=mock_response)
+    mock_session.post.return_value = mock_response
 
     response = enrollment_client.remove_group_from_token("123", group_code, token)
 
@@ -20,3 +20,11 @@ def test_gateway_url(app_request):
     session.gateway_url = gateway_url
 
     assert session.gateway_url == gateway_url
+
+
+def test_reset_unchanged(app_request):
+    app_request.session.modified = False
+
+    Session(app_request, reset=True)
+
+    assert not app_request.session.modified
@@ -1,6 +1,9 @@
+from types import MappingProxyType
+
 import pytest
+from django.urls import reverse
 
-from benefits.routes import Routes, routes
+from benefits.routes import Routes, check_routes, routes
 
 
 @pytest.mark.parametrize(("route", "expected_name"), [("app:name", "name"), ("core:index", "index")])
@@ -16,11 +19,43 @@ def test_name_not_route(route: str):
 def test_to_dict():
     routes_dict = routes.to_dict()
 
-    # this is in fact, a dict!
-    assert isinstance(routes_dict, dict)
+    # this is in fact, a read-only mapping!
+    assert isinstance(routes_dict, MappingProxyType)
     # all keys are strings
     assert all((isinstance(k, str) for k in routes_dict.keys()))
     # all keys are @property on the original routes object
     assert all((hasattr(routes, k) and isinstance(getattr(Routes, k), property) for k in routes_dict.keys()))
     # all key values equal their corresponding attribute value
     assert all((routes_dict[k] == getattr(routes, k)) for k in routes_dict.keys())
+
+
+def test_to_dict_shared():
+    assert routes.to_dict() is routes.to_dict()
+    # cached by class, not on each instance
+    assert Routes().to_dict() is routes.to_dict()
+
+
+def test_urls():
+    urls = routes.urls()
+
+    assert isinstance(urls, MappingProxyType)
+    assert urls["INDEX"] == reverse(routes.INDEX)
+    assert urls["OAUTH_LOGIN"] == reverse(routes.OAUTH_LOGIN)
+    # routes that take arguments aren't included
+    assert "AGENCY_INDEX" not in urls
+    assert urls is routes.urls()
+    assert Routes().urls() is urls
+
+
+def test_check_routes():
+    assert check_routes(None) == []
+
+
+@pytest.mark.parametrize("route", ["core:not_a_route", "not_an_app:index"])
+def test_check_routes_undefined(mocker, route):
+    mocker.patch.object(Routes, "to_dict", return_value={"NOT_A_ROUTE": route})
+
+    [error] = check_routes(None)
+
+    assert error.id == "benefits.E001"
+    assert repr(route) in error.msg
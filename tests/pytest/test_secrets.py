@@ -1,8 +1,25 @@
 import pytest
-from azure.core.exceptions import ClientAuthenticationError
+from azure.core.exceptions import ClientAuthenticationError, ResourceNotFoundError
 from django.core.exceptions import ValidationError
 
-from benefits.secrets import KEY_VAULT_URL, NAME_VALIDATOR, SecretNameValidator, get_secret_by_name
+from benefits.secrets import (
+    KEY_VAULT_URL,
+    NAME_VALIDATOR,
+    LocalSecretClient,
+    SecretNameValidator,
+    clear_cache,
+    get_client,
+    get_secret_by_name,
+    prefetch,
+    warm,
+)
+
+
+@pytest.fixture(autouse=True)
+def clear_secrets_cache():
+    clear_cache()
+    yield
+    clear_cache()
 
 
 @pytest.fixture(autouse=True)
@@ -155,3 +172,203 @@ def test_get_secret_by_name__local__returns_environment_variable(mocker, setting
     client.get_secret.assert_not_called()
     env_spy.assert_called_once_with(env_secret_name)
     assert actual_value == expected_secret_value
+
+
+@pytest.fixture
+def mock_SecretClient(mocker, settings, secret_value):
+    settings.RUNTIME_ENVIRONMENT = lambda: "dev"
+    client_cls = mocker.patch("benefits.secrets.SecretClient")
+    client_cls.return_value.get_secret.return_value = mocker.Mock(value=secret_value)
+    return client_cls
+
+
+@pytest.fixture
+def mock_monotonic(mocker):
+    return mocker.patch("benefits.secrets.time.monotonic", return_value=1000.0)
+
+
+def test_get_client__shared(mock_DefaultAzureCredential, mock_SecretClient):
+    url = KEY_VAULT_URL.format(env="d")
+
+    assert get_client(url) is get_client(url)
+    mock_DefaultAzureCredential.assert_called_once()
+    mock_SecretClient.assert_called_once()
+
+
+def test_get_secret_by_name__cached(mock_SecretClient, secret_name, secret_value):
+    client = mock_SecretClient.return_value
+
+    assert get_secret_by_name(secret_name) == secret_value
+    assert get_secret_by_name(secret_name) == secret_value
+
+    client.get_secret.assert_called_once_with(secret_name)
+
+
+def test_get_secret_by_name__with_client__not_cached(mocker, mock_SecretClient, secret_name, secret_value):
+    client = mocker.Mock()
+    client.get_secret.return_value = mocker.Mock(value=secret_value)
+
+    get_secret_by_name(secret_name, client)
+    get_secret_by_name(secret_name, client)
+
+    assert client.get_secret.call_count == 2
+
+
+def test_get_secret_by_name__None_not_cached(mock_SecretClient, secret_name):
+    client = mock_SecretClient.return_value
+    client.get_secret.side_effect = ResourceNotFoundError
+
+    assert get_secret_by_name(secret_name) is None
+    assert get_secret_by_name(secret_name) is None
+
+    assert client.get_secret.call_count == 2
+
+
+def test_get_secret_by_name__expired(mocker, settings, mock_SecretClient, mock_monotonic, secret_name):
+    settings.SECRETS_CACHE_STALE_TTL = 60
+    client = mock_SecretClient.return_value
+
+    get_secret_by_name(secret_name, ttl=10)
+    client.get_secret.return_value = mocker.Mock(value="new value")
+    mock_monotonic.return_value += 71
+
+    assert get_secret_by_name(secret_name) == "new value"
+    assert client.get_secret.call_count == 2
+
+
+def test_get_secret_by_name__stale__refreshed_in_background(
+    mocker, settings, mock_SecretClient, mock_monotonic, secret_name, secret_value
+):
+    settings.SECRETS_CACHE_STALE_TTL = 60
+    client = mock_SecretClient.return_value
+    thread_cls = mocker.patch("benefits.secrets.threading.Thread")
+
+    get_secret_by_name(secret_name, ttl=10)
+    client.get_secret.return_value = mocker.Mock(value="new value")
+    mock_monotonic.return_value += 11
+
+    # the stale value is returned while a single refresh is started
+    assert get_secret_by_name(secret_name) == secret_value
+    assert get_secret_by_name(secret_name) == secret_value
+    thread_cls.assert_called_once()
+    thread_cls.return_value.start.assert_called_once()
+    client.get_secret.assert_called_once()
+
+    # run the refresh
+    kwargs = thread_cls.call_args.kwargs
+    kwargs["target"](*kwargs["args"])
+
+    assert get_secret_by_name(secret_name) == "new value"
+    assert client.get_secret.call_count == 2
+
+
+def test_get_secret_by_name__stale__refresh_failed(
+    mocker, settings, mock_SecretClient, mock_monotonic, secret_name, secret_value
+):
+    settings.SECRETS_CACHE_STALE_TTL = 60
+    client = mock_SecretClient.return_value
+    thread_cls = mocker.patch("benefits.secrets.threading.Thread")
+
+    get_secret_by_name(secret_name, ttl=10)
+    client.get_secret.side_effect = ClientAuthenticationError
+    mock_monotonic.return_value += 11
+
+    get_secret_by_name(secret_name)
+    kwargs = thread_cls.call_args.kwargs
+    kwargs["target"](*kwargs["args"])
+
+    # the stale value is still used, and the next read tries again
+    assert get_secret_by_name(secret_name) == secret_value
+    assert thread_cls.call_count == 2
+
+
+def test_LocalSecretClient():
+    client = LocalSecretClient({"the_secret_name": "the\\nsecret"})
+
+    assert client.get_secret("the-secret-name").value == "the\nsecret"
+
+    with pytest.raises(ResourceNotFoundError):
+        client.get_secret("missing")
+
+
+def test_get_secret_by_name__local__missing(settings, mocker, secret_name):
+    settings.RUNTIME_ENVIRONMENT = lambda: "local"
+    mocker.patch("benefits.secrets.os.environ.get", return_value=None)
+
+    assert get_secret_by_name(secret_name) is None
+
+
+def test_prefetch(mock_SecretClient, secret_value):
+    client = mock_SecretClient.return_value
+
+    prefetch(["secret-1", "secret-2"])
+
+    assert client.get_secret.call_count == 2
+    assert get_secret_by_name("secret-1") == secret_value
+    assert get_secret_by_name("secret-2") == secret_value
+    assert client.get_secret.call_count == 2
+
+
+def test_prefetch__error(mocker, mock_SecretClient, secret_value):
+    client = mock_SecretClient.return_value
+    client.get_secret.side_effect = [Exception, mocker.Mock(value=secret_value)]
+
+    prefetch(["secret-1", "secret-2"])
+
+    assert get_secret_by_name("secret-2") == secret_value
+    assert client.get_secret.call_count == 2
+
+
+def test_prefetch__local(settings, mocker):
+    settings.RUNTIME_ENVIRONMENT = lambda: "local"
+    client_cls = mocker.patch("benefits.secrets.SecretClient")
+    env_spy = mocker.patch("benefits.secrets.os.environ.get")
+
+    prefetch(["secret-1"])
+
+    client_cls.assert_not_called()
+    env_spy.assert_not_called()
+
+
+def test_warm(mock_SecretClient):
+    assert not warm()
+
+    prefetch(["secret-1"])
+
+    assert warm()
+
+
+def test_warm__local(settings):
+    settings.RUNTIME_ENVIRONMENT = lambda: "local"
+
+    assert warm()
+
+
+def test_get_secret_by_name__metrics(mocker, settings, secret_name, secret_value):
+    settings.RUNTIME_ENVIRONMENT = lambda: "dev"
+    observe_outbound = mocker.patch("benefits.secrets.metrics.observe_outbound")
+    client = mocker.Mock()
+    client.get_secret.return_value = mocker.Mock(value=secret_value)
+
+    get_secret_by_name(secret_name, client)
+
+    observe_outbound.assert_called_once_with("key_vault", mocker.ANY, "ok")
+
+
+def test_get_secret_by_name__metrics_not_found(mocker, settings, secret_name):
+    settings.RUNTIME_ENVIRONMENT = lambda: "dev"
+    observe_outbound = mocker.patch("benefits.secrets.metrics.observe_outbound")
+    client = mocker.Mock()
+    client.get_secret.side_effect = ResourceNotFoundError
+
+    get_secret_by_name(secret_name, client)
+
+    observe_outbound.assert_called_once_with("key_vault", mocker.ANY, "not_found")
+
+
+def test_get_secret_by_name__metrics_local(mocker, secret_name):
+    observe_outbound = mocker.patch("benefits.secrets.metrics.observe_outbound")
+
+    get_secret_by_name(secret_name, LocalSecretClient({secret_name.replace("-", "_"): "value"}))
+
+    observe_outbound.assert_not_called()